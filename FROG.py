@@ -1,17 +1,15 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import streamlit as st
+import json
+import os
 from io import BytesIO
-import pandas as pd
 
-# ========== Données Cristaux SHG ==========
-CRYSTALS = {
-    "BBO": {"deff": 2.0, "phase_matching_angle": 22.9},
-    "KDP": {"deff": 0.4, "phase_matching_angle": 47.7},
-    "LiNbO3": {"deff": 27.0, "phase_matching_angle": 36.0},
-    "KTP": {"deff": 3.4, "phase_matching_angle": 0.0},
-    "Autre": {"deff": None, "phase_matching_angle": 0.0},
-}
+from frog import (CRYSTALS, EXPORT_FORMATS, PRECISIONS, SELLMEIER, Crystal, Dispersion, Instrumentation, TraceCache,
+                  apply_dispersion, compute_trace, export_trace, phase_matching_angle, plan_grid, propagate_shg, show_trace,
+                  unfold_trace)
+from frog.pulse import omega0
+from frog.render import decimate_curve
 
 # ========== Fonctions physiques ==========
 def gaussian_pulse(t, tau, delay=0):
@@ -27,23 +25,204 @@ def apply_filter(E_freq, freqs, filter_type, cutoff):
         E_freq[np.abs(freqs) < cutoff] = 0
     return E_freq
 
-def apply_shg_crystal(E_t, deff, length_mm):
-    L = length_mm * 1e-3  # mm to meters
-    E_shg = deff * E_t**2 * L
-    return E_t + E_shg
+def equivalent_chirp(tau, chirp):
+    """(FWHM transformée-limitée, φ″) du champ exp(-t²/2τ² + i·chirp·t²)."""
+    gamma = abs(1 / (2 * tau**2) - 1j * chirp)
+    sigma = 1 / (2 * tau * gamma)
+    return sigma * 2 * np.sqrt(2 * np.log(2)), chirp / (2 * gamma**2)
 
 def export_fig_to_png(fig):
-    buf = BytesIO()
-    fig.savefig(buf, format="png")
-    buf.seek(0)
-    return buf
-
-def export_array_to_csv(array, name_x="x", name_y="y", xvals=None):
-    if xvals is None:
-        xvals = np.arange(array.shape[1])
-    df = pd.DataFrame(array, columns=[f"{name_y}_{i}" for i in range(array.shape[1])])
-    df.insert(0, name_x, xvals)
-    return df.to_csv(index=False).encode()
+    with perf.stage("PNG (export_fig_to_png)"):
+        buf = BytesIO()
+        fig.savefig(buf, format="png")
+        buf.seek(0)
+        return buf
+
+# ========== Étapes de calcul (mises en cache) ==========
+# Chaque étape ne dépend que de ses paramètres et appelle l'étape amont, elle-même
+# en cache : un changement de widget ne recalcule que les étapes situées en aval.
+# Paramètres groupés : grid = (N, t_max, précision), pulse = (type, tau, décalage, chirp),
+# filt = (type, coupure), disp = (φ″, φ‴, φ⁗, matériaux),
+# crystal = (actif, type, d_eff, longueur, intensité crête en GW/cm²).
+N_MAX = 2048
+CACHE_BUDGET_MB = 512  # budget mémoire par étage N×N (trace, figures)
+TRACE_CACHE_ENTRIES = max(1, CACHE_BUDGET_MB * 2**20 // (8 * N_MAX**2))
+FIELD_CACHE_ENTRIES = 64
+
+# Cache disque partagé entre sessions et redémarrages du serveur
+DISK_CACHE_DIR = os.environ.get("FROG_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "frog"))
+DISK_CACHE_MB = int(os.environ.get("FROG_CACHE_MB", 2048))
+
+
+@st.cache_resource
+def disk_cache():
+    return TraceCache(DISK_CACHE_DIR, DISK_CACHE_MB * 2**20)
+
+
+@st.cache_data(max_entries=FIELD_CACHE_ENTRIES)
+def auto_grid(pulse, filt, disp, crystal, method):
+    """Plus petite grille adaptée (plan_grid), en bande de base comme les champs de FROG.py."""
+    with perf.stage("Grille automatique"):
+        _, tau, offset, chirp = pulse
+        filter_type, cutoff = filt
+        signal = {"SHG-FROG": "SHG", "PG-FROG": "PG", "XFROG": "XFROG"}[method]
+        materials = disp[3]
+        use_crystal, crystal_type, _, length, _ = crystal
+        if use_crystal and crystal_type in SELLMEIER:
+            # Dispersion du fondamental dans le cristal (la déplétion ne l'élargit pas)
+            materials += ((crystal_type, length),)
+        FWHM_t, phi2 = equivalent_chirp(tau, chirp)
+        options = dict(phi2=phi2 + disp[0], phi3=disp[1], phi4=disp[2], materials=materials, signal=signal, gate_FWHM_t=tau * np.sqrt(2 * np.log(2)), offset=offset,
+                       cutoff=2 * np.pi * cutoff if filter_type == "Passe-bas" else None, baseband=True)
+        # Trace circulaire : tous les retards de la fenêtre, trace non nulle sur ±2 × l'impulsion
+        extent = plan_grid(FWHM_t, **options).pulse_extent
+        return plan_grid(FWHM_t, max_delay=extent, **options)
+
+@st.cache_resource(max_entries=FIELD_CACHE_ENTRIES)
+def grid_stage(N, t_max, precision):
+    # Axes toujours en float64 : seule la chaîne des champs suit la précision
+    t = np.linspace(-t_max / 2, t_max / 2, N)
+    dt = t[1] - t[0]
+    freqs = np.fft.fftshift(np.fft.fftfreq(N, d=dt))
+    t.setflags(write=False)
+    freqs.setflags(write=False)
+    return t, freqs
+
+@st.cache_data(max_entries=FIELD_CACHE_ENTRIES)
+def pulse_stage(grid, pulse):
+    t, _ = grid_stage(*grid)
+    pulse_type, tau, delay, chirp = pulse
+    if pulse_type == "Gaussienne":
+        E_t = gaussian_pulse(t, tau, delay)
+    else:
+        E_t = chirped_pulse(t, tau, chirp, delay)
+    # Toute la chaîne en aval suit le type du champ (complex64 en simple précision)
+    return E_t.astype(PRECISIONS[grid[2]][1])
+
+@st.cache_data(max_entries=FIELD_CACHE_ENTRIES)
+def filter_stage(grid, pulse, filt):
+    with perf.stage("Filtrage FFT"):
+        _, freqs = grid_stage(*grid)
+        filter_type, cutoff = filt
+        E_t = pulse_stage(grid, pulse)
+        E_freq = np.fft.fftshift(np.fft.fft(E_t))
+        if filter_type != "Aucun":
+            E_freq = apply_filter(E_freq, freqs, filter_type, cutoff)
+        return np.fft.ifft(np.fft.ifftshift(E_freq)).astype(E_t.dtype), E_freq.astype(E_t.dtype)
+
+@st.cache_data(max_entries=FIELD_CACHE_ENTRIES)
+def dispersion_stage(grid, pulse, filt, disp):
+    with perf.stage("Dispersion"):
+        # Champs de FROG.py = enveloppes autour de la porteuse à 800 nm (ω₀) ; noyau spectral en cache
+        t, _ = grid_stage(*grid)
+        E_t, _ = filter_stage(grid, pulse, filt)
+        dispersion = Dispersion(*disp)
+        if dispersion.is_zero():
+            return E_t
+        return apply_dispersion(E_t, t, dispersion, baseband=True)
+
+@st.cache_data(max_entries=FIELD_CACHE_ENTRIES)
+def crystal_stage(grid, pulse, filt, disp, crystal):
+    """(fondamental, SH ou None, rendement) en sortie de cristal : propagation split-step couplée."""
+    with perf.stage("Cristal (split-step)"):
+        t, _ = grid_stage(*grid)
+        E_t = dispersion_stage(grid, pulse, filt, disp)
+        use_crystal, crystal_type, coeff, length, intensity = crystal
+        if not use_crystal:
+            return E_t, None, 0.0
+        result = propagate_shg(E_t, t, Crystal.from_table(crystal_type, length, coeff), intensity)
+        # Champs rendus dans la précision de E_t (complex64 en simple précision)
+        return result.fundamental, result.second_harmonic, result.efficiency
+
+@st.cache_resource(max_entries=TRACE_CACHE_ENTRIES)
+def trace_stage(grid, pulse, filt, disp, crystal, method):
+    def compute():
+        t, _ = grid_stage(*grid)
+        E_t, _, _ = crystal_stage(grid, pulse, filt, disp, crystal)
+        with perf.stage(f"Calcul {method}"):
+            if method == "SHG-FROG":
+                # Trace paire en retard : seule la demi-trace τ ≥ 0 est calculée et stockée
+                return {"half": compute_trace(E_t, method, workers=-1, precision=grid[2], half=True)}
+            # Gate de référence pour XFROG
+            reference_pulse = gaussian_pulse(t, pulse[1] / 2)
+            return {"trace": compute_trace(E_t, method, reference_pulse, workers=-1, precision=grid[2])}
+
+    params = {"grid": grid, "pulse": pulse, "filt": filt, "disp": disp, "crystal": crystal, "method": method}
+    with perf.stage("Trace (cache disque)"):
+        arrays = disk_cache().get_or_compute(params, compute)
+        if "half" in arrays:
+            return unfold_trace(arrays["half"], grid[0], axis=1, circular=True)
+        return arrays["trace"]
+
+@st.cache_data(max_entries=FIELD_CACHE_ENTRIES)
+def pulse_figure(grid, pulse, filt, disp, crystal, show_phase):
+    with perf.stage("Figure impulsion"):
+        t, freqs = grid_stage(*grid)
+        E_freq = np.fft.fftshift(np.fft.fft(dispersion_stage(grid, pulse, filt, disp)))
+        E_t, E_sh, efficiency = crystal_stage(grid, pulse, filt, disp, crystal)
+
+        fig1, ax = plt.subplots(2, 2, figsize=(10, 6))
+        # Courbes réduites à la largeur de l'axe en pixels (enveloppe min/max)
+        width = int(ax[0, 0].get_window_extent().width)
+        ax[0, 0].plot(*decimate_curve(t, np.abs(E_t)**2, width), label="Intensité", color='blue')
+        ax[0, 0].set_title("Intensité temporelle")
+        if show_phase:
+            ax[0, 0].twinx().plot(*decimate_curve(t, np.angle(E_t), width), label="Phase", color='red', linestyle='dotted')
+
+        ax[0, 1].plot(*decimate_curve(freqs, np.abs(E_freq)**2, width), label="Spectre", color='green')
+        ax[0, 1].set_title("Spectre")
+        if show_phase:
+            ax[0, 1].twinx().plot(*decimate_curve(freqs, np.angle(E_freq), width), label="Phase", color='purple', linestyle='dotted')
+
+        if E_sh is None:
+            ax[1, 0].axis("off")
+            ax[1, 1].axis("off")
+        else:
+            # Second harmonique (intensités relatives au fondamental d'entrée, référentiel du fondamental)
+            ax[1, 0].plot(*decimate_curve(t, np.abs(E_t)**2, width), label="Fondamental", color='blue')
+            ax[1, 0].plot(*decimate_curve(t, np.abs(E_sh)**2, width), label="SH", color='darkviolet')
+            ax[1, 0].set_title(f"Sortie du cristal (rendement {100 * efficiency:.3g} %)")
+            ax[1, 0].legend(loc="upper right")
+            E_sh_freq = np.fft.fftshift(np.fft.fft(E_sh))
+            ax[1, 1].plot(*decimate_curve(freqs, np.abs(E_sh_freq)**2, width), color='darkviolet')
+            ax[1, 1].set_title("Spectre SH (autour de 2ω₀)")
+            # Acceptance du cristal : SH à 2ω₀ + 2πf ← fondamental à ω₀ + πf (lecture de table)
+            use_crystal, crystal_type, coeff, length, _ = crystal
+            acceptance = Crystal.from_table(crystal_type, length, coeff).efficiency(omega0 + np.pi * freqs)
+            ax[1, 1].twinx().plot(*decimate_curve(freqs, acceptance, width), label="Accord de phase", color='gray', linestyle='dashed')
+        png = export_fig_to_png(fig1).getvalue()
+        plt.close(fig1)
+        return png
+
+@st.cache_data(max_entries=TRACE_CACHE_ENTRIES)
+def trace_figure(grid, pulse, filt, disp, crystal, method, view=None):
+    with perf.stage("Figure trace"):
+        t, freqs = grid_stage(*grid)
+        frog_trace = trace_stage(grid, pulse, filt, disp, crystal, method)
+
+        # Image réduite à la taille de l'axe en pixels ; la zone zoomée `view` =
+        # ((retard min, max), (fréquence min, max)) est relue depuis la trace stockée
+        fig2, ax2 = plt.subplots(figsize=(6, 5))
+        trace_view = show_trace(ax2, t, freqs, frog_trace.T, cmap='inferno')
+        ax2.set_xlabel("Retard (fs)")
+        ax2.set_ylabel("Fréquence (a.u.)")
+        ax2.set_title(f"{method} Trace")
+        fig2.colorbar(trace_view.image, ax=ax2, label="Intensité")
+        if view is not None:
+            ax2.set_xlim(*view[0])
+            ax2.set_ylim(*view[1])
+        trace_view.update()
+        png = export_fig_to_png(fig2).getvalue()
+        plt.close(fig2)
+        return png
+
+def trace_export(fmt, grid, pulse, filt, disp, crystal, method, attrs):
+    # Pas de cache ni de mesure : appelé au clic sur le bouton de téléchargement, après la fin de
+    # l'exécution (perf déjà clos, ses étapes n'enregistrent plus rien)
+    t, freqs = grid_stage(*grid)
+    trace = trace_stage(grid, pulse, filt, disp, crystal, method)
+    # freqs : fréquences cycliques (fftfreq), pas des pulsations
+    return export_trace(fmt, trace.T, t, freqs, attrs, axis_name="freq", axis_unit="1/fs")
 
 # ========== Interface Streamlit ==========
 st.set_page_config(layout="wide")
@@ -55,8 +234,9 @@ with st.sidebar:
     method = st.selectbox("Méthode FROG", ["SHG-FROG", "PG-FROG", "XFROG"])
 
     st.header("⚙️ Impulsion")
-    N = st.slider("Échantillons (N)", 256, 2048, 512, step=128)
-    t_max = st.slider("Fenêtre temporelle (fs)", 50, 2000, 180)
+    auto = st.checkbox("Grille automatique", help="N et fenêtre minimaux pour l'impulsion, le filtre et la méthode choisis")
+    N = st.slider("Échantillons (N)", 256, N_MAX, 512, step=128, disabled=auto)
+    t_max = st.slider("Fenêtre temporelle (fs)", 50, 2000, 180, disabled=auto)
     tau = st.slider("Durée d’impulsion (tau)", 1.0, 100.0, 20.0)
     delay = st.slider("Décalage (fs)", -100.0, 100.0, 0.0)
     pulse_type = st.selectbox("Forme", ["Gaussienne", "Chirpée"])
@@ -67,6 +247,13 @@ with st.sidebar:
     filter_type = st.selectbox("Filtrage Spectral", ["Aucun", "Passe-bas", "Passe-haut"])
     cutoff = st.slider("Coupure (a.u.)", 0.01, 0.5, 0.2)
 
+    st.header("🌈 Dispersion")
+    phi2 = st.slider("φ″ (fs²)", -2000.0, 2000.0, 0.0, step=10.0)
+    phi3 = st.slider("φ‴ (fs³)", -20000.0, 20000.0, 0.0, step=100.0)
+    phi4 = st.slider("φ⁗ (fs⁴)", -200000.0, 200000.0, 0.0, step=1000.0)
+    glass = st.selectbox("Verre", ["Aucun", "SiO2", "BK7"])
+    glass_length = st.slider("Épaisseur de verre (mm)", 0.0, 50.0, 5.0) if glass != "Aucun" else 0.0
+
     st.header("🧪 Cristal SHG")
     use_crystal = st.checkbox("Activer un cristal non-linéaire")
     crystal_type = st.selectbox("Type de cristal", list(CRYSTALS.keys())) if use_crystal else ""
@@ -76,94 +263,101 @@ with st.sidebar:
         else:
             coeff = CRYSTALS[crystal_type]["deff"]
         length = st.slider("Longueur cristal (mm)", 0.1, 5.0, 1.0)
+        intensity = st.slider("Intensité crête (GW/cm²)", 0.1, 200.0, 50.0)
         st.markdown(f"**d_eff** = {coeff} pm/V")
-        st.markdown(f"**Angle de phase matching** ≈ {CRYSTALS[crystal_type]['phase_matching_angle']}°")
+        if crystal_type in SELLMEIER:
+            angle = phase_matching_angle(crystal_type)
+            st.markdown(f"**Angle de phase matching** ≈ {angle:.1f}° (Sellmeier, 800 nm)" if angle is not None else
+                        f"**Angle de phase matching** : aucun en type I à 800 nm, angle du tableau {CRYSTALS[crystal_type]['phase_matching_angle']}°")
     else:
         length = 0.0
         coeff = 0.0
+        intensity = 0.0
 
     st.header("🧿 Options d'affichage")
     show_phase = st.checkbox("Afficher la phase temporelle/spectrale")
 
-# ==== Grille temporelle ====
-t = np.linspace(-t_max / 2, t_max / 2, N)
-dt = t[1] - t[0]
-freqs = np.fft.fftshift(np.fft.fftfreq(N, d=dt))
-
-# ==== Génération impulsion ====
-if pulse_type == "Gaussienne":
-    E_t = gaussian_pulse(t, tau, delay + delay_add)
-else:
-    E_t = chirped_pulse(t, tau, chirp, delay + delay_add)
-
-# ==== Filtrage Spectral ====
-E_freq = np.fft.fftshift(np.fft.fft(E_t))
-if filter_type != "Aucun":
-    E_freq = apply_filter(E_freq, freqs, filter_type, cutoff)
-E_t = np.fft.ifft(np.fft.ifftshift(E_freq))
-
-# ==== Cristal SHG ====
-if use_crystal:
-    E_t = apply_shg_crystal(E_t, coeff, length)
-
-# ==== Génération de la gate pour XFROG ====
-reference_pulse = gaussian_pulse(t, tau / 2)
-
-# ==== Calcul FROG ====
-frog_trace = np.zeros((N, N))
-for i, delay_val in enumerate(t):
-    shift = i - N // 2
-    if method == "PG-FROG":
-        gate = np.roll(np.abs(E_t)**2, shift)
-    elif method == "SHG-FROG":
-        gate = np.roll(E_t, shift)
-    elif method == "XFROG":
-        gate = np.roll(reference_pulse, shift)
-    signal = E_t * gate
-    spectrum = np.fft.fftshift(np.fft.fft(signal))
-    frog_trace[:, i] = np.abs(spectrum)**2
-
-# ========== AFFICHAGE ========== 
-col1, col2 = st.columns(2)
-
-# --- Affichage temporel & spectral ---
-with col1:
-    st.subheader("🕒 Impulsion et Spectre")
-    fig1, ax = plt.subplots(2, 2, figsize=(10, 6))
-    ax[0, 0].plot(t, np.abs(E_t)**2, label="Intensité", color='blue')
-    ax[0, 0].set_title("Intensité temporelle")
-    if show_phase:
-        ax[0, 0].twinx().plot(t, np.angle(E_t), label="Phase", color='red', linestyle='dotted')
-
-    ax[0, 1].plot(freqs, np.abs(E_freq)**2, label="Spectre", color='green')
-    ax[0, 1].set_title("Spectre")
-    if show_phase:
-        ax[0, 1].twinx().plot(freqs, np.angle(E_freq), label="Phase", color='purple', linestyle='dotted')
-
-    ax[1, 0].axis("off")
-    ax[1, 1].axis("off")
-    st.pyplot(fig1)
-
-# --- Affichage trace FROG ---
-with col2:
-    st.subheader(f"📊 Trace {method}")
-    fig2, ax2 = plt.subplots(figsize=(6, 5))
-    extent = [t[0], t[-1], freqs[0], freqs[-1]]
-    im = ax2.imshow(frog_trace, extent=extent, origin='lower', aspect='auto', cmap='inferno')
-    ax2.set_xlabel("Retard (fs)")
-    ax2.set_ylabel("Fréquence (a.u.)")
-    ax2.set_title(f"{method} Trace")
-    fig2.colorbar(im, ax=ax2, label="Intensité")
-    st.pyplot(fig2)
-
-    png_buf = export_fig_to_png(fig2)
-    st.download_button("📥 Télécharger l’image", data=png_buf, file_name=f"{method.lower()}_trace.png", mime="image/png")
-    st.download_button("⬇️ Exporter données XFROG", data=export_array_to_csv(frog_trace, "Temps", "Intensité", t), file_name=f"{method.lower()}_data.csv", mime="text/csv")
-
-
-
-
-
-
-
-
+    st.header("🧮 Calcul")
+    precision = st.radio("Précision", list(PRECISIONS), format_func={"double": "Double (float64)", "single": "Simple (float32)"}.get,
+                         help="Simple précision : mémoire et temps de calcul divisés par ~2, écart relatif < 1e-4 sur la trace")
+
+    perf_panel = st.expander("⏱️ Performances")
+    with perf_panel:
+        perf_memory = st.checkbox("Mémoire de pointe (tracemalloc)", help="Ralentit les étapes très allocatrices")
+        perf_profile = st.checkbox("Profil cProfile de l'étape externe")
+        perf_log = st.text_input("Journal JSONL", os.environ.get("FROG_PERF_LOG", ""),
+                                 help="Fichier auquel ajouter une ligne par exécution ; vide = pas de journal")
+
+# Mesures de cette exécution : seules les étapes recalculées (hors cache) apparaissent en détail
+perf = Instrumentation(memory=perf_memory, profile=perf_profile)
+# Fermée même si l'exécution est interrompue (rerun Streamlit, erreur) : sinon tracemalloc resterait actif
+try:
+    # ==== Paramètres de chaque étape ====
+    pulse = (pulse_type, tau, delay + delay_add, chirp)
+    filt = (filter_type, cutoff)
+    crystal = (use_crystal, crystal_type, coeff, length, intensity)
+    # Dispersion des verres traversés (Sellmeier) ; celle du cristal est dans sa propagation
+    materials = ((glass, glass_length),) if glass != "Aucun" else ()
+    disp = (phi2, phi3, phi4, materials)
+    if auto:
+        with perf.stage("Planification"):
+            plan = auto_grid(pulse, filt, disp, crystal, method)
+        # Fenêtre de FROG.py = largeur totale ; N d'au moins 256 points pour l'affichage,
+        # borné par la mémoire de la trace N×N
+        N, t_max = int(np.clip(plan.Nt, 256, N_MAX)), 2 * plan.t_max
+        st.sidebar.caption(str(plan) + (f" — N limité à {N_MAX}" if plan.Nt > N_MAX else ""))
+    grid = (N, t_max, precision)
+
+    # ========== AFFICHAGE ==========
+    col1, col2 = st.columns(2)
+
+    # --- Affichage temporel & spectral ---
+    with col1:
+        st.subheader("🕒 Impulsion et Spectre")
+        with perf.stage("Affichage impulsion"):
+            st.image(pulse_figure(grid, pulse, filt, disp, crystal, show_phase))
+
+    # --- Affichage trace FROG ---
+    with col2:
+        st.subheader(f"📊 Trace {method}")
+        t_axis, freq_axis = grid_stage(*grid)
+        with st.expander("🔍 Zoom"):
+            delay_view = st.slider("Retards (fs)", float(t_axis[0]), float(t_axis[-1]), (float(t_axis[0]), float(t_axis[-1])))
+            freq_view = st.slider("Fréquences (a.u.)", float(freq_axis[0]), float(freq_axis[-1]), (float(freq_axis[0]), float(freq_axis[-1])))
+        full_view = delay_view == (t_axis[0], t_axis[-1]) and freq_view == (freq_axis[0], freq_axis[-1])
+        with perf.stage("Affichage trace"):
+            png = trace_figure(grid, pulse, filt, disp, crystal, method, None if full_view else (delay_view, freq_view))
+            st.image(png)
+
+        st.download_button("📥 Télécharger l’image", data=png, file_name=f"{method.lower()}_trace.png", mime="image/png")
+        export_format = st.selectbox("Format des données", list(EXPORT_FORMATS),
+                                     format_func={"npz": "NumPy .npz (compressé)", "hdf5": "HDF5 (axes et métadonnées)", "frg": "Texte .frg"}.get)
+        attrs = {"method": method, "phi2": phi2, "phi3": phi3, "phi4": phi4, "materials": json.dumps(materials), "N": N, "t_max": t_max, "precision": precision,
+                 "pulse_type": pulse_type, "tau": tau, "delay": delay + delay_add, "chirp": chirp,
+                 "filter_type": filter_type, "cutoff": cutoff,
+                 "crystal": crystal_type if use_crystal else "", "deff_pm_per_V": coeff, "crystal_length_mm": length,
+                 "peak_intensity_GW_per_cm2": intensity}
+        extension, mime = EXPORT_FORMATS[export_format]
+        # Données générées seulement au clic (callable), par blocs de retards
+        st.download_button("⬇️ Exporter la trace", data=lambda: trace_export(export_format, grid, pulse, filt, disp, crystal, method, attrs),
+                           file_name=f"{method.lower()}_data{extension}", mime=mime, on_click="ignore")
+
+    stats = disk_cache().stats()
+    st.sidebar.caption(f"Cache disque : {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} évictions")
+
+    with perf_panel:
+        rows = []
+        for r in perf.summary():
+            row = {"Étape": "\u2003" * r["depth"] + r["stage"], "Temps (ms)": round(r["wall_ms"], 1)}
+            if perf_memory:
+                row["Pic mémoire (Mo)"] = round(r["peak_mb"], 2)
+            rows.append(row)
+        st.dataframe(rows, hide_index=True)
+        for record in perf.records:
+            if record.profile:
+                st.caption(f"cProfile — {record.name}")
+                st.code(record.profile, language=None)
+    if perf_log:
+        perf.write_jsonl(perf_log, {"method": method, "grid": grid, "pulse": pulse, "filt": filt, "disp": disp, "crystal": crystal})
+finally:
+    perf.close()
@@ -1,56 +1,23 @@
-import numpy as np
 import matplotlib.pyplot as plt
-from scipy.fft import fft, fftshift, fftfreq
-from scipy.interpolate import interp1d
 
-# Constantes
-c =299.792458  # nm/fs
-lambda0 = 800  # nm
-nu0 = c / lambda0  # THz
-omega0 = 2 * np.pi * nu0  # rad/fs ≈ 2π × 374.74 ≈ 2354 rad/fs
-
-# Largeur temporelle de l'impulsion
-FWHM_t = 10  # fs
-tau = FWHM_t / (2 * np.sqrt(2 * np.log(2)))  # sigma temporel
-
-# Grille temporelle
-Nt = 2048
-t_max = 200  # fs
-t = np.linspace(-t_max, t_max, Nt)
-dt = t[1] - t[0]
-
-# Impulsion gaussienne transformée-limitée
-E = np.exp(-t**2 / (2 * tau**2)) * np.exp(1j * omega0 * t)
-
-# Retards centrés sur ±75 fs
-delays = np.linspace(-75, 75, 200)
-frog_trace = np.zeros((len(delays), Nt))
-
-def delay_field(E, delay):
-    interp_re = interp1d(t, E.real, kind='linear', bounds_error=False, fill_value=0.0)
-    interp_im = interp1d(t, E.imag, kind='linear', bounds_error=False, fill_value=0.0)
-    return interp_re(t - delay) + 1j * interp_im(t - delay)
-
-# Calcul de la trace FROG SHG
-for i, tau_delay in enumerate(delays):
-    E_delayed = delay_field(E, tau_delay)
-    signal = E * np.abs(E_delayed)**2
-    spectrum = np.abs(fftshift(fft(signal)))**2
-    frog_trace[i, :] = spectrum
-
-# Axe des fréquences angulaires (rad/fs)
-omega = fftshift(2 * np.pi * fftfreq(Nt, d=dt))
-
-# Plage utile centrée sur 2ω₀
-omega_min = 1 # rad/fs
-omega_max = 4  # rad/fs
-mask_omega = (omega >= omega_min) & (omega <= omega_max)
-omega_crop = omega[mask_omega]
-frog_crop = frog_trace[:, mask_omega]
+from frog import Scenario, compute_scenario, plan_scenario, show_trace
+
+# Impulsion gaussienne transformée-limitée FWHM 10 fs, trace PG-FROG
+# Grille (Nt, t_max) choisie par plan_scenario d'après l'impulsion et les retards
+scenario, plan = plan_scenario(Scenario(
+    name="Frog3",
+    signal="PG",
+    FWHM_t=10,  # fs
+    baseband=True,  # enveloppe sans porteuse, ω₀ rajouté sur l'axe
+    delays=(-75, 75, 200),
+    omega_window=(1, 4),  # rad/fs
+))
+print(plan)
+delays, omega_crop, frog_crop = compute_scenario(scenario)
 
 # Affichage
 plt.figure(figsize=(3, 3))  # pour correspondre à un format carré
-plt.pcolormesh(delays, omega_crop, frog_crop.T, shading='auto', cmap='jet')
+show_trace(plt.gca(), delays, omega_crop, frog_crop, cmap='jet')  # image réduite à la taille de l'axe, détaillée au zoom
 plt.xlabel(r'$\tau$ [fs]')
 plt.ylabel(r'$\omega$ [rad/fs]')
 plt.xlim(-75, 75)
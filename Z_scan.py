@@ -3,21 +3,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
-# Fonction de transmission Z-scan
-def compute_transmission(z, w0, zR, n2, I0, open_aperture=False, beta=0):
-    wz = w0 * np.sqrt(1 + (z / zR)**2)
-    Iz = I0 / wz**2
-    if open_aperture:
-        return 1 - beta * Iz  # absorption non linéaire (ex: Z-scan ouvert)
-    else:
-        return 1 - n2 * Iz * (z / zR) / (1 + (z / zR)**2)  # effet Kerr (Z-scan fermé)
-
-# Profil gaussien 3D
-def gaussian_beam_profile(w0, zR, z_range, r_range):
-    Z, R = np.meshgrid(z_range, r_range)
-    wz = w0 * np.sqrt(1 + (Z / zR)**2)
-    intensity = np.exp(-2 * (R**2) / wz**2)
-    return Z, R, intensity
+from zscan import compute_transmission, gaussian_beam_profile
 
 # Configuration de la page
 st.set_page_config(layout="wide")
@@ -1,14 +1,18 @@
+import sys
+
+import numpy as np
 import pygame
 import pygame_gui
-import math
+
+from zscan.components import BeamSplitter, Crystal, Diaphragm, Layout, Lens, Photodiode, load_layout
+from zscan.engine import Simulation
+from zscan.optics import BLUE, HEIGHT, RED, WIDTH, Bench
+from zscan.pulses import LENGTH, PALETTE
 
 pygame.init()
 
-WIDTH, HEIGHT = 1200, 600
 FPS = 60
 WHITE = (255, 255, 255)
-RED = (255, 0, 0)
-BLUE = (100, 100, 255)
 BLACK = (0, 0, 0)
 LENS_COLOR = (0, 200, 255)
 CRYSTAL_COLOR = (0, 255, 200)
@@ -17,8 +21,9 @@ PHOTODIODE_COLOR = (255, 255, 0)
 BEAMSPLITTER_COLOR = (0, 255, 0)  # Vert
 
 
-non_linear_strength = 3.0
-shg_threshold = 2.0
+bench = Bench(WIDTH, HEIGHT)
+# Banc décrit par un fichier de composants (python Z_scan_pedagogique.py scenarios/zscan_bench.json), sinon Bench
+layout = load_layout(sys.argv[1]) if len(sys.argv) > 1 else Layout.from_bench(bench)
 
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Simulation Optique avec GUI")
@@ -32,7 +37,7 @@ base_y = HEIGHT - 130
 
 nl_slider = pygame_gui.elements.UIHorizontalSlider(
     pygame.Rect((base_x, base_y), (180, 30)),
-    start_value=non_linear_strength,
+    start_value=bench.non_linear_strength,
     value_range=(0, 10),
     manager=manager
 )
@@ -44,7 +49,7 @@ nl_label = pygame_gui.elements.UILabel(
 
 shg_slider = pygame_gui.elements.UIHorizontalSlider(
     pygame.Rect((base_x + 200, base_y), (180, 30)),
-    start_value=shg_threshold,
+    start_value=bench.shg_threshold,
     value_range=(0.1, 5),
     manager=manager
 )
@@ -95,228 +100,80 @@ transmission_label_top2 = pygame_gui.elements.UILabel(
     manager
 )
 
-# Optique setup
-lens_x, lens_y = WIDTH // 2, HEIGHT // 2
-lens_height = 200
-focal_length = 150
-
-crystal_x = lens_x + 200
-crystal_width = 20
-crystal_y = lens_y
-crystal_height = 100
-
-laser_origin = (100, HEIGHT // 2)
-diaphragm_enabled = False
-diaphragm_aperture = 60
-diaphragm_x = crystal_x + 100
-
-photodiode_bottom_x = diaphragm_x + 30
-photodiode_bottom_y = lens_y
-
-# Photodiode haute sur trajectoire réfléchie par la lame séparatrice principale
-beamsplitter_x = lens_x - 100
-beamsplitter_y = lens_y
-
-photodiode_top_x = beamsplitter_x + 0
-photodiode_top_y = beamsplitter_y - 100
-
-photodiode_radius = 15
-
-# Deuxième lame séparatrice
-beamsplitter2_x = crystal_x + 50
-beamsplitter2_y = lens_y
-
-# Photodiode haute 2 sur trajectoire réfléchie par la deuxième lame séparatrice
-photodiode_top2_x = beamsplitter2_x + 0
-photodiode_top2_y = beamsplitter2_y - 100
-
-class LightPulse:
-    def __init__(self, x, y, angle, color=RED):
-        self.x = x
-        self.y = y
-        self.angle = angle
-        self.color = color
-        self.speed = 5
-        self.length = 10
-        self.passed_lens = False
-        self.passed_crystal = False
-        self.passed_beamsplitter = False
-        self.passed_beamsplitter2 = False
-        self.alive = True
-        self.intensity = max(1.0, 1.0 + abs(y - lens_y) / 50)
-        self.transmitted = False
-        self.detected_by_photodiode_bottom = False
-        self.detected_by_photodiode_top = False
-        self.detected_by_photodiode_top2 = False
-
-    def update(self):
-        if not self.alive:
-            return
-
-        self.x += math.cos(self.angle) * self.speed
-        self.y += math.sin(self.angle) * self.speed
-
-        # Passage lame séparatrice principale
-        if not self.passed_beamsplitter and self.x >= beamsplitter_x:
-            self.passed_beamsplitter = True
-            if abs(self.y - beamsplitter_y) < 5:
-                # Réfléchie vers le haut
-                reflected_pulse = LightPulse(self.x, self.y, -math.pi / 2, self.color)
-                pulses.append(reflected_pulse)
-                # Transmission continue à droite
-
-        # Passage lame séparatrice secondaire
-        if not self.passed_beamsplitter2 and self.x >= beamsplitter2_x:
-            self.passed_beamsplitter2 = True
-            if abs(self.y - beamsplitter2_y) < 5:
-                # Réflexion vers le haut
-                reflected_pulse = LightPulse(self.x, self.y, -math.pi / 2, self.color)
-                pulses.append(reflected_pulse)
-                # Transmission vers le bas continue en angle -pi/2
-                self.angle = -math.pi / 2
-
-        # Passage lentille
-        if not self.passed_lens and self.x >= lens_x:
-            focal_point = (lens_x + focal_length, lens_y)
-            self.angle = math.atan2(focal_point[1] - self.y, focal_point[0] - lens_x)
-            self.passed_lens = True
-
-        # Passage cristal
-        if not self.passed_crystal and crystal_x <= self.x <= crystal_x + crystal_width:
-            angle_change = math.radians(non_linear_strength * self.intensity)
-            self.angle += angle_change
-            if self.intensity > shg_threshold:
-                self.color = BLUE
-            self.passed_crystal = True
-
-        # Passage diaphragme
-        if diaphragm_enabled and self.x >= diaphragm_x:
-            if abs(self.y - lens_y) > diaphragm_aperture // 2:
-                self.alive = False
-
-        # Détection photodiode basse
-        if not self.detected_by_photodiode_bottom and self.x >= photodiode_bottom_x:
-            dist_bottom = math.hypot(self.x - photodiode_bottom_x, self.y - photodiode_bottom_y)
-            if dist_bottom <= photodiode_radius:
-                self.detected_by_photodiode_bottom = True
-
-        # Détection photodiode haute 1 (première lame séparatrice)
-        if not self.detected_by_photodiode_top:
-            dist_top = math.hypot(self.x - photodiode_top_x, self.y - photodiode_top_y)
-            if dist_top <= photodiode_radius and math.isclose(self.angle, -math.pi / 2, abs_tol=0.1):
-                self.detected_by_photodiode_top = True
-
-        # Détection photodiode haute 2 (deuxième lame séparatrice)
-        if not self.detected_by_photodiode_top2:
-            dist_top2 = math.hypot(self.x - photodiode_top2_x, self.y - photodiode_top2_y)
-            if dist_top2 <= photodiode_radius and math.isclose(self.angle, -math.pi / 2, abs_tol=0.1):
-                self.detected_by_photodiode_top2 = True
-
-        if self.x > WIDTH or self.y < 0 or self.y > HEIGHT:
-            self.transmitted = True
-
-    def draw(self, surface):
-        if not self.alive:
-            return
-        end_x = self.x + math.cos(self.angle) * self.length
-        end_y = self.y + math.sin(self.angle) * self.length
-        pygame.draw.line(surface, self.color, (self.x, self.y), (end_x, end_y), 2)
-
-    def is_off_screen(self):
-        return self.x > WIDTH or self.y < 0 or self.y > HEIGHT or not self.alive
-
-pulses = []
-frame_counter = 0
-transmission_history_bottom = []
-transmission_history_top = []
-transmission_history_top2 = []
-
-def emit_pulses():
-    global frame_counter
-    frame_counter += 1
-    if frame_counter % 10 == 0:
-        for i in range(-2, 3):
-            pulses.append(LightPulse(laser_origin[0], laser_origin[1] + i * 10, 0))
-
-def draw_lens():
-    pygame.draw.line(screen, LENS_COLOR, (lens_x, lens_y - lens_height // 2), (lens_x, lens_y + lens_height // 2), 5)
-
-def draw_crystal():
-    pygame.draw.rect(screen, CRYSTAL_COLOR, (crystal_x, crystal_y - crystal_height // 2, crystal_width, crystal_height))
-
-def draw_diaphragm():
-    if diaphragm_enabled:
-        pygame.draw.rect(screen, DIAPHRAGM_COLOR, (diaphragm_x - 5, 0, 10, lens_y - diaphragm_aperture // 2))
-        pygame.draw.rect(screen, DIAPHRAGM_COLOR, (diaphragm_x - 5, lens_y + diaphragm_aperture // 2, 10, HEIGHT))
-
-def draw_beamsplitters():
-    # Lame séparatrice principale
-    pygame.draw.line(screen, BEAMSPLITTER_COLOR, (beamsplitter_x - 20, beamsplitter_y + 20), (beamsplitter_x + 20, beamsplitter_y - 20), 3)
-    # Lame séparatrice secondaire
-    pygame.draw.line(screen, BEAMSPLITTER_COLOR, (beamsplitter2_x -20, beamsplitter2_y + 20), (beamsplitter2_x + 20, beamsplitter2_y -20), 3)
-
-def draw_photodiodes():
-    # Photodiode basse
-    pygame.draw.circle(screen, PHOTODIODE_COLOR, (photodiode_bottom_x, photodiode_bottom_y), photodiode_radius)
-    pygame.draw.circle(screen, BLACK, (photodiode_bottom_x, photodiode_bottom_y), photodiode_radius, 2)
-
-    # Photodiode haute 1
-    pygame.draw.circle(screen, PHOTODIODE_COLOR, (photodiode_top_x, photodiode_top_y), photodiode_radius)
-    pygame.draw.circle(screen, BLACK, (photodiode_top_x, photodiode_top_y), photodiode_radius, 2)
-
-    # Photodiode haute 2
-    pygame.draw.circle(screen, PHOTODIODE_COLOR, (photodiode_top2_x, photodiode_top2_y), photodiode_radius)
-    pygame.draw.circle(screen, BLACK, (photodiode_top2_x, photodiode_top2_y), photodiode_radius, 2)
+# Même moteur que le mode sans affichage (python -m zscan.engine)
+simulation = Simulation(bench, fps=FPS, window=30, history=100, layout=layout)
+pulses, detectors = simulation.pulses, simulation.detectors
+
+def draw_pulses():
+    # Tous les traits en une passe : points tous les 2 px le long de chaque trait (positions
+    # interpolées sur son segment courant), tamponnés en 2×2 (épaisseur 2 comme
+    # pygame.draw.line) dans une image indexée
+    x0, y0, x1, y1 = (v.astype(np.float32) for v in pulses.segments())
+    ux, uy = x1 - x0, y1 - y0
+    s = np.linspace(0, 1, LENGTH // 2 + 1, dtype=np.float32)[:, None]
+    px = (x0 + s * ux).astype(np.int32)
+    py = (y0 + s * uy).astype(np.int32)
+    inside = (px >= 0) & (px < WIDTH - 1) & (py >= 0) & (py < HEIGHT - 1)
+    flat = (py * WIDTH + px)[inside]
+    # Indice 0 transparent, 1 + indice PALETTE sinon
+    colors = np.broadcast_to(pulses.color + np.uint8(1), px.shape)[inside]
+    overlay = np.zeros(WIDTH * HEIGHT, np.uint8)
+    for offset in (0, 1, WIDTH, WIDTH + 1):
+        overlay[flat + offset] = colors
+    surface = pygame.surfarray.make_surface(overlay.reshape(HEIGHT, WIDTH).T)
+    surface.set_palette([BLACK, *PALETTE])
+    surface.set_colorkey(0)
+    screen.blit(surface, (0, 0))
+
+def draw_lens(lens):
+    pygame.draw.line(screen, LENS_COLOR, (lens.x, lens.y - lens.height // 2), (lens.x, lens.y + lens.height // 2), 5)
+
+def draw_crystal(crystal):
+    pygame.draw.rect(screen, CRYSTAL_COLOR, (crystal.x, crystal.y - crystal.height // 2, crystal.width, crystal.height))
+
+def draw_diaphragm(diaphragm):
+    if diaphragm.enabled:
+        pygame.draw.rect(screen, DIAPHRAGM_COLOR, (diaphragm.x - 5, 0, 10, diaphragm.y - diaphragm.aperture // 2))
+        pygame.draw.rect(screen, DIAPHRAGM_COLOR, (diaphragm.x - 5, diaphragm.y + diaphragm.aperture // 2, 10, HEIGHT))
+
+def draw_beamsplitter(splitter):
+    pygame.draw.line(screen, BEAMSPLITTER_COLOR, (splitter.x - 20, splitter.y + 20), (splitter.x + 20, splitter.y - 20), 3)
+
+def draw_photodiode(photodiode):
+    pygame.draw.circle(screen, PHOTODIODE_COLOR, (photodiode.x, photodiode.y), photodiode.radius)
+    pygame.draw.circle(screen, BLACK, (photodiode.x, photodiode.y), photodiode.radius, 2)
+
+# Dessin de chaque type de composant du banc
+DRAWERS = {Lens: draw_lens, Crystal: draw_crystal, Diaphragm: draw_diaphragm, BeamSplitter: draw_beamsplitter,
+           Photodiode: draw_photodiode}
 
 def draw_transmission_graph():
-    max_len = 100
-
-    detected_bottom = sum(1 for p in pulses if p.detected_by_photodiode_bottom)
-    detected_top = sum(1 for p in pulses if p.detected_by_photodiode_top)
-    detected_top2 = sum(1 for p in pulses if p.detected_by_photodiode_top2)
-    total = len(pulses)
-
-    transmission_bottom = detected_bottom / total if total > 0 else 0
-    transmission_top = detected_top / total if total > 0 else 0
-    transmission_top2 = detected_top2 / total if total > 0 else 0
-
-    transmission_history_bottom.append(transmission_bottom)
-    transmission_history_top.append(transmission_top)
-    transmission_history_top2.append(transmission_top2)
-
-    if len(transmission_history_bottom) > max_len:
-        transmission_history_bottom.pop(0)
-    if len(transmission_history_top) > max_len:
-        transmission_history_top.pop(0)
-    if len(transmission_history_top2) > max_len:
-        transmission_history_top2.pop(0)
+    # Historique tenu par les photodiodes : transmission glissante sur detectors.window images
+    history = detectors.history.values()
 
     # Fond graph
     pygame.draw.rect(screen, (50, 50, 50), (graph_x, graph_y, graph_w, graph_h))
 
     # Dessin des courbes
-    def draw_curve(history, color):
-        if len(history) < 2:
+    def draw_curve(values, color):
+        if len(values) < 2:
             return
-        step = graph_w / max_len
-        points = [(graph_x + i * step, graph_y + graph_h - h * graph_h) for i, h in enumerate(history)]
+        step = graph_w / detectors.history.capacity
+        points = [(graph_x + i * step, graph_y + graph_h - h * graph_h) for i, h in enumerate(values)]
         pygame.draw.lines(screen, color, False, points, 2)
 
-    draw_curve(transmission_history_bottom, RED)
-    draw_curve(transmission_history_top, BLUE)
-    draw_curve(transmission_history_top2, (0, 255, 0))
+    draw_curve(history[:, 0], RED)
+    draw_curve(history[:, 1], BLUE)
+    draw_curve(history[:, 2], (0, 255, 0))
 
-    # Mise à jour des labels
+    # Mise à jour des labels : transmission sur la dernière seconde
+    transmission_bottom, transmission_top, transmission_top2 = detectors.transmission("second")
     transmission_label_bottom.set_text(f"Transmission bas: {transmission_bottom*100:.1f}%")
     transmission_label_top.set_text(f"Transmission haut 1: {transmission_top*100:.1f}%")
     transmission_label_top2.set_text(f"Transmission haut 2: {transmission_top2*100:.1f}%")
 
 def reset_simulation():
-    global pulses, transmission_history_bottom, transmission_history_top, transmission_history_top2
-    pulses = []
-    transmission_history_bottom.clear()
-    transmission_history_top.clear()
-    transmission_history_top2.clear()
+    simulation.reset()
 
 running = True
 while running:
@@ -328,11 +185,11 @@ while running:
         if event.type == pygame.USEREVENT:
             if event.user_type == pygame_gui.UI_HORIZONTAL_SLIDER_MOVED:
                 if event.ui_element == nl_slider:
-                    non_linear_strength = nl_slider.get_current_value()
+                    layout.configure(non_linear_strength=nl_slider.get_current_value())
                 elif event.ui_element == shg_slider:
-                    shg_threshold = shg_slider.get_current_value()
+                    layout.configure(shg_threshold=shg_slider.get_current_value())
                 elif event.ui_element == crystal_slider:
-                    crystal_height = crystal_slider.get_current_value()
+                    layout.configure(crystal_height=crystal_slider.get_current_value())
             if event.user_type == pygame_gui.UI_BUTTON_PRESSED:
                 if event.ui_element == reset_button:
                     reset_simulation()
@@ -340,23 +197,16 @@ while running:
 
     manager.update(time_delta)
 
-    emit_pulses()
+    simulation.advance()
 
     screen.fill(BLACK)
 
     # Draw optical elements
-    draw_lens()
-    draw_crystal()
-    draw_beamsplitters()
-    draw_diaphragm()
-    draw_photodiodes()
-
-    # Update and draw pulses
-    for p in pulses[:]:
-        p.update()
-        p.draw(screen)
-        if p.is_off_screen():
-            pulses.remove(p)
+    for component in layout:
+        DRAWERS[type(component)](component)
+
+    # Draw pulses
+    draw_pulses()
 
     draw_transmission_graph()
 
@@ -0,0 +1,97 @@
+"""Temps de calcul du Z-scan (courbes de transmission, banc de rayons sans affichage)."""
+import numpy as np
+
+from benchmarks.legacy_zscan import LightPulse, step_pulses
+from zscan import Bench, PulseStore, RayTracer, compute_transmission
+from zscan.components import Layout, Lens, Photodiode
+from zscan.engine import run
+
+
+class TimeTransmission:
+    params = ([1_000, 10_000, 100_000, 1_000_000], [False, True])
+    param_names = ["n_z", "open_aperture"]
+    quick_params = ([1_000, 100_000], [False, True])
+
+    def setup(self, n_z, open_aperture):
+        self.z = np.linspace(-30, 30, n_z)
+
+    def time_compute_transmission(self, n_z, open_aperture):
+        compute_transmission(self.z, 1.0, 10, 1e-4, 1.0, open_aperture, 0.1)
+
+
+class TimeRayStep:
+    """Une image de Z_scan_pedagogique.py (mise à jour de toutes les impulsions)."""
+
+    params = [1_000, 10_000, 100_000]
+    param_names = ["n_pulses"]
+    quick_params = [1_000, 10_000]
+    # L'étape modifie l'état : un seul appel par mesure, setup avant chaque mesure
+    number = 1
+
+    def setup(self, n_pulses):
+        rng = np.random.default_rng(0)
+        self.bench = Bench()
+        xs = rng.uniform(100, self.bench.width - 50, n_pulses)
+        ys = self.bench.lens_y + rng.uniform(-20, 20, n_pulses)
+        self.pulses = [LightPulse(self.bench, x, y, 0.0) for x, y in zip(xs, ys)]
+
+    def time_step(self, n_pulses):
+        step_pulses(self.pulses)
+
+
+class TimePulseStore:
+    """Même image que TimeRayStep, impulsions en colonnes NumPy (PulseStore par pas, RayTracer par événements)."""
+
+    params = ([1_000, 10_000, 100_000], ["steps", "events"])
+    param_names = ["n_pulses", "method"]
+    quick_params = ([1_000, 100_000], ["steps", "events"])
+    number = 1
+
+    def setup(self, n_pulses, method):
+        rng = np.random.default_rng(0)
+        self.bench = Bench()
+        self.pulses = {"steps": PulseStore, "events": RayTracer}[method](self.bench, n_pulses)
+        self.pulses.add(rng.uniform(100, self.bench.width - 50, n_pulses),
+                        self.bench.lens_y + rng.uniform(-20, 20, n_pulses), 0.0)
+
+    def time_step(self, n_pulses, method):
+        self.pulses.step()
+
+
+class TimeDenseLayout:
+    """RayTracer sur un banc de n_components lentilles et photodiodes : l'index en x borne les tests par rayon."""
+
+    params = ([8, 32, 128], [10_000, 100_000])
+    param_names = ["n_components", "n_pulses"]
+    quick_params = ([8, 128], [100_000])
+    number = 1
+
+    def setup(self, n_components, n_pulses):
+        rng = np.random.default_rng(0)
+        self.bench = Bench()
+        xs = np.linspace(150, self.bench.width - 50, n_components)
+        layout = Layout([Lens(f"lens{i}", x, self.bench.lens_y, focal_length=2000) if i % 2 else
+                         Photodiode(f"photodiode{i}", x, self.bench.lens_y + rng.uniform(-100, 100), channel=i % 3)
+                         for i, x in enumerate(xs)])
+        self.pulses = RayTracer(self.bench, n_pulses, layout=layout)
+        self.pulses.add(rng.uniform(100, self.bench.width - 50, n_pulses),
+                        self.bench.lens_y + rng.uniform(-150, 150, n_pulses), rng.uniform(-0.2, 0.2, n_pulses))
+        self.pulses.now = float(self.pulses.t_next.min())
+
+    def time_step(self, n_components, n_pulses):
+        self.pulses.step()
+
+
+class TimeHeadlessRun:
+    """Simulation sans affichage (zscan.engine.run), émission et photodiodes comprises."""
+
+    params = [1_000, 5_000]
+    param_names = ["frames"]
+    quick_params = [1_000]
+
+    def setup(self, frames):
+        # Diaphragme et conversion SHG actifs : tous les éléments travaillent
+        self.settings = {"non_linear_strength": 7.5, "diaphragm_enabled": True}
+
+    def time_run(self, frames):
+        run(frames, **self.settings)
@@ -0,0 +1,125 @@
+"""
+Modèle historique de Z_scan_pedagogique.py : un objet LightPulse par impulsion,
+mis à jour en Python pur. Gardé comme référence des benchmarks (bench_zscan) et
+des tests d'équivalence de zscan.pulses.PulseStore ; le banc utilise PulseStore
+ou RayTracer.
+"""
+import math
+
+from zscan.optics import BLUE, RED
+
+
+class LightPulse:
+    def __init__(self, bench, x, y, angle, color=RED):
+        self.bench = bench
+        self.x = x
+        self.y = y
+        self.angle = angle
+        self.color = color
+        self.speed = 5
+        self.length = 10
+        self.passed_lens = False
+        self.passed_crystal = False
+        self.passed_beamsplitter = False
+        self.passed_beamsplitter2 = False
+        self.alive = True
+        self.intensity = max(1.0, 1.0 + abs(y - bench.lens_y) / 50)
+        self.transmitted = False
+        self.detected_by_photodiode_bottom = False
+        self.detected_by_photodiode_top = False
+        self.detected_by_photodiode_top2 = False
+
+    def update(self, pulses):
+        """Avance d'une image ; les impulsions réfléchies sont ajoutées à `pulses`."""
+        if not self.alive:
+            return
+        b = self.bench
+
+        self.x += math.cos(self.angle) * self.speed
+        self.y += math.sin(self.angle) * self.speed
+
+        # Passage lame séparatrice principale
+        if not self.passed_beamsplitter and self.x >= b.beamsplitter_x:
+            self.passed_beamsplitter = True
+            if abs(self.y - b.beamsplitter_y) < 5:
+                # Réfléchie vers le haut
+                reflected_pulse = LightPulse(b, self.x, self.y, -math.pi / 2, self.color)
+                pulses.append(reflected_pulse)
+                # Transmission continue à droite
+
+        # Passage lame séparatrice secondaire
+        if not self.passed_beamsplitter2 and self.x >= b.beamsplitter2_x:
+            self.passed_beamsplitter2 = True
+            if abs(self.y - b.beamsplitter2_y) < 5:
+                # Réflexion vers le haut
+                reflected_pulse = LightPulse(b, self.x, self.y, -math.pi / 2, self.color)
+                pulses.append(reflected_pulse)
+                # Transmission vers le bas continue en angle -pi/2
+                self.angle = -math.pi / 2
+
+        # Passage lentille
+        if not self.passed_lens and self.x >= b.lens_x:
+            focal_point = (b.lens_x + b.focal_length, b.lens_y)
+            self.angle = math.atan2(focal_point[1] - self.y, focal_point[0] - b.lens_x)
+            self.passed_lens = True
+
+        # Passage cristal
+        if not self.passed_crystal and b.crystal_x <= self.x <= b.crystal_x + b.crystal_width:
+            angle_change = math.radians(b.non_linear_strength * self.intensity)
+            self.angle += angle_change
+            if self.intensity > b.shg_threshold:
+                self.color = BLUE
+            self.passed_crystal = True
+
+        # Passage diaphragme
+        if b.diaphragm_enabled and self.x >= b.diaphragm_x:
+            if abs(self.y - b.lens_y) > b.diaphragm_aperture // 2:
+                self.alive = False
+
+        # Détection photodiode basse
+        if not self.detected_by_photodiode_bottom and self.x >= b.photodiode_bottom_x:
+            dist_bottom = math.hypot(self.x - b.photodiode_bottom_x, self.y - b.photodiode_bottom_y)
+            if dist_bottom <= b.photodiode_radius:
+                self.detected_by_photodiode_bottom = True
+
+        # Détection photodiode haute 1 (première lame séparatrice)
+        if not self.detected_by_photodiode_top:
+            dist_top = math.hypot(self.x - b.photodiode_top_x, self.y - b.photodiode_top_y)
+            if dist_top <= b.photodiode_radius and math.isclose(self.angle, -math.pi / 2, abs_tol=0.1):
+                self.detected_by_photodiode_top = True
+
+        # Détection photodiode haute 2 (deuxième lame séparatrice)
+        if not self.detected_by_photodiode_top2:
+            dist_top2 = math.hypot(self.x - b.photodiode_top2_x, self.y - b.photodiode_top2_y)
+            if dist_top2 <= b.photodiode_radius and math.isclose(self.angle, -math.pi / 2, abs_tol=0.1):
+                self.detected_by_photodiode_top2 = True
+
+        if self.x > b.width or self.y < 0 or self.y > b.height:
+            self.transmitted = True
+
+    def is_off_screen(self):
+        b = self.bench
+        return self.x > b.width or self.y < 0 or self.y > b.height or not self.alive
+
+
+def emit_pulses(bench, pulses, frame_counter):
+    """Émission laser : 5 impulsions toutes les 10 images."""
+    if frame_counter % 10 == 0:
+        for i in range(-2, 3):
+            pulses.append(LightPulse(bench, bench.laser_origin[0], bench.laser_origin[1] + i * 10, 0))
+
+
+def step_pulses(pulses):
+    """
+    Avance toutes les impulsions d'une image et retire celles sorties du banc.
+    Retrait par échange avec la dernière impulsion (O(1) par rayon, ordre non conservé).
+    """
+    for p in pulses[:]:
+        p.update(pulses)
+    i = 0
+    while i < len(pulses):
+        if pulses[i].is_off_screen():
+            pulses[i] = pulses[-1]
+            pulses.pop()
+        else:
+            i += 1
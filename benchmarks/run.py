@@ -0,0 +1,153 @@
+"""
+Lance les benchmarks de benchmarks/bench_*.py et enregistre les temps en JSON.
+
+    python benchmarks/run.py [--quick] [-k filtre] [-o fichier.json] [--compare base.json]
+
+Les modules suivent le format asv (classes avec params/param_names, setup,
+méthodes time_*) mais ce lanceur n'a besoin que de la bibliothèque standard.
+Les résultats vont par défaut dans benchmarks/results/<commit>.json ;
+--compare signale les cas plus lents que la référence au-delà de --threshold.
+"""
+import argparse
+import importlib.util
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+# Durée minimale d'une mesure quand `number` n'est pas fixé par le benchmark
+MIN_SAMPLE = 0.05
+
+
+def _git_revision():
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT,
+                               capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{rev}-dirty" if dirty else rev
+
+
+def _load_modules():
+    sys.path.insert(0, ROOT)
+    for name in sorted(os.listdir(HERE)):
+        if name.startswith("bench_") and name.endswith(".py"):
+            spec = importlib.util.spec_from_file_location(name[:-3], os.path.join(HERE, name))
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            yield module
+
+
+def _combinations(params):
+    if not params:
+        return [()]
+    if not isinstance(params[0], (list, tuple)):
+        return [(p,) for p in params]
+    return list(itertools.product(*params))
+
+
+def _measure(bench, method, args, number, repeat):
+    samples = []
+    for _ in range(repeat):
+        bench.setup(*args)
+        n = number
+        if n is None:
+            # Nombre d'appels tel qu'une mesure dure au moins MIN_SAMPLE
+            n, elapsed = 1, 0.0
+            while True:
+                start = time.perf_counter()
+                for _ in range(n):
+                    method(*args)
+                elapsed = time.perf_counter() - start
+                if elapsed >= MIN_SAMPLE:
+                    break
+                n *= 10 if elapsed < MIN_SAMPLE / 10 else 2
+                bench.setup(*args)
+            samples.append(elapsed / n)
+            continue
+        start = time.perf_counter()
+        for _ in range(n):
+            method(*args)
+        samples.append((time.perf_counter() - start) / n)
+    return samples
+
+
+def run(keyword=None, quick=False, repeat=5):
+    results = {}
+    for module in _load_modules():
+        for cls_name, cls in vars(module).items():
+            if not (isinstance(cls, type) and cls_name.startswith("Time")):
+                continue
+            params = getattr(cls, "quick_params", None) if quick else None
+            params = params or getattr(cls, "params", [])
+            names = getattr(cls, "param_names", [])
+            for method_name in sorted(m for m in dir(cls) if m.startswith("time_")):
+                for args in _combinations(params):
+                    label = ", ".join(f"{n}={a}" for n, a in zip(names, args))
+                    key = f"{module.__name__}.{cls_name}.{method_name}({label})"
+                    if keyword and keyword not in key:
+                        continue
+                    bench = cls()
+                    samples = _measure(bench, getattr(bench, method_name), args,
+                                       getattr(cls, "number", None), repeat)
+                    results[key] = {"min": min(samples), "median": statistics.median(samples),
+                                    "repeat": len(samples)}
+                    print(f"{key:<90} {results[key]['min'] * 1e3:10.3f} ms", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for key, value in results.items():
+        if key in baseline:
+            ratio = value["min"] / baseline[key]["min"]
+            if ratio > threshold:
+                regressions.append((ratio, key))
+    for ratio, key in sorted(regressions, reverse=True):
+        print(f"RÉGRESSION ×{ratio:.2f}  {key}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-k", dest="keyword", help="ne lance que les benchmarks dont le nom contient ce texte")
+    parser.add_argument("--quick", action="store_true", help="jeux de paramètres réduits (quick_params)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-o", "--output", help="fichier JSON de sortie (défaut : benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", metavar="BASE", help="résultats JSON de référence")
+    parser.add_argument("--threshold", type=float, default=1.25, help="ratio de temps signalé comme régression")
+    args = parser.parse_args(argv)
+
+    revision = _git_revision()
+    results = run(args.keyword, args.quick, args.repeat)
+    output = args.output or os.path.join(HERE, "results", f"{revision}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "commit": revision,
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "machine": {"platform": platform.platform(), "processor": platform.processor(),
+                        "cpu_count": os.cpu_count(), "python": platform.python_version()},
+            "quick": args.quick,
+            "results": results,
+        }, f, indent=1)
+    print(f"→ {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
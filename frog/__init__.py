@@ -0,0 +1,88 @@
+"""Outils de simulation FROG partagés par FROG.py et les scripts Frog1–Frog6."""
+
+from .baseband import signal_carrier, to_baseband
+from .cache import TraceCache, cache_key
+from .crystal import (CRYSTALS, Crystal, PhaseMatchingTable, ShgPropagator, phase_matching_angle, phase_matching_table,
+                      propagate_shg)
+from .delay import delay_fields, phase_ramp
+from .dispersion import Dispersion, apply_chirp, apply_dispersion, dispersion_kernel
+from .export import EXPORT_FORMATS, export_trace
+from .grid import GridPlan, plan_grid, plan_scenario
+from .instrument import Instrumentation, StageRecord
+from .materials import SELLMEIER, material_phase, refractive_index
+from .nonlinear import SIGNALS, frog_signal
+from .precision import PRECISIONS, SINGLE_RTOL, max_relative_error
+from .pulse import build_pulse, gaussian_pulse, time_grid
+from .render import TraceView, decimate, show_trace
+from .retrieval import RetrievalResult, frog_error, pcgpa, retrieve
+from .scenario import Scenario, baseband_error, compute_scenario, load_scenarios, scenario_omega
+from .spectrum import omega_axis, spectral_evaluator
+from .storage import read_decimated, write_circular_trace, write_delay_trace, write_trace
+from .sweep import expand_grid, find_point, load_atlas, run_sweep
+from .trace import METHODS, compute_trace, delay_trace, gate_matrix, symmetric_delays, unfold_trace
+
+__all__ = [
+    "CRYSTALS",
+    "Crystal",
+    "Dispersion",
+    "EXPORT_FORMATS",
+    "GridPlan",
+    "Instrumentation",
+    "METHODS",
+    "PRECISIONS",
+    "PhaseMatchingTable",
+    "RetrievalResult",
+    "SELLMEIER",
+    "SINGLE_RTOL",
+    "SIGNALS",
+    "Scenario",
+    "ShgPropagator",
+    "StageRecord",
+    "TraceCache",
+    "TraceView",
+    "apply_chirp",
+    "apply_dispersion",
+    "baseband_error",
+    "build_pulse",
+    "cache_key",
+    "compute_scenario",
+    "compute_trace",
+    "decimate",
+    "delay_fields",
+    "delay_trace",
+    "dispersion_kernel",
+    "expand_grid",
+    "export_trace",
+    "find_point",
+    "frog_error",
+    "frog_signal",
+    "gate_matrix",
+    "gaussian_pulse",
+    "load_atlas",
+    "load_scenarios",
+    "material_phase",
+    "max_relative_error",
+    "omega_axis",
+    "pcgpa",
+    "phase_matching_angle",
+    "phase_matching_table",
+    "phase_ramp",
+    "plan_grid",
+    "plan_scenario",
+    "propagate_shg",
+    "read_decimated",
+    "refractive_index",
+    "retrieve",
+    "run_sweep",
+    "scenario_omega",
+    "show_trace",
+    "signal_carrier",
+    "spectral_evaluator",
+    "symmetric_delays",
+    "time_grid",
+    "to_baseband",
+    "unfold_trace",
+    "write_circular_trace",
+    "write_delay_trace",
+    "write_trace",
+]
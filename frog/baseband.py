@@ -0,0 +1,45 @@
+"""
+Représentation en bande de base (enveloppe lentement variable).
+
+Le champ est simulé dans le référentiel tournant à ω₀ : on ne garde que
+l'enveloppe, sans la porteuse exp(iω₀t). Le signal SHG E·E(t-τ) se retrouve
+alors centré sur 0 au lieu de 2ω₀, le signal PG E·|E(t-τ)|² au lieu de ω₀ :
+seule la largeur de bande de l'enveloppe fixe le pas temporel, et la grille
+peut être 4 à 8 fois plus petite. Le décalage de porteuse n'est rajouté que
+sur l'axe ω de la trace. Les retards n'ajoutent qu'une phase constante
+exp(-iω₀τ) au signal, sans effet sur |S(ω, τ)|².
+"""
+import numpy as np
+
+from .pulse import omega0
+
+# Ordre de la porteuse du signal FROG : E·E(t-τ) → 2ω₀, E·|E(t-τ)|² → ω₀
+CARRIER_ORDER = {"SHG": 2, "PG": 1}
+
+
+def signal_carrier(signal, omega_c=omega0):
+    """Pulsation porteuse (rad/fs) du signal FROG pour un champ de porteuse ω_c."""
+    try:
+        return CARRIER_ORDER[signal] * omega_c
+    except KeyError:
+        raise ValueError(f"Signal FROG inconnu : {signal}") from None
+
+
+def baseband_window(t, signal, omega_window, omega_c=omega0):
+    """
+    Fenêtre ω (rad/fs) du signal en bande de base correspondant à `omega_window`.
+
+    Lève ValueError si elle sort de la bande de Nyquist ±π/dt de la grille `t`.
+    """
+    offset = signal_carrier(signal, omega_c)
+    window = (omega_window[0] - offset, omega_window[1] - offset)
+    nyquist = np.pi / (t[1] - t[0])
+    if min(window) < -nyquist or max(window) > nyquist:
+        raise ValueError(f"Fenêtre {tuple(omega_window)} rad/fs hors de la bande ±{nyquist:.3g} rad/fs "
+                         f"autour de {offset:.4g} rad/fs : grille trop grossière pour la bande de base")
+    return window
+
+
+def to_baseband(E, t, omega_c=omega0):
+    """Enveloppe E·exp(-iω_c t) d'un champ à porteuse ω_c."""
+    return E * np.exp(-1j * omega_c * np.asarray(t)).astype(np.result_type(E, np.complex64), copy=False)
@@ -0,0 +1,137 @@
+"""
+Cache disque des traces, adressé par le contenu des paramètres.
+
+Chaque entrée est un dossier <racine>/<ab>/<clé>/ contenant un fichier .npy par
+tableau et params.json. Les tableaux sont relus en np.memmap (lecture seule),
+et la date de modification du dossier sert d'horodatage LRU pour l'éviction.
+Le cache est partagé entre processus (sessions Streamlit, CLI) : une entrée est
+écrite dans un dossier temporaire puis renommée d'un bloc.
+"""
+import hashlib
+import json
+import numbers
+import os
+import shutil
+import threading
+import uuid
+
+import numpy as np
+
+# À incrémenter quand le calcul des traces change, pour invalider les entrées
+FORMAT_VERSION = 1
+
+
+def _canonical(value):
+    """Nombres en float (50 et 50.0 donnent la même clé), tuples en listes, récursivement."""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, numbers.Real) and not isinstance(value, (bool, np.bool_)):
+        return float(value)
+    return value
+
+
+def cache_key(params):
+    """Empreinte SHA-256 des paramètres (dictionnaire JSON-sérialisable, nombres normalisés)."""
+    payload = json.dumps({"version": FORMAT_VERSION, "params": _canonical(params)}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class TraceCache:
+    def __init__(self, root, max_bytes=2 * 2**30):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], key)
+
+    def get(self, params):
+        """
+        Tableaux de l'entrée en memmap (dict nom → tableau), ou None si absente.
+        Une entrée illisible (fichier tronqué, en-tête .npy corrompu) est supprimée
+        et comptée comme absente : elle sera recalculée.
+        """
+        path = self._path(cache_key(params))
+        try:
+            names = [f[:-4] for f in os.listdir(path) if f.endswith(".npy")]
+            arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in names}
+            os.utime(path)
+        except FileNotFoundError:
+            # Absente, ou évincée pendant la lecture
+            with self._lock:
+                self.misses += 1
+            return None
+        except (OSError, ValueError, EOFError):
+            shutil.rmtree(path, ignore_errors=True)
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return arrays
+
+    def put(self, params, **arrays):
+        """Écrit les tableaux sous la clé des paramètres et renvoie leurs memmaps."""
+        key = cache_key(params)
+        path = self._path(key)
+        tmp = os.path.join(self.root, f".tmp-{key}-{uuid.uuid4().hex}")
+        os.makedirs(tmp)
+        for name, array in arrays.items():
+            np.save(os.path.join(tmp, f"{name}.npy"), np.ascontiguousarray(array))
+        with open(os.path.join(tmp, "params.json"), "w", encoding="utf-8") as f:
+            json.dump(params, f, sort_keys=True)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            os.rename(tmp, path)
+        except OSError:
+            # Entrée écrite entre-temps par une autre session : on garde la sienne
+            shutil.rmtree(tmp, ignore_errors=True)
+        # Relecture avant éviction : un memmap ouvert survit à la suppression du fichier
+        stored = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in arrays}
+        self.evict()
+        return stored
+
+    def get_or_compute(self, params, compute):
+        """Entrée en cache, sinon compute() → dict de tableaux, mis en cache puis relu."""
+        arrays = self.get(params)
+        if arrays is None:
+            arrays = self.put(params, **compute())
+        return arrays
+
+    def _entries(self):
+        entries = []
+        for shard in os.scandir(self.root):
+            if not shard.is_dir() or shard.name.startswith(".tmp-"):
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                    entries.append((entry.stat().st_mtime, size, entry.path))
+                except FileNotFoundError:
+                    continue
+        return entries
+
+    def size_bytes(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Supprime les entrées les moins récemment utilisées au-delà de max_bytes."""
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+                self.evictions += 1
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
@@ -0,0 +1,75 @@
+"""
+Génération en lot de traces de référence, sans affichage interactif.
+
+    python -m frog scenarios/reference.json -o traces/ [--data] [--only Frog1 ...] [--cache DOSSIER]
+"""
+import argparse
+import os
+import time
+from dataclasses import asdict
+from io import BytesIO
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from .cache import TraceCache
+from .plot import plot_trace
+from .scenario import compute_scenario, load_scenarios
+
+
+def render_png(scenario, dpi, workers=None, cache=None, data=None):
+    """
+    PNG de la trace d'un scénario ; avec un TraceCache, figure mise en cache par
+    hachage des paramètres. `data` : (retards, ω, trace) déjà calculés par compute_scenario.
+    """
+    def render():
+        delays, omega, trace = data if data is not None else compute_scenario(scenario, workers, cache)
+        fig = plot_trace(delays, omega, trace, scenario.title, dpi=dpi)
+        buffer = BytesIO()
+        fig.savefig(buffer, format="png", dpi=dpi)
+        plt.close(fig)
+        return {"png": np.frombuffer(buffer.getvalue(), dtype=np.uint8)}
+
+    if cache is None:
+        return render()["png"].tobytes()
+    params = {"figure": "plot_trace", "dpi": dpi, **{k: v for k, v in asdict(scenario).items() if k != "name"}}
+    return cache.get_or_compute(params, render)["png"].tobytes()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m frog", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("config", help="fichier JSON listant les scénarios")
+    parser.add_argument("-o", "--output", default="traces", help="dossier de sortie")
+    parser.add_argument("--data", action="store_true", help="écrit aussi les traces en .npz")
+    parser.add_argument("--only", nargs="+", metavar="NOM", help="ne traite que ces scénarios")
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--cache", metavar="DOSSIER", help="cache disque des traces déjà calculées")
+    args = parser.parse_args(argv)
+
+    plt.switch_backend("Agg")
+    scenarios = load_scenarios(args.config)
+    if args.only:
+        scenarios = [s for s in scenarios if s.name in args.only]
+    os.makedirs(args.output, exist_ok=True)
+    cache = TraceCache(args.cache) if args.cache else None
+
+    for scenario in scenarios:
+        start = time.perf_counter()
+        path = os.path.join(args.output, scenario.name)
+
+        # Trace calculée une fois, pour la figure et les données
+        data = compute_scenario(scenario, workers=-1, cache=cache) if args.data else None
+        with open(f"{path}.png", "wb") as f:
+            f.write(render_png(scenario, args.dpi, workers=-1, cache=cache, data=data))
+        if data is not None:
+            delays, omega, trace = data
+            np.savez_compressed(f"{path}.npz", delays=delays, omega=omega, trace=trace)
+
+        print(f"{scenario.name}: {time.perf_counter() - start:.2f} s")
+
+    if cache is not None:
+        print("cache : {hits} hits, {misses} misses, {evictions} évictions".format(**cache.stats()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import numpy as np
+from scipy.fft import fft, ifft, fftfreq
+
+
+def phase_ramp(omega, delays):
+    """Matrice (retards × ω) des rampes de phase exp(-iωτ) du théorème du retard."""
+    return np.exp(-1j * np.outer(delays, omega))
+
+
+def delay_fields(E, t, delays, chunk=None, workers=None, ramp=None):
+    """
+    Copies retardées E(t - τ) pour tous les τ de `delays`, forme (len(delays), len(t)).
+
+    Le champ est transformé une seule fois, multiplié par la rampe de phase puis
+    ramené en temps par une IFFT groupée. Le retard est exact (pas d'interpolation)
+    mais circulaire : la fenêtre temporelle doit contenir l'impulsion retardée.
+    `chunk` limite le nombre de retards traités à la fois pour borner la mémoire ;
+    `ramp` permet de réutiliser une matrice phase_ramp déjà calculée pour cette grille.
+    """
+    delays = np.atleast_1d(np.asarray(delays, dtype=float))
+    dt = t[1] - t[0]
+    # complex64 reste en simple précision, tout le reste passe en complex128
+    E_w = fft(np.asarray(E, dtype=np.result_type(E, np.complex64)))
+    omega = 2 * np.pi * fftfreq(len(t), d=dt)
+
+    if chunk is None:
+        chunk = len(delays)
+    E_delayed = np.empty((len(delays), len(t)), dtype=E_w.dtype)
+    for start in range(0, len(delays), chunk):
+        stop = min(start + chunk, len(delays))
+        if ramp is None:
+            spectra = E_w * phase_ramp(omega, delays[start:stop]).astype(E_w.dtype, copy=False)
+        else:
+            spectra = E_w * ramp[start:stop].astype(E_w.dtype, copy=False)
+        E_delayed[start:stop] = ifft(spectra, axis=1, overwrite_x=True, workers=workers)
+    return E_delayed
@@ -0,0 +1,98 @@
+"""
+Dispersion : phase spectrale en série de Taylor (φ″, φ‴, φ⁗) et traversée de matériaux.
+
+Le noyau exp(-iφ(ω)) est calculé une fois par (grille, porteuse, réglage) puis
+gardé en cache : une boucle de retrieval ou un balayage de chirp ne reconstruit
+pas la phase à chaque appel. Plusieurs réglages s'appliquent à un même spectre
+en une seule multiplication diffusée suivie d'une IFFT groupée.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from scipy.fft import fft, fftfreq, ifft
+
+from .materials import material_phase
+from .pulse import omega0
+
+# Pas relatif de la dérivée numérique (retard de groupe des matériaux)
+_DERIVATIVE_STEP = 1e-4
+
+
+@dataclass(frozen=True)
+class Dispersion:
+    """Réglage de dispersion : coefficients de Taylor autour de ω_c et épaisseurs de matériaux."""
+
+    phi2: float = 0.0  # fs²
+    phi3: float = 0.0  # fs³
+    phi4: float = 0.0  # fs⁴
+    materials: tuple = ()  # ((matériau, longueur en mm), ...), voir frog.materials
+
+    def __post_init__(self):
+        # Listes JSON → tuples, pour que le réglage serve de clé de cache
+        object.__setattr__(self, "materials", tuple((str(m), float(L)) for m, L in self.materials))
+
+    def is_zero(self):
+        return self.phi2 == self.phi3 == self.phi4 == 0 and not any(L for _, L in self.materials)
+
+
+def spectral_phase(omega, dispersion, omega_c=omega0):
+    """
+    Phase φ(ω) (rad) aux pulsations absolues `omega`. Les matériaux sont
+    comptés sans leur phase et leur retard de groupe à ω_c : l'impulsion reste centrée.
+    """
+    omega = np.asarray(omega, dtype=np.float64)
+    delta = omega - omega_c
+    phase = dispersion.phi2 * delta**2 / 2 + dispersion.phi3 * delta**3 / 6 + dispersion.phi4 * delta**4 / 24
+    h = _DERIVATIVE_STEP * omega_c
+    for material, length in dispersion.materials:
+        at = material_phase(material, length, [omega_c - h, omega_c, omega_c + h])
+        group_delay = (at[2] - at[0]) / (2 * h)
+        phase = phase + material_phase(material, length, omega) - at[1] - group_delay * delta
+    return phase
+
+
+@lru_cache(maxsize=64)
+def _kernel(N, dt, omega_c, frame, dispersion):
+    omega = 2 * np.pi * fftfreq(N, d=dt) + frame
+    kernel = np.exp(-1j * spectral_phase(omega, dispersion, omega_c))
+    kernel.setflags(write=False)
+    return kernel
+
+
+@lru_cache(maxsize=8)
+def _kernels(N, dt, omega_c, frame, settings):
+    kernels = np.stack([_kernel(N, dt, omega_c, frame, d) for d in settings])
+    kernels.setflags(write=False)
+    return kernels
+
+
+def dispersion_kernel(t, dispersion, omega_c=omega0, baseband=False):
+    """
+    Noyau exp(-iφ(ω)) sur les fréquences FFT de `t` (ordre fftfreq), en cache.
+
+    `dispersion` : un Dispersion → forme (N,), une suite de Dispersion → (len, N).
+    Avec `baseband`, la grille représente l'enveloppe : ω absolu = ω_grille + ω_c.
+    """
+    frame = omega_c if baseband else 0.0
+    key = (len(t), float(t[1] - t[0]), float(omega_c), float(frame))
+    if isinstance(dispersion, Dispersion):
+        return _kernel(*key, dispersion)
+    return _kernels(*key, tuple(dispersion))
+
+
+def apply_dispersion(E, t, dispersion, omega_c=omega0, baseband=False, workers=None):
+    """
+    Champ E(t) après dispersion. Avec une suite de réglages, renvoie le lot
+    (len(dispersion), N) : un seul spectre, une multiplication diffusée, une IFFT groupée.
+    """
+    E_w = fft(np.asarray(E, dtype=np.result_type(E, np.complex64)), workers=workers)
+    kernel = dispersion_kernel(t, dispersion, omega_c, baseband).astype(E_w.dtype, copy=False)
+    return ifft(E_w * kernel, axis=-1, overwrite_x=True, workers=workers)
+
+
+def apply_chirp(E, t, phi2, omega_c=omega0):
+    """Phase spectrale quadratique exp(-i φ″ (ω - ω_c)² / 2), φ″ en fs²."""
+    if phi2 == 0:
+        return E
+    return apply_dispersion(E, t, Dispersion(phi2=phi2), omega_c)
@@ -0,0 +1,83 @@
+"""
+Export des traces FROG : .npz compressé, HDF5 avec métadonnées d'axes, texte .frg.
+
+Disposition commune : (retard, fréquence), comme frog.storage. L'axe spectral
+est nommé et daté de son unité par l'appelant : "omega" en rad/fs par défaut
+(scénarios Frog1–6), "freq" en 1/fs pour les fréquences cycliques de FROG.py.
+Les formats sont écrits par blocs de retards dans un fichier binaire (disque ou
+BytesIO), sans copie formatée de la trace entière en mémoire.
+
+Format .frg (texte) : une ligne d'en-tête
+    n_retards n_fréquences pas_retard pas_fréquence fréquence_centrale
+puis une ligne par retard (retards en fs, fréquences dans l'unité de l'axe
+exporté). Variante en fréquence de l'en-tête Femtosoft (axe spectral uniforme
+en fréquence plutôt qu'en longueur d'onde).
+"""
+import io
+import json
+
+import numpy as np
+
+BLOCK = 256
+
+# Format → (extension, type MIME)
+EXPORT_FORMATS = {
+    "npz": (".npz", "application/octet-stream"),
+    "hdf5": (".h5", "application/x-hdf5"),
+    "frg": (".frg", "text/plain"),
+}
+
+
+def _rows(trace, block):
+    for start in range(0, trace.shape[0], block):
+        yield trace[start:start + block]
+
+
+def write_npz(f, trace, delays, axis, attrs=None, axis_name="omega", axis_unit="rad/fs"):
+    """Archive .npz compressée : trace, delays, axe `axis_name`, units et attrs (JSON)."""
+    units = {"delays": "fs", axis_name: axis_unit}
+    np.savez_compressed(f, trace=trace, delays=delays, **{axis_name: axis}, units=json.dumps(units),
+                        attrs=json.dumps(attrs or {}))
+
+
+def write_hdf5(f, trace, delays, axis, attrs=None, axis_name="omega", axis_unit="rad/fs", block=BLOCK):
+    """Dataset "trace" compressé, axes "delays" et `axis_name` attachés comme échelles de dimension."""
+    try:
+        import h5py
+    except ImportError:
+        raise ImportError("L'export HDF5 nécessite h5py (pip install h5py)") from None
+    with h5py.File(f, "w") as h5:
+        dataset = h5.create_dataset("trace", shape=trace.shape, dtype=trace.dtype,
+                                    chunks=(min(block, trace.shape[0]), trace.shape[1]), compression="gzip")
+        for name, values, unit, dim in (("delays", delays, "fs", 0), (axis_name, axis, axis_unit, 1)):
+            h5[name] = values
+            h5[name].attrs["units"] = unit
+            h5[name].make_scale(name)
+            dataset.dims[dim].attach_scale(h5[name])
+        h5.attrs.update(attrs or {})
+        for start, rows in zip(range(0, trace.shape[0], block), _rows(trace, block)):
+            dataset[start:start + len(rows)] = rows
+
+
+def write_frg(f, trace, delays, axis, attrs=None, axis_name="omega", axis_unit="rad/fs", block=BLOCK):
+    """Texte .frg : en-tête Femtosoft (axe en fréquence, unité `axis_unit`) puis une ligne par retard."""
+    n_delays, n_axis = trace.shape
+    d_delay = delays[1] - delays[0] if n_delays > 1 else 0.0
+    d_axis = axis[1] - axis[0] if n_axis > 1 else 0.0
+    f.write(f"{n_delays} {n_axis} {d_delay:.9g} {d_axis:.9g} {axis[n_axis // 2]:.9g}\n".encode())
+    for rows in _rows(trace, block):
+        np.savetxt(f, rows, fmt="%.6g")
+
+
+def export_trace(fmt, trace, delays, axis, attrs=None, axis_name="omega", axis_unit="rad/fs"):
+    """
+    Trace (retard, fréquence) exportée au format `fmt`, renvoyée en BytesIO prêt
+    à lire. `axis` : axe spectral, nommé `axis_name` et exprimé en `axis_unit`.
+    """
+    writers = {"npz": write_npz, "hdf5": write_hdf5, "frg": write_frg}
+    if fmt not in writers:
+        raise ValueError(f"Format d'export inconnu : {fmt} (attendu : {', '.join(writers)})")
+    buffer = io.BytesIO()
+    writers[fmt](buffer, trace, np.asarray(delays), np.asarray(axis), attrs, axis_name, axis_unit)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,130 @@
+"""
+Dimensionnement automatique de la grille temporelle à partir du modèle d'impulsion.
+
+La fenêtre [-t_max, t_max] doit contenir l'impulsion (énergie hors fenêtre
+≤ energy_tol) et ses copies retardées, puisque le retard par la FFT est
+circulaire. Le pas dt doit échantillonner le signal FROG sans repliement (énergie
+spectrale hors de la bande de Nyquist ≤ alias_tol). Les deux sont mesurés sur une
+grille d'essai large, calculée à partir du spectre gaussien de l'impulsion :
+la phase spectrale (φ″, φ‴, φ⁗, matériaux) n'élargit que le domaine temporel, le filtre passe-bas
+borne la bande. Nt est arrondi à une taille rapide pour la FFT (next_fast_len).
+"""
+from dataclasses import dataclass, replace
+
+import numpy as np
+from scipy.fft import fft, fftfreq, ifft, next_fast_len
+from scipy.special import erfcinv
+
+from .baseband import CARRIER_ORDER, signal_carrier, to_baseband
+from .delay import delay_fields
+from .dispersion import Dispersion, dispersion_kernel, spectral_phase
+from .nonlinear import frog_signal
+from .pulse import build_pulse, fwhm_to_sigma, omega0
+
+# Retards sondés pour estimer la bande du signal FROG
+PROBE_DELAYS = 9
+
+
+@dataclass(frozen=True)
+class GridPlan:
+    """Grille retenue et grandeurs qui l'ont fixée."""
+
+    Nt: int
+    Nt_min: int  # avant arrondi à next_fast_len
+    t_max: float  # fs, grille [-t_max, t_max]
+    pulse_extent: float  # fs, demi-largeur contenant l'impulsion
+    signal_band: float  # rad/fs, demi-largeur de bande du signal autour de sa porteuse
+    nyquist: float  # rad/fs, π/dt requis
+    baseband: bool
+
+    @property
+    def dt(self):
+        return 2 * self.t_max / (self.Nt - 1)
+
+    def __str__(self):
+        frame = "bande de base" if self.baseband else "avec porteuse"
+        return (f"Grille {frame} : Nt = {self.Nt} (min {self.Nt_min}), t_max = {self.t_max:g} fs, "
+                f"dt = {self.dt:.3g} fs ; impulsion ±{self.pulse_extent:.1f} fs, "
+                f"signal ±{self.signal_band:.2f} rad/fs, Nyquist ≥ {self.nyquist:.2f} rad/fs")
+
+
+def _half_width(axis, density, tol):
+    """Plus petite demi-largeur h telle que la part de `density` hors de [-h, h] soit ≤ tol."""
+    order = np.argsort(np.abs(axis))
+    cumulative = np.cumsum(density[order])
+    inside = np.searchsorted(cumulative, (1 - tol) * cumulative[-1])
+    return float(np.abs(axis[order[min(inside, len(axis) - 1)]]))
+
+
+def plan_grid(FWHM_t, phi2=0.0, phi3=0.0, separation=0.0, max_delay=0.0, signal="SHG", gate_FWHM_t=None,
+              cutoff=None, offset=0.0, baseband=False, omega_window=None, energy_tol=1e-6, alias_tol=1e-6,
+              omega_c=omega0, phi4=0.0, materials=()):
+    """
+    Grille la moins coûteuse pour une impulsion gaussienne (FWHM_t en fs) dispersée
+    (φ″, φ‴, φ⁗ en fs², fs³, fs⁴, épaisseurs `materials`), simple ou double,
+    décalée de `offset`, retardée jusqu'à ±max_delay.
+
+    `signal` : "SHG", "PG" ou "XFROG" (porte gaussienne transformée-limitée de
+    largeur gate_FWHM_t). `cutoff` : coupure passe-bas en rad/fs autour de la
+    porteuse. Avec `omega_window`, la fenêtre ω de la trace doit aussi tenir dans
+    la bande de Nyquist.
+    """
+    if signal == "XFROG" and gate_FWHM_t is None:
+        raise ValueError("XFROG nécessite la largeur de la porte (gate_FWHM_t)")
+    sigma = fwhm_to_sigma(FWHM_t)
+    band = erfcinv(alias_tol) / sigma
+    if cutoff is not None:
+        band = min(band, cutoff)
+    gate_band = erfcinv(alias_tol) / fwhm_to_sigma(gate_FWHM_t) if signal == "XFROG" else 2 * band
+    dispersion = Dispersion(phi2, phi3, phi4, materials)
+    # Retard de groupe maximal sur la bande : borne de l'étalement temporel
+    probe = np.linspace(-band, band, 257) + omega_c
+    group_delay = np.abs(np.gradient(spectral_phase(probe, dispersion, omega_c), probe)).max()
+    extent = erfcinv(energy_tol) * sigma + group_delay + separation / 2
+    if signal == "XFROG":
+        extent = max(extent, erfcinv(energy_tol) * fwhm_to_sigma(gate_FWHM_t))
+
+    # Grille d'essai en bande de base, assez large et fine pour ne rien tronquer
+    trial_nyquist = 1.5 * (band + gate_band)
+    trial_half = 2 * (extent + max_delay)
+    n_trial = next_fast_len(int(np.ceil(2 * trial_half * trial_nyquist / np.pi)) + 1)
+    t = np.linspace(-trial_half, trial_half, n_trial)
+    omega = 2 * np.pi * fftfreq(n_trial, d=t[1] - t[0])
+    # Même construction que compute_scenario en bande de base, phase appliquée en spectre
+    E_w = fft(to_baseband(build_pulse(t, FWHM_t, separation, omega_c), t, omega_c))
+    E_w *= dispersion_kernel(t, dispersion, omega_c, baseband=True)
+    if cutoff is not None:
+        E_w[np.abs(omega) > cutoff] = 0
+    E = ifft(E_w)
+    pulse_extent = _half_width(t, np.abs(E)**2, energy_tol)
+    if signal == "XFROG":
+        gate = np.exp(-t**2 / (2 * fwhm_to_sigma(gate_FWHM_t)**2))
+        pulse_extent = max(pulse_extent, _half_width(t, gate**2, energy_tol))
+
+    # Bande du signal FROG : pire cas sur quelques retards
+    delays = np.linspace(-max_delay, max_delay, PROBE_DELAYS) if max_delay else np.zeros(1)
+    gated = delay_fields(gate if signal == "XFROG" else E, t, delays)
+    spectra = np.abs(fft(E * gated if signal == "XFROG" else frog_signal(E, gated, signal), axis=1))**2
+    energies = spectra.sum(axis=1)
+    signal_band = max(_half_width(omega, s, alias_tol) for s, e in zip(spectra, energies)
+                      if e > 1e-6 * energies.max())
+
+    carrier = 0.0 if baseband else (omega_c if signal == "XFROG" else signal_carrier(signal, omega_c))
+    nyquist = max(signal_band + carrier, band + (0.0 if baseband else omega_c))
+    if omega_window is not None:
+        shift = signal_carrier(signal, omega_c) if baseband and signal in CARRIER_ORDER else 0.0
+        nyquist = max(nyquist, *(abs(w - shift) for w in omega_window))
+
+    t_max = float(np.ceil(pulse_extent + abs(offset) + max_delay))
+    Nt_min = int(np.ceil(2 * t_max * nyquist / np.pi)) + 1
+    return GridPlan(next_fast_len(Nt_min), Nt_min, t_max, pulse_extent, signal_band, nyquist, baseband)
+
+
+def plan_scenario(scenario, energy_tol=1e-6, alias_tol=1e-6):
+    """Scénario recalé sur la grille planifiée (Nt, t_max), et le GridPlan correspondant."""
+    plan = plan_grid(scenario.FWHM_t, scenario.phi2, scenario.phi3, phi4=scenario.phi4, materials=scenario.materials,
+                     separation=scenario.separation,
+                     max_delay=max(abs(d) for d in scenario.delays[:2]), signal=scenario.signal,
+                     baseband=scenario.baseband, omega_window=scenario.omega_window,
+                     energy_tol=energy_tol, alias_tol=alias_tol)
+    return replace(scenario, Nt=plan.Nt, t_max=plan.t_max), plan
@@ -0,0 +1,152 @@
+"""
+Instrumentation légère des étapes de calcul : temps réel, mémoire de pointe
+(tracemalloc) et profil cProfile optionnels, journal JSONL.
+
+    perf = Instrumentation(memory=True)
+    with perf.stage("trace"):
+        ...
+    perf.write_jsonl("frog_perf.jsonl", {"N": 2048})
+
+Les étapes peuvent s'imbriquer : le temps d'une étape inclut celui de ses
+sous-étapes, sa mémoire de pointe aussi. Un seul profileur peut être actif à la
+fois : seule l'étape la plus externe est profilée.
+
+tracemalloc est global au processus : il reste actif tant qu'au moins une
+Instrumentation(memory=True) est ouverte (compteur partagé), et les pics
+mesurés sont ceux du processus entier. Avec plusieurs sessions Streamlit en
+parallèle, le pic d'une étape inclut les allocations des autres sessions, et
+chacune remet à zéro le pic vu par les autres : les pics ne sont fiables que
+pour une session seule.
+"""
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+# Fonctions retenues dans le résumé cProfile (par temps cumulé)
+PROFILE_LINES = 15
+
+# Instrumentations ouvertes utilisant tracemalloc, et démarrage par ce module (sinon : par l'utilisateur)
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_tracing_started = False
+
+
+def _acquire_tracing():
+    global _tracing_users, _tracing_started
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing_started = True
+        _tracing_users += 1
+
+
+def _release_tracing():
+    global _tracing_users, _tracing_started
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _tracing_started:
+            tracemalloc.stop()
+            _tracing_started = False
+
+
+@dataclass
+class StageRecord:
+    name: str
+    depth: int  # niveau d'imbrication, 0 = étape externe
+    wall: float  # s
+    peak: int = None  # octets alloués au pic au-dessus de l'entrée, None sans tracemalloc
+    profile: str = None  # résumé pstats, étapes profilées seulement
+
+
+class Instrumentation:
+    """
+    Collecte des StageRecord d'une exécution (un rerun Streamlit, un script…).
+    Après close(), stage() ne mesure plus rien. Utilisable avec `with`, qui
+    ferme l'instrumentation même si une étape lève une exception.
+    """
+
+    def __init__(self, memory=False, profile=False):
+        self.memory = memory
+        self.profile = profile
+        self.records = []
+        self.closed = False
+        self._depth = 0
+        self._peaks = []  # pic absolu vu par chaque étape ouverte
+        self._profiling = False
+        if memory:
+            _acquire_tracing()
+
+    @contextmanager
+    def stage(self, name):
+        """Mesure le bloc `with` sous le nom `name`."""
+        if self.closed:
+            yield None
+            return
+        record = StageRecord(name, self._depth, 0.0)
+        # Enregistré dès l'entrée : les étapes apparaissent dans l'ordre d'appel
+        self.records.append(record)
+        profiler = None
+        if self.profile and not self._profiling:
+            profiler = cProfile.Profile()
+            self._profiling = True
+        if self.memory:
+            start, peak = tracemalloc.get_traced_memory()
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            tracemalloc.reset_peak()
+            self._peaks.append(start)
+        self._depth += 1
+        t0 = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield record
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            record.wall = time.perf_counter() - t0
+            self._depth -= 1
+            if self.memory:
+                peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+                record.peak = peak - start
+                # Le pic de l'étape englobante inclut celui-ci
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+            if profiler is not None:
+                self._profiling = False
+                out = io.StringIO()
+                pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_LINES)
+                record.profile = out.getvalue()
+
+    def summary(self):
+        """Étapes sous forme de dicts (nom, niveau, temps en ms, pic en Mo)."""
+        return [{"stage": r.name, "depth": r.depth, "wall_ms": 1e3 * r.wall,
+                 "peak_mb": None if r.peak is None else r.peak / 2**20} for r in self.records]
+
+    def write_jsonl(self, path, config=None):
+        """Ajoute une ligne JSON {horodatage, configuration, étapes} au journal `path`."""
+        line = {"time": datetime.now(timezone.utc).isoformat(timespec="seconds"), "config": config or {},
+                "stages": self.summary()}
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(line, default=str) + "\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Fin des mesures ; tracemalloc s'arrête avec la dernière Instrumentation qui l'utilise."""
+        if self.closed:
+            return
+        self.closed = True
+        if self.memory:
+            _release_tracing()
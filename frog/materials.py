@@ -0,0 +1,79 @@
+"""
+Indices de réfraction (équations de Sellmeier) des verres et cristaux non linéaires.
+
+Longueurs d'onde en µm. Deux formes :
+    "sellmeier" : n² = 1 + Σ Bᵢ λ² / (λ² - Cᵢ)
+    "uv_ir"     : n² = A + B / (λ² - C) + D λ² / (λ² - E) - F λ²
+Axes : "o"/"e" pour les cristaux uniaxes, "x"/"y"/"z" pour KTP (biaxe) ; le
+premier axe listé sert par défaut.
+"""
+import numpy as np
+
+from .pulse import c
+
+SELLMEIER = {
+    # Malitson (1965)
+    "SiO2": {"o": ("sellmeier", (0.6961663, 0.4079426, 0.8974794), (0.0684043**2, 0.1162414**2, 9.896161**2))},
+    # Schott N-BK7
+    "BK7": {"o": ("sellmeier", (1.03961212, 0.231792344, 1.01046945), (0.00600069867, 0.0200179144, 103.560653))},
+    # Eimerl et al. (1987)
+    "BBO": {
+        "o": ("uv_ir", (2.7359, 0.01878, 0.01822, 0.0, 0.0, 0.01354)),
+        "e": ("uv_ir", (2.3753, 0.01224, 0.01667, 0.0, 0.0, 0.01516)),
+    },
+    # Zernike (1964)
+    "KDP": {
+        "o": ("uv_ir", (2.259276, 0.01008956, 0.012942625, 13.00522, 400.0, 0.0)),
+        "e": ("uv_ir", (2.132668, 0.008637494, 0.012281043, 3.2279924, 400.0, 0.0)),
+    },
+    # LiNbO3 congruent
+    "LiNbO3": {
+        "o": ("uv_ir", (4.9048, 0.11768, 0.04750, 0.0, 0.0, 0.027169)),
+        "e": ("uv_ir", (4.5820, 0.099169, 0.04443, 0.0, 0.0, 0.02195)),
+    },
+    # Kato (1991)
+    "KTP": {
+        "x": ("uv_ir", (3.0065, 0.03901, 0.04251, 0.0, 0.0, 0.01327)),
+        "y": ("uv_ir", (3.0333, 0.04154, 0.04547, 0.0, 0.0, 0.01408)),
+        "z": ("uv_ir", (3.3134, 0.05694, 0.05658, 0.0, 0.0, 0.01682)),
+    },
+}
+
+# Domaine de validité commun des formules (µm), loin des pôles
+WAVELENGTH_RANGE = (0.3, 4.0)
+
+
+def _axis(material, axis):
+    try:
+        axes = SELLMEIER[material]
+    except KeyError:
+        raise ValueError(f"Matériau inconnu : {material} (connus : {', '.join(SELLMEIER)})") from None
+    if axis is None:
+        axis = next(iter(axes))
+    if axis not in axes:
+        raise ValueError(f"Axe {axis} inconnu pour {material} (axes : {', '.join(axes)})")
+    return axes[axis]
+
+
+def refractive_index(material, wavelength, axis=None):
+    """Indice n(λ) de `material` selon `axis`, λ en µm (borné à WAVELENGTH_RANGE)."""
+    form, *coefficients = _axis(material, axis)
+    l2 = np.clip(np.asarray(wavelength, dtype=np.float64), *WAVELENGTH_RANGE)**2
+    if form == "sellmeier":
+        B, C = coefficients
+        n2 = 1 + sum(b * l2 / (l2 - c_) for b, c_ in zip(B, C))
+    else:
+        A, B, C, D, E, F = coefficients[0]
+        n2 = A + B / (l2 - C) + (D * l2 / (l2 - E) if D else 0.0) - F * l2
+    return np.sqrt(n2)
+
+
+def omega_to_wavelength(omega):
+    """λ (µm) de la pulsation ω (rad/fs)."""
+    with np.errstate(divide="ignore"):
+        return 2 * np.pi * c / np.abs(np.asarray(omega, dtype=np.float64)) * 1e-3
+
+
+def material_phase(material, length_mm, omega, axis=None):
+    """Phase spectrale k(ω)·L = n(ω) ω L / c (rad) d'une épaisseur `length_mm` de matériau."""
+    return refractive_index(material, omega_to_wavelength(omega), axis) * np.asarray(omega) * length_mm * 1e6 / c
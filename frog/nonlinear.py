@@ -0,0 +1,15 @@
+import numpy as np
+
+# Signal non linéaire en fonction du champ et de sa copie retardée
+SIGNALS = {
+    "SHG": lambda E, E_delayed: E * E_delayed,
+    "PG": lambda E, E_delayed: E * np.abs(E_delayed)**2,
+}
+
+
+def frog_signal(E, E_delayed, signal="SHG"):
+    """Signal FROG E(t)·E(t - τ) (SHG) ou E(t)·|E(t - τ)|² (PG)."""
+    try:
+        return SIGNALS[signal](E, E_delayed)
+    except KeyError:
+        raise ValueError(f"Signal FROG inconnu : {signal}") from None
@@ -0,0 +1,18 @@
+import matplotlib.pyplot as plt
+
+from .render import show_trace
+
+
+def plot_trace(delays, omega, trace, title="", figsize=(3, 3), cmap="jet", dpi=None):
+    """Figure d'une trace (retard, ω) au format des scripts Frog1–Frog6, réduite à `dpi`."""
+    fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+    view = show_trace(ax, delays, omega, trace, cmap=cmap)
+    ax.set_xlabel(r'$\tau$ [fs]')
+    ax.set_ylabel(r'$\omega$ [rad/fs]')
+    ax.set_xlim(delays[0], delays[-1])
+    ax.set_ylim(omega[0], omega[-1])
+    if title:
+        ax.set_title(title, fontsize="medium")
+    fig.tight_layout()
+    view.update()
+    return fig
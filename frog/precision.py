@@ -0,0 +1,41 @@
+"""
+Précision de calcul des traces.
+
+"double" : complex128/float64 (par défaut). "single" : complex64/float32, deux fois
+moins de mémoire et des FFT environ deux fois plus rapides. Les fonctions internes
+suivent le type du champ qu'on leur passe ; la précision se choisit à l'entrée
+(compute_trace, Scenario.precision, barre latérale de FROG.py).
+
+Écart mesuré entre les deux modes, max |I_single - I_double| / max I_double
+(max_relative_error) : ≤ 1e-6 sur les six scénarios de scenarios/reference.json
+et sur les traces de FROG.py pour N = 256…2048 (SHG, PG, XFROG), soit deux
+ordres de grandeur sous la tolérance visée SINGLE_RTOL (tests/test_precision.py).
+"""
+import numpy as np
+
+PRECISIONS = {
+    "double": (np.float64, np.complex128),
+    "single": (np.float32, np.complex64),
+}
+
+# Erreur relative maximale admise en simple précision (par rapport au pic de la trace)
+SINGLE_RTOL = 1e-4
+
+
+def dtypes(precision="double"):
+    """Types (réel, complexe) associés à une précision."""
+    try:
+        return PRECISIONS[precision]
+    except KeyError:
+        raise ValueError(f"Précision inconnue : {precision} (choix : {', '.join(PRECISIONS)})") from None
+
+
+def real_dtype(dtype):
+    """Type réel du calcul pour un champ de ce type (float32 pour complex64/float32)."""
+    return np.finfo(np.result_type(dtype, np.complex64)).dtype
+
+
+def max_relative_error(trace, reference):
+    """max |trace - référence| / max |référence|, le critère de SINGLE_RTOL."""
+    reference = np.asarray(reference, dtype=np.float64)
+    return np.abs(np.asarray(trace, dtype=np.float64) - reference).max() / np.abs(reference).max()
@@ -0,0 +1,36 @@
+from functools import lru_cache
+
+import numpy as np
+
+# Constantes
+c = 299.792458  # nm/fs
+lambda0 = 800  # nm
+nu0 = c / lambda0  # PHz
+omega0 = 2 * np.pi * nu0  # rad/fs
+
+
+def fwhm_to_sigma(FWHM_t):
+    """Écart-type temporel du champ gaussien exp(-t²/2σ²) de largeur FWHM_t."""
+    return FWHM_t / (2 * np.sqrt(2 * np.log(2)))
+
+
+@lru_cache(maxsize=None)
+def time_grid(Nt, t_max):
+    """Grille temporelle [-t_max, t_max] (fs), partagée entre scénarios identiques."""
+    t = np.linspace(-t_max, t_max, Nt)
+    t.setflags(write=False)
+    return t
+
+
+def gaussian_pulse(t, FWHM_t, center=0.0, omega_c=omega0):
+    """Impulsion gaussienne transformée-limitée centrée en `center`, porteuse ω_c."""
+    tau = fwhm_to_sigma(FWHM_t)
+    return np.exp(-(t - center)**2 / (2 * tau**2)) * np.exp(1j * omega_c * (t - center))
+
+
+def build_pulse(t, FWHM_t, separation=0.0, omega_c=omega0):
+    """Impulsion simple, ou double (superposition cohérente) si `separation` > 0."""
+    if separation == 0:
+        return gaussian_pulse(t, FWHM_t, omega_c=omega_c)
+    half = separation / 2
+    return gaussian_pulse(t, FWHM_t, half, omega_c) + gaussian_pulse(t, FWHM_t, -half, omega_c)
@@ -0,0 +1,138 @@
+"""
+Affichage à niveau de détail des traces : réduction au nombre de pixels de l'axe.
+
+Une trace (retard, ω) est réduite par blocs (max, qui conserve les pics, ou
+moyenne) jusqu'à la taille de l'axe en pixels, puis affichée avec imshow :
+le coût d'affichage ne dépend plus de N. TraceView relit la zone visible de la
+trace stockée (tableau, np.memmap ou dataset HDF5) à chaque zoom, à la
+résolution de l'écran. Axes supposés uniformes, comme ceux de omega_axis.
+"""
+import numpy as np
+
+POOLING = ("max", "mean")
+BLOCK = 256
+
+
+def _reduce(array, factor, axis, mode):
+    if factor == 1:
+        return array
+    n = array.shape[axis]
+    full = n - n % factor
+    # Blocs complets par reshape (réduction contiguë, bien plus rapide que reduceat)
+    blocks = np.moveaxis(array, axis, 0)[:full]
+    blocks = blocks.reshape((full // factor, factor) + blocks.shape[1:])
+    reduced = [blocks.max(axis=1) if mode == "max" else blocks.mean(axis=1)]
+    if full < n:
+        tail = np.moveaxis(array, axis, 0)[full:]
+        reduced.append((tail.max(axis=0) if mode == "max" else tail.mean(axis=0))[np.newaxis])
+    return np.moveaxis(np.concatenate(reduced), 0, axis).astype(array.dtype, copy=False)
+
+
+def pooling_factors(shape, max_shape):
+    """Facteurs de réduction entiers pour que `shape` tienne dans `max_shape`."""
+    return tuple(max(1, -(-n // m)) for n, m in zip(shape, max_shape))
+
+
+def pool(trace, factors, mode="max"):
+    """Réduction par blocs factors[0] × factors[1] (dernier bloc éventuellement incomplet)."""
+    if mode not in POOLING:
+        raise ValueError(f"Réduction inconnue : {mode} (attendu : {', '.join(POOLING)})")
+    trace = np.asarray(trace)
+    return _reduce(_reduce(trace, factors[0], 0, mode), factors[1], 1, mode)
+
+
+def pool_axis(axis, factor):
+    """Centres des blocs d'un axe réduit d'un facteur `factor`."""
+    return _reduce(np.asarray(axis, dtype=np.float64), factor, 0, "mean")
+
+
+def pooled_region(source, rows, cols, max_shape, mode="max", block=BLOCK):
+    """
+    Zone source[rows, cols] réduite à max_shape, lue par blocs de lignes : la
+    mémoire de pointe ne dépend que de `block`. Retourne (zone, facteurs).
+    """
+    factors = pooling_factors((rows.stop - rows.start, cols.stop - cols.start), max_shape)
+    step = max(1, block // factors[0]) * factors[0]
+    parts = [pool(source[start:min(start + step, rows.stop), cols], factors, mode)
+             for start in range(rows.start, rows.stop, step)]
+    return np.concatenate(parts), factors
+
+
+def decimate(delays, omega, trace, max_shape=(1024, 1024), mode="max"):
+    """(retards, ω, trace) réduits pour tenir dans max_shape = (n_retards, n_ω)."""
+    factors = pooling_factors(np.shape(trace), max_shape)
+    return pool_axis(delays, factors[0]), pool_axis(omega, factors[1]), pool(trace, factors, mode)
+
+
+def decimate_curve(x, y, n_pixels):
+    """Courbe réduite à `n_pixels` colonnes : enveloppe min/max de chaque colonne."""
+    y = np.asarray(y)
+    factor = max(1, -(-len(y) // n_pixels))
+    if factor <= 2:
+        return x, y
+    starts = np.arange(0, len(y), factor)
+    x_pool = pool_axis(x, factor)
+    return np.repeat(x_pool, 2), np.column_stack([np.minimum.reduceat(y, starts),
+                                                  np.maximum.reduceat(y, starts)]).ravel()
+
+
+def _step(axis):
+    return axis[1] - axis[0] if len(axis) > 1 else 1.0
+
+
+class TraceView:
+    """
+    Trace (retard, ω) affichée dans `ax` à la résolution de l'axe.
+
+    Après un zoom, un déplacement ou un redimensionnement, seule la zone visible
+    de `source` est relue et réduite.
+    """
+
+    def __init__(self, ax, delays, omega, source, mode="max", cmap="jet", **imshow_kw):
+        self.ax = ax
+        self.delays = np.asarray(delays)
+        self.omega = np.asarray(omega)
+        self.source = source
+        self.mode = mode
+        self.image = ax.imshow(np.zeros((1, 1)), origin="lower", aspect="auto", interpolation="nearest",
+                               cmap=cmap, **imshow_kw)
+        dx, dy = _step(self.delays), _step(self.omega)
+        ax.set_xlim(self.delays[0] - dx / 2, self.delays[-1] + dx / 2)
+        ax.set_ylim(self.omega[0] - dy / 2, self.omega[-1] + dy / 2)
+        ax.set_autoscale_on(False)
+        self.update()
+        self.image.set_clim(self.image.get_array().min(), self.image.get_array().max())
+        # Fonctions plutôt que méthodes liées : Matplotlib garde alors une référence forte
+        ax.callbacks.connect("xlim_changed", lambda _: self._on_change())
+        ax.callbacks.connect("ylim_changed", lambda _: self._on_change())
+        ax.figure.canvas.mpl_connect("resize_event", lambda _: self._on_change())
+
+    def pixel_budget(self):
+        """Taille de l'axe en pixels (largeur → retards, hauteur → ω)."""
+        bbox = self.ax.get_window_extent()
+        return max(1, int(bbox.width)), max(1, int(bbox.height))
+
+    def _visible(self, axis, limits):
+        lo, hi = sorted(limits)
+        start = max(0, np.searchsorted(axis, lo, "right") - 1)
+        stop = min(len(axis), np.searchsorted(axis, hi, "left") + 1)
+        return slice(start, max(stop, start + 1))
+
+    def update(self):
+        """Relit et réduit la zone visible de la trace."""
+        rows = self._visible(self.delays, self.ax.get_xlim())
+        cols = self._visible(self.omega, self.ax.get_ylim())
+        tile, _ = pooled_region(self.source, rows, cols, self.pixel_budget(), self.mode)
+        dx, dy = _step(self.delays), _step(self.omega)
+        self.image.set_data(tile.T)
+        self.image.set_extent((self.delays[rows.start] - dx / 2, self.delays[rows.stop - 1] + dx / 2,
+                               self.omega[cols.start] - dy / 2, self.omega[cols.stop - 1] + dy / 2))
+
+    def _on_change(self):
+        self.update()
+        self.ax.figure.canvas.draw_idle()
+
+
+def show_trace(ax, delays, omega, trace, mode="max", cmap="jet", **imshow_kw):
+    """Remplace pcolormesh(delays, omega, trace.T) : image réduite, re-échantillonnée au zoom."""
+    return TraceView(ax, delays, omega, trace, mode, cmap, **imshow_kw)
@@ -0,0 +1,123 @@
+"""
+Reconstruction FROG par projections généralisées en composantes principales (PCGPA).
+
+Conventions de frog.trace.compute_trace : trace (fréquence, retard) de forme (N, N),
+retard = grille temporelle circulaire, ligne i de la matrice de signal
+S[i, k] = E[k] · gate[(k - i + N//2) mod N]. La même matrice d'indices relie S
+au produit extérieur O[k, j] = E[k] · gate[j] sur lequel opère la méthode des
+puissances (Kane, IEEE JSTQE 1999).
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.fft import fft, ifft
+
+from .trace import _shift_modulation, compute_trace, gate_matrix, unfold_trace
+
+RETRIEVAL_METHODS = ("SHG-FROG", "PG-FROG")
+
+
+@dataclass
+class RetrievalResult:
+    field: np.ndarray  # champ E(t) reconstruit, normalisé à max |E| = 1
+    gate: np.ndarray  # gate reconstruite (E pour SHG, |E|² pour PG)
+    trace: np.ndarray  # trace calculée à partir du champ reconstruit
+    errors: np.ndarray  # erreur FROG G à chaque itération
+    seed: int
+
+    @property
+    def error(self):
+        return self.errors[-1]
+
+
+def frog_error(measured, computed):
+    """Erreur FROG G = sqrt(moyenne((I_mes - μ I_calc)²)), μ optimal, I_mes normalisée."""
+    measured = measured / measured.max()
+    mu = np.vdot(computed, measured).real / np.vdot(computed, computed).real
+    return np.sqrt(np.mean((measured - mu * computed)**2))
+
+
+def _outer_index(N):
+    # Position à plat de S[i, k] dans le produit extérieur O[k, j], j = (k - i + N//2) mod N
+    i, k = np.indices((N, N))
+    return k * N + (k - i + N // 2) % N
+
+
+def initial_guess(N, seed):
+    """Départ aléatoire : enveloppe gaussienne large et phase aléatoire lissée."""
+    rng = np.random.default_rng(seed)
+    x = np.linspace(-1, 1, N)
+    phase = np.convolve(rng.standard_normal(N), np.ones(N // 16) / (N // 16), mode="same")
+    return np.exp(-x**2 / 0.1) * np.exp(1j * 2 * np.pi * phase) * (1 + 0.1 * rng.standard_normal(N))
+
+
+def pcgpa(trace, method="SHG-FROG", max_iter=300, tol=1e-6, seed=0, E0=None):
+    """
+    Une reconstruction PCGPA à partir d'un départ aléatoire (ou du champ E0).
+
+    `trace` : trace mesurée (fréquence, retard) au format de compute_trace, ou sa
+    demi-trace SHG-FROG (N, N//2 + 1) de compute_trace(..., half=True).
+    L'itération s'arrête après `max_iter` itérations ou quand G varie de moins de `tol`.
+    """
+    if method not in RETRIEVAL_METHODS:
+        raise ValueError(f"Reconstruction non disponible pour {method}")
+    N = trace.shape[0]
+    if method == "SHG-FROG" and trace.shape[1] == N // 2 + 1 != N:
+        trace = unfold_trace(trace, N, axis=1, circular=True)
+    measured = np.maximum(trace.T, 0) / trace.max()
+    amplitude = np.sqrt(measured)
+    modulation = _shift_modulation(N)
+    flat = _outer_index(N)
+
+    E = initial_guess(N, seed) if E0 is None else np.asarray(E0, dtype=complex)
+    gate = E if method == "SHG-FROG" else np.abs(E)**2
+    errors = []
+    for _ in range(max_iter):
+        # Contrainte d'intensité sur la matrice de signal
+        spectrum = fft(E * modulation * gate_matrix(gate), axis=1)
+        magnitude = np.abs(spectrum)
+        errors.append(frog_error(measured, magnitude**2))
+        if len(errors) > 1 and abs(errors[-2] - errors[-1]) < tol:
+            break
+        spectrum *= amplitude / np.maximum(magnitude, np.finfo(float).tiny)
+        signal = ifft(spectrum, axis=1, overwrite_x=True) * np.conj(modulation)
+
+        # Produit extérieur puis une itération de la méthode des puissances
+        O = np.empty(N * N, dtype=complex)
+        O[flat] = signal
+        O = O.reshape(N, N)
+        E = O @ np.conj(np.conj(E) @ O)  # O·Oᴴ·E
+        E /= np.abs(E).max()
+        if method == "SHG-FROG":
+            gate = np.conj(O @ np.conj(gate)) @ O  # Oᵀ·O*·gate
+            gate /= np.abs(gate).max()
+        else:
+            gate = np.abs(E)**2
+    return E, gate, np.array(errors)
+
+
+def _retrieve_one(args):
+    trace, method, max_iter, tol, seed = args
+    return seed, pcgpa(trace, method, max_iter, tol, seed)
+
+
+def retrieve(trace, method="SHG-FROG", n_starts=4, max_iter=300, tol=1e-6, seed=0, processes=None):
+    """
+    Reconstruction multi-départs : `n_starts` PCGPA indépendantes (graines seed, seed+1, …)
+    réparties sur un pool de processus, et renvoie le RetrievalResult de plus faible G.
+    `processes=1` exécute tout dans le processus courant.
+    """
+    trace = np.asarray(trace, dtype=float)
+    tasks = [(trace, method, max_iter, tol, seed + n) for n in range(n_starts)]
+    if processes is None:
+        processes = min(n_starts, os.cpu_count() or 1)
+    if processes == 1:
+        runs = list(map(_retrieve_one, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            runs = list(pool.map(_retrieve_one, tasks))
+
+    best_seed, (E, gate, errors) = min(runs, key=lambda run: run[1][2][-1])
+    return RetrievalResult(E, gate, compute_trace(E, method), errors, best_seed)
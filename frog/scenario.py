@@ -0,0 +1,147 @@
+import json
+from dataclasses import asdict, dataclass, fields, replace
+from functools import lru_cache
+
+import numpy as np
+from scipy.fft import fftfreq
+
+from .baseband import baseband_window, signal_carrier, to_baseband
+from .delay import phase_ramp
+from .dispersion import Dispersion, apply_dispersion
+from .precision import dtypes, max_relative_error
+from .pulse import build_pulse, time_grid
+from .spectrum import omega_axis
+from .trace import delay_trace
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Paramètres d'une trace de référence (un script Frog1–Frog6 = un scénario)."""
+
+    name: str = "frog"
+    signal: str = "SHG"  # "SHG" : E·E(t-τ), "PG" : E·|E(t-τ)|²
+    FWHM_t: float = 10.0  # fs
+    phi2: float = 0.0  # fs²
+    phi3: float = 0.0  # fs³
+    phi4: float = 0.0  # fs⁴
+    materials: tuple = ()  # ((matériau, longueur en mm), ...), voir frog.materials
+    separation: float = 0.0  # fs, 0 = impulsion simple
+    Nt: int = 2048
+    t_max: float = 200.0  # fs
+    delays: tuple = (-75.0, 75.0, 500)  # (min, max, nombre) en fs
+    omega_window: tuple = (3.0, 6.0)  # rad/fs
+    n_omega: int = None  # points en ω ; None = bins natifs de la FFT
+    precision: str = "double"  # "single" : complex64/float32
+    baseband: bool = False  # enveloppe sans porteuse, grille Nt réduite possible
+    title: str = ""
+
+    @classmethod
+    def from_dict(cls, params):
+        known = {f.name for f in fields(cls)}
+        unknown = set(params) - known
+        if unknown:
+            raise ValueError(f"Paramètres de scénario inconnus : {sorted(unknown)}")
+        params = {k: _tuples(v) for k, v in params.items()}
+        return cls(**params)
+
+    @property
+    def dispersion(self):
+        return Dispersion(self.phi2, self.phi3, self.phi4, self.materials)
+
+
+def _tuples(value):
+    """Listes JSON (éventuellement imbriquées) → tuples hachables."""
+    return tuple(_tuples(v) for v in value) if isinstance(value, list) else value
+
+
+def load_scenarios(path):
+    """
+    Lit un fichier JSON de scénarios :
+    {"defaults": {...}, "scenarios": [{"name": ..., ...}, ...]}.
+    """
+    with open(path, encoding="utf-8") as f:
+        config = json.load(f)
+    defaults = config.get("defaults", {})
+    return [Scenario.from_dict({**defaults, **params}) for params in config["scenarios"]]
+
+
+@lru_cache(maxsize=8)
+def delay_grid(Nt, t_max, delays, precision="double"):
+    """Retards et matrice de rampes de phase, partagés par les scénarios de même grille."""
+    t = time_grid(Nt, t_max)
+    tau = np.linspace(*delays[:2], int(delays[2]))
+    omega = 2 * np.pi * fftfreq(Nt, d=t[1] - t[0])
+    ramp = phase_ramp(omega, tau).astype(dtypes(precision)[1])
+    tau.setflags(write=False)
+    ramp.setflags(write=False)
+    return tau, ramp
+
+
+def scenario_omega(scenario, t=None):
+    """
+    (fenêtre ω du calcul, axe ω de la trace) d'un scénario. En bande de base, la
+    fenêtre est ramenée autour de 0 et la porteuse du signal rajoutée sur l'axe.
+    """
+    if t is None:
+        t = time_grid(scenario.Nt, scenario.t_max)
+    if not scenario.baseband:
+        return scenario.omega_window, omega_axis(t, scenario.omega_window, scenario.n_omega)
+    window = baseband_window(t, scenario.signal, scenario.omega_window)
+    return window, omega_axis(t, window, scenario.n_omega) + signal_carrier(scenario.signal)
+
+
+def compute_scenario(scenario, workers=None, cache=None):
+    """
+    Retourne (retards, ω recadré, trace recadrée) pour un scénario.
+
+    Avec un TraceCache, les traces déjà calculées sont relues depuis le disque.
+    """
+    if cache is not None:
+        params = {k: v for k, v in asdict(scenario).items() if k not in ("name", "title")}
+        arrays = cache.get_or_compute(params, lambda: dict(zip(
+            ("delays", "omega", "trace"), compute_scenario(scenario, workers))))
+        return arrays["delays"], arrays["omega"], arrays["trace"]
+
+    t = time_grid(scenario.Nt, scenario.t_max)
+
+    # Bande de base : enveloppe seule (référentiel tournant à ω₀), porteuse du
+    # signal rajoutée sur l'axe ω uniquement
+    omega_window, omega_crop = scenario_omega(scenario, t)
+
+    E = build_pulse(t, scenario.FWHM_t, scenario.separation)
+    if scenario.baseband:
+        # Démodulation analytique : garde la phase de porteuse propre à chaque impulsion
+        E = to_baseband(E, t)
+    E = E.astype(dtypes(scenario.precision)[1])
+    if not scenario.dispersion.is_zero():
+        E = apply_dispersion(E, t, scenario.dispersion, baseband=scenario.baseband)
+
+    # Spectre évalué seulement sur la plage utile en ω
+    delays, ramp = delay_grid(scenario.Nt, scenario.t_max, scenario.delays, scenario.precision)
+    frog_crop = delay_trace(E, t, delays, scenario.signal, workers=workers, ramp=ramp,
+                            omega_window=omega_window, n_omega=scenario.n_omega)
+    return delays, omega_crop, frog_crop
+
+
+def baseband_error(scenario, Nt=None, n_omega=256, reference_Nt=None, reference_t_max=None):
+    """
+    Écart relatif max entre la trace en bande de base sur Nt points (défaut : Nt
+    du scénario) et la trace avec porteuse sur la grille de référence
+    (reference_Nt, reference_t_max ; défaut : grille du scénario), évaluées aux
+    mêmes `n_omega` fréquences. Traces normalisées à leur maximum : la somme de
+    la FFT varie comme 1/dt. Une grille planifiée en bande de base est en général
+    trop grossière pour la porteuse : passer alors une grille de référence fine.
+    """
+    reference = replace(scenario, baseband=False, n_omega=n_omega, Nt=reference_Nt or scenario.Nt,
+                        t_max=reference_t_max or scenario.t_max)
+    t = time_grid(reference.Nt, reference.t_max)
+    nyquist = np.pi / (t[1] - t[0])
+    if nyquist <= max(scenario.omega_window):
+        raise ValueError(f"Grille de référence trop grossière pour la porteuse : Nyquist {nyquist:.2f} rad/fs "
+                         f"≤ {max(scenario.omega_window):g} rad/fs (augmenter reference_Nt)")
+    envelope = replace(scenario, baseband=True, Nt=Nt or scenario.Nt, n_omega=n_omega)
+    _, omega_ref, trace_ref = compute_scenario(reference)
+    _, omega_env, trace_env = compute_scenario(envelope)
+    if not np.allclose(omega_ref, omega_env):
+        raise ValueError("Axes ω différents entre les deux représentations")
+    return max_relative_error(trace_env / trace_env.max(), trace_ref / trace_ref.max())
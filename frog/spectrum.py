@@ -0,0 +1,49 @@
+from functools import lru_cache
+
+import numpy as np
+from scipy.fft import fft, fftfreq, fftshift
+from scipy.signal import ZoomFFT
+
+
+@lru_cache(maxsize=16)
+def _evaluator(N, dt, omega_window, n_omega):
+    omega = fftshift(2 * np.pi * fftfreq(N, d=dt))
+    if omega_window is None:
+        return omega, lambda signal, workers: fftshift(fft(signal, axis=1, workers=workers), axes=1)
+
+    omega_min, omega_max = omega_window
+    if n_omega is None:
+        # Résolution native : FFT complète puis découpe des seuls bins de la fenêtre
+        inside = np.flatnonzero((omega >= omega_min) & (omega <= omega_max))
+        if inside.size == 0:
+            raise ValueError(f"Aucune fréquence de la grille dans [{omega_min}, {omega_max}] rad/fs")
+        crop = slice(inside[0], inside[-1] + 1)
+        return omega[crop], lambda signal, workers: fftshift(fft(signal, axis=1, workers=workers), axes=1)[:, crop]
+
+    # Résolution imposée : zoom FFT (chirp-z) évaluée uniquement sur la fenêtre
+    zoom = ZoomFFT(N, [omega_min / (2 * np.pi), omega_max / (2 * np.pi)], m=n_omega, fs=1 / dt, endpoint=True)
+    return np.linspace(omega_min, omega_max, n_omega), lambda signal, workers: zoom(signal, axis=1)
+
+
+def spectral_evaluator(t, omega_window=None, n_omega=None):
+    """
+    Axe ω (rad/fs) et fonction signal → spectre complexe (ligne par ligne).
+
+    Sans fenêtre : spectre complet centré (fftshift). Avec `omega_window` seul :
+    bins natifs de la FFT compris dans la fenêtre. Avec `n_omega` : `n_omega` points
+    régulièrement espacés sur la fenêtre, calculés par zoom FFT (scipy.signal.ZoomFFT).
+
+    La fenêtre réduit la trace et tout ce qui suit la FFT (module au carré,
+    stockage) en proportion, pas la FFT elle-même : les bins natifs viennent
+    d'une FFT complète de longueur N. La zoom FFT coûte deux FFT de longueur
+    N + n_omega, soit environ deux fois plus : elle ne sert qu'aux résolutions
+    qui ne tombent pas sur la grille native, jamais par défaut.
+    """
+    if omega_window is not None:
+        omega_window = tuple(float(w) for w in omega_window)
+    return _evaluator(len(t), float(t[1] - t[0]), omega_window, n_omega)
+
+
+def omega_axis(t, omega_window=None, n_omega=None):
+    """Axe ω (rad/fs) de la trace renvoyée par spectral_evaluator / delay_trace."""
+    return spectral_evaluator(t, omega_window, n_omega)[0]
@@ -0,0 +1,130 @@
+"""
+Génération hors mémoire des traces vers un stockage sur disque.
+
+Les traces sont produites par blocs de retards et écrites directement dans un
+fichier .npy ouvert en np.memmap, ou dans un dataset HDF5 découpé en blocs
+(h5py, dépendance optionnelle). La mémoire de pointe ne dépend que de la
+taille de bloc, pas du nombre de retards. Disposition commune : (retard, fréquence).
+"""
+import json
+import os
+
+import numpy as np
+
+from .spectrum import omega_axis
+from .trace import compute_trace, delay_trace, symmetric_delays
+
+BLOCK = 256
+
+
+def _is_hdf5(path):
+    return os.path.splitext(path)[1] in (".h5", ".hdf5")
+
+
+def _axes_path(path):
+    return os.path.splitext(path)[0] + ".axes.npz"
+
+
+def delay_trace_blocks(E, t, delays, signal="SHG", block=BLOCK, workers=None, omega_window=None, n_omega=None):
+    """Blocs (début, fin, trace) de delay_trace, rampes de phase calculées bloc par bloc."""
+    for start in range(0, len(delays), block):
+        stop = min(start + block, len(delays))
+        yield start, stop, delay_trace(E, t, delays[start:stop], signal, workers=workers,
+                                       omega_window=omega_window, n_omega=n_omega)
+
+
+def circular_trace_blocks(E_t, method="SHG-FROG", reference=None, block=BLOCK, workers=None, rows=None):
+    """Blocs (début, fin, trace) de compute_trace sur `rows` (tous les retards par défaut), en disposition (retard, fréquence)."""
+    rows = np.arange(len(E_t)) if rows is None else np.asarray(rows)
+    for start in range(0, len(rows), block):
+        stop = min(start + block, len(rows))
+        yield start, stop, compute_trace(E_t, method, reference, workers=workers, rows=rows[start:stop]).T
+
+
+def write_trace(path, blocks, delays, omega, dtype=np.float64, attrs=None):
+    """
+    Écrit les blocs d'un générateur *_trace_blocks dans `path`.
+
+    `.h5`/`.hdf5` : dataset "trace" découpé en blocs, axes "delays" et "omega",
+    `attrs` en attributs. Sinon : fichier .npy écrit en memmap, axes et attributs
+    dans <nom>.axes.npz à côté.
+    """
+    shape = (len(delays), len(omega))
+    attrs = attrs or {}
+    if _is_hdf5(path):
+        try:
+            import h5py
+        except ImportError:
+            raise ImportError("L'écriture HDF5 nécessite h5py (pip install h5py)") from None
+        with h5py.File(path, "w") as f:
+            dataset = f.create_dataset("trace", shape=shape, dtype=dtype,
+                                       chunks=(min(BLOCK, shape[0]), shape[1]))
+            f["delays"] = delays
+            f["omega"] = omega
+            f.attrs.update(attrs)
+            for start, stop, trace in blocks:
+                dataset[start:stop] = trace
+        return
+
+    store = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+    for start, stop, trace in blocks:
+        store[start:stop] = trace
+    store.flush()
+    del store
+    np.savez(_axes_path(path), delays=delays, omega=omega, attrs=json.dumps(attrs))
+
+
+def write_delay_trace(path, E, t, delays, signal="SHG", block=BLOCK, dtype=np.float64, workers=None,
+                      omega_window=None, n_omega=None, attrs=None, half=False):
+    """
+    Trace Frog1–Frog6 écrite par blocs de retards, sans tenir la trace entière en mémoire.
+    `half` (SHG, retards symétriques) : seuls les retards delays[len // 2:] sont écrits.
+    """
+    omega = omega_axis(t, omega_window, n_omega)
+    attrs = attrs or {}
+    if half:
+        if signal != "SHG" or not symmetric_delays(delays):
+            raise ValueError("Demi-trace : signal SHG et retards symétriques autour de 0 requis")
+        delays = np.asarray(delays)[len(delays) // 2:]
+        attrs = {**attrs, "half": True}
+    blocks = delay_trace_blocks(E, t, delays, signal, block, workers, omega_window, n_omega)
+    write_trace(path, blocks, delays, omega, dtype, attrs)
+
+
+def write_circular_trace(path, E_t, t, method="SHG-FROG", reference=None, block=BLOCK, dtype=np.float64,
+                         workers=None, attrs=None, half=False):
+    """
+    Trace de FROG.py (retards = grille temporelle circulaire) écrite par blocs.
+    `half` (SHG-FROG) : seuls les retards τ = 0 … N//2 · dt sont écrits, voir unfold_trace.
+    """
+    attrs = {"method": method, **(attrs or {})}
+    delays, rows = np.asarray(t), None
+    if half:
+        if method != "SHG-FROG":
+            raise ValueError("Demi-trace : SHG-FROG uniquement")
+        N = len(E_t)
+        rows = (np.arange(N // 2 + 1) + N // 2) % N
+        delays = np.arange(N // 2 + 1) * (t[1] - t[0])
+        attrs["half"] = True
+    blocks = circular_trace_blocks(E_t, method, reference, block, workers, rows)
+    write_trace(path, blocks, delays, omega_axis(t), dtype, attrs)
+
+
+def read_decimated(path, max_delays=1024, max_omega=1024):
+    """
+    Sous-ensemble décimé (un retard / une fréquence sur k) d'une trace stockée :
+    seules les lignes retenues sont lues sur le disque. Retourne (retards, ω, trace).
+    """
+    if _is_hdf5(path):
+        import h5py
+        with h5py.File(path, "r") as f:
+            dataset = f["trace"]
+            step_d = max(1, -(-dataset.shape[0] // max_delays))
+            step_w = max(1, -(-dataset.shape[1] // max_omega))
+            return f["delays"][::step_d], f["omega"][::step_w], dataset[::step_d, ::step_w]
+
+    store = np.load(path, mmap_mode="r")
+    axes = np.load(_axes_path(path))
+    step_d = max(1, -(-store.shape[0] // max_delays))
+    step_w = max(1, -(-store.shape[1] // max_omega))
+    return axes["delays"][::step_d], axes["omega"][::step_w], np.array(store[::step_d, ::step_w])
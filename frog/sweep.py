@@ -0,0 +1,229 @@
+"""
+Balayage de paramètres → atlas de traces FROG.
+
+    python -m frog.sweep scenarios/sweep_example.json -o atlas.npy [--processes 4]
+
+Le fichier de configuration donne un scénario de base et les valeurs à balayer :
+{"base": {...}, "grid": {"phi2": [0, 100, 200], "signal": ["SHG", "PG"], ...}}.
+Seuls les paramètres qui ne changent pas la forme de la trace peuvent varier
+(FWHM_t, phi2, phi3, phi4, separation, signal) : la grille temporelle, les retards et leurs
+rampes de phase sont calculés une fois par processus et partagés par tous les points.
+
+L'atlas est un tableau (point, retard, ω) : fichier .npy en memmap accompagné de
+<nom>.index.json (paramètres de chaque point, points terminés, axes), ou fichier
+HDF5 unique (.h5) si h5py est installé. Un balayage interrompu reprend là où il
+s'était arrêté en relançant la même commande.
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, replace
+
+import numpy as np
+
+from .precision import dtypes
+from .scenario import Scenario, compute_scenario, delay_grid, scenario_omega
+
+SWEEPABLE = ("FWHM_t", "phi2", "phi3", "phi4", "separation", "signal")
+
+# Sauvegarde de l'index (points terminés) au plus toutes les FLUSH_EVERY secondes
+FLUSH_EVERY = 5.0
+
+
+def expand_grid(base, grid):
+    """Liste des scénarios du produit cartésien des valeurs de `grid` appliquées à `base`."""
+    fixed = set(grid) - set(SWEEPABLE)
+    if fixed:
+        raise ValueError(f"Paramètres non balayables (forme de trace fixe) : {sorted(fixed)}")
+    names = sorted(grid)
+    return [replace(base, name=f"{base.name}_{n:05d}", **dict(zip(names, values)))
+            for n, values in enumerate(itertools.product(*(grid[k] for k in names)))]
+
+
+def _index_path(path):
+    return os.path.splitext(path)[0] + ".index.json"
+
+
+def _is_hdf5(path):
+    return os.path.splitext(path)[1] in (".h5", ".hdf5")
+
+
+class _NpyAtlas:
+    def __init__(self, path, index, shape, dtype):
+        self.path = path
+        self.index = index
+        mode = "r+" if os.path.exists(path) and os.path.exists(_index_path(path)) else "w+"
+        self.traces = np.lib.format.open_memmap(path, mode=mode, dtype=dtype, shape=shape)
+        if mode == "w+":
+            self.flush()
+
+    @property
+    def done(self):
+        return self.index["done"]
+
+    def write(self, i, trace):
+        self.traces[i] = trace
+        self.index["done"][i] = True
+
+    def flush(self):
+        self.traces.flush()
+        tmp = _index_path(self.path) + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.index, f)
+        os.replace(tmp, _index_path(self.path))
+
+    def close(self):
+        self.flush()
+        del self.traces
+
+
+class _Hdf5Atlas:
+    def __init__(self, path, index, shape, dtype):
+        try:
+            import h5py
+        except ImportError:
+            raise ImportError("Un atlas HDF5 nécessite h5py (pip install h5py)") from None
+        self.file = h5py.File(path, "a")
+        if "traces" not in self.file:
+            self.file.create_dataset("traces", shape=shape, dtype=dtype, chunks=(1,) + shape[1:])
+            self.file.create_dataset("done", data=np.zeros(shape[0], dtype=bool))
+            self.file["delays"] = index["delays"]
+            self.file["omega"] = index["omega"]
+            self.file.create_dataset("index", data=json.dumps({k: v for k, v in index.items() if k != "done"}))
+        self.done = self.file["done"][:].tolist()
+
+    def write(self, i, trace):
+        self.file["traces"][i] = trace
+        self.done[i] = True
+
+    def flush(self):
+        self.file["done"][:] = self.done
+        self.file.flush()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+def _read_index(path):
+    if _is_hdf5(path):
+        import h5py
+        with h5py.File(path, "r") as f:
+            return {**json.loads(f["index"][()]), "done": f["done"][:].tolist()}
+    with open(_index_path(path), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _atlas_omega(scenarios):
+    """Axe ω commun aux points (le même que celui de compute_scenario, porteuse comprise en bande de base)."""
+    # Parmi les paramètres balayables, seul le signal change l'axe (porteuse en bande de base)
+    axes = {s.signal: scenario_omega(s)[1] for s in scenarios}
+    omega = next(iter(axes.values()))
+    if any(a.shape != omega.shape or not np.allclose(a, omega, rtol=0, atol=1e-12) for a in axes.values()):
+        raise ValueError("Signaux balayés en bande de base sur les bins natifs : axes ω différents "
+                         "(porteuses différentes) ; fixer n_omega pour un axe commun")
+    return omega
+
+
+def _open_atlas(path, base, grid, scenarios):
+    grid = json.loads(json.dumps(grid))
+    delays, _ = delay_grid(base.Nt, base.t_max, base.delays, base.precision)
+    omega = _atlas_omega(scenarios)
+    index = {
+        "base": asdict(base),
+        "grid": grid,
+        "points": [{k: getattr(s, k) for k in sorted(grid)} for s in scenarios],
+        "delays": delays.tolist(),
+        "omega": omega.tolist(),
+        "done": [False] * len(scenarios),
+    }
+    shape = (len(scenarios), len(delays), len(omega))
+    exists = os.path.exists(path) and (_is_hdf5(path) or os.path.exists(_index_path(path)))
+    if exists:
+        previous = _read_index(path)
+        if previous["base"] != json.loads(json.dumps(index["base"])) or previous["grid"] != grid:
+            raise ValueError(f"{path} contient un autre balayage ; choisir un autre fichier")
+        index["done"] = previous["done"]
+
+    atlas_type = _Hdf5Atlas if _is_hdf5(path) else _NpyAtlas
+    return atlas_type(path, index, shape, dtypes(base.precision)[0])
+
+
+def _init_worker(base):
+    # Grille et rampes de phase calculées une fois par processus
+    delay_grid(base.Nt, base.t_max, base.delays, base.precision)
+
+
+def _compute_point(task):
+    i, scenario = task
+    return i, compute_scenario(scenario)[2]
+
+
+def run_sweep(path, base, grid, processes=None, chunksize=4, progress=None):
+    """
+    Calcule tous les points de `grid` non encore présents dans l'atlas `path`.
+    `progress(fait, total, traces/s)` est appelé au fil du calcul (stderr par défaut).
+    """
+    if progress is None:
+        progress = _print_progress
+    scenarios = expand_grid(base, grid)
+    atlas = _open_atlas(path, base, grid, scenarios)
+    todo = [(i, s) for i, s in enumerate(scenarios) if not atlas.done[i]]
+    total, done = len(scenarios), len(scenarios) - len(todo)
+
+    start = last_flush = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(base,)) as pool:
+            for n, (i, trace) in enumerate(pool.map(_compute_point, todo, chunksize=chunksize), 1):
+                atlas.write(i, trace)
+                now = time.perf_counter()
+                if now - last_flush > FLUSH_EVERY:
+                    atlas.flush()
+                    last_flush = now
+                progress(done + n, total, n / (now - start))
+    finally:
+        atlas.close()
+
+
+def _print_progress(done, total, rate):
+    eta = (total - done) / rate if rate > 0 else float("inf")
+    print(f"\r{done}/{total} traces  {rate:.1f} traces/s  reste {eta:.0f} s", end="", file=sys.stderr, flush=True)
+    if done == total:
+        print(file=sys.stderr)
+
+
+def load_atlas(path):
+    """Retourne (traces (point, retard, ω) en lecture seule, index) d'un atlas."""
+    index = _read_index(path)
+    if _is_hdf5(path):
+        import h5py
+        return h5py.File(path, "r")["traces"], index
+    return np.load(path, mmap_mode="r"), index
+
+
+def find_point(index, **params):
+    """Position dans l'atlas du point dont les paramètres balayés valent `params`."""
+    for i, point in enumerate(index["points"]):
+        if all(point[k] == v for k, v in params.items()):
+            return i
+    raise KeyError(f"Aucun point {params} dans l'atlas")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m frog.sweep", description="Balayage de paramètres FROG → atlas")
+    parser.add_argument("config", help='fichier JSON {"base": {...}, "grid": {...}}')
+    parser.add_argument("-o", "--output", default="atlas.npy", help="atlas .npy (+ .index.json) ou .h5")
+    parser.add_argument("--processes", type=int, default=None, help="processus de calcul (défaut : nombre de cœurs)")
+    args = parser.parse_args(argv)
+
+    with open(args.config, encoding="utf-8") as f:
+        config = json.load(f)
+    run_sweep(args.output, Scenario.from_dict(config["base"]), config["grid"], args.processes)
+
+
+if __name__ == "__main__":
+    main()
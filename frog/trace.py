@@ -0,0 +1,158 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.fft import fft
+
+from .delay import delay_fields
+from .nonlinear import frog_signal
+from .precision import dtypes, real_dtype
+from .spectrum import spectral_evaluator
+
+METHODS = ("SHG-FROG", "PG-FROG", "XFROG")
+
+# Nombre de retards traités par bloc : la matrice de gate d'un bloc reste en cache
+CHUNK = 32
+
+# Retards traités par bloc dans delay_trace (signal pleine largeur limité au bloc)
+DELAY_CHUNK = 64
+
+
+def gate_matrix(gate, rows=None):
+    """Matrice circulante des gates décalées : ligne i = np.roll(gate, i - N // 2)."""
+    N = gate.size
+    if rows is None:
+        rows = np.arange(N)
+    # Fenêtres glissantes sur la gate dupliquée : aucune copie avant l'indexation
+    windows = sliding_window_view(np.concatenate([gate, gate]), N)
+    return windows[(N // 2 - np.asarray(rows)) % N]
+
+
+def _gate(E_t, method, reference):
+    if method == "SHG-FROG":
+        return E_t
+    if method == "PG-FROG":
+        return np.abs(E_t)**2
+    if method == "XFROG":
+        if reference is None:
+            raise ValueError("XFROG nécessite une impulsion de référence")
+        return reference
+    raise ValueError(f"Méthode FROG inconnue : {method}")
+
+
+def _shift_modulation(N):
+    # fftshift sur l'axe fréquence = modulation du signal avant FFT ((-1)^k si N pair)
+    k = np.arange(N)
+    if N % 2 == 0:
+        return np.where(k % 2, -1.0, 1.0)
+    return np.exp(2j * np.pi * k * (N // 2) / N)
+
+
+def symmetric_delays(delays):
+    """Vrai si la grille de retards est symétrique autour de 0 (τ et -τ présents, aux arrondis près)."""
+    delays = np.asarray(delays, dtype=float)
+    scale = np.abs(delays).max() if delays.size else 0.0
+    return delays.size > 1 and bool(np.allclose(delays, -delays[::-1], rtol=0, atol=1e-9 * scale))
+
+
+def mirror_index(n, circular=False):
+    """
+    Indice dans la demi-trace (retards τ ≥ 0, par τ croissant) de chacun des n
+    retards de la trace complète. `circular` : retards circulaires de compute_trace
+    (colonne i ↔ τ = i - N//2, demi-trace de N//2 + 1 retards) ; sinon grille
+    symétrique de delay_trace (demi-trace = delays[n//2:]).
+    """
+    j = np.arange(n)
+    if circular:
+        return np.abs(j - n // 2)
+    return np.where(j >= n // 2, j - n // 2, n - 1 - j - n // 2)
+
+
+def unfold_trace(half, n, axis=0, circular=False):
+    """Trace complète de n retards reconstruite par symétrie I(ω, τ) = I(ω, -τ) depuis la demi-trace."""
+    return np.take(half, mirror_index(n, circular), axis=axis)
+
+
+def compute_trace(E_t, method="SHG-FROG", reference=None, chunk=CHUNK, workers=None, rows=None,
+                  precision="double", symmetric=True, half=False):
+    """
+    Trace FROG |FFT(E(t) · gate(t - τ))|² pour les N retards circulaires de la grille.
+
+    Équivalent vectorisé de la boucle historique de FROG.py (np.roll + FFT par retard) :
+    retourne un tableau (fréquence, retard) de forme (N, N), fréquences centrées
+    comme np.fft.fftshift. `workers` est transmis à scipy.fft pour paralléliser les FFT.
+    `rows` restreint le calcul à ces indices de retard (colonnes de la trace).
+    `precision="single"` calcule tout en complex64 et renvoie une trace float32.
+
+    En SHG-FROG la trace est paire en retard : avec `symmetric`, seuls les retards
+    τ ≥ 0 sont calculés, les autres colonnes en sont des copies. `half` renvoie
+    seulement ces N//2 + 1 colonnes (τ = 0 … N//2), voir unfold_trace.
+    """
+    if half:
+        if method != "SHG-FROG" or rows is not None:
+            raise ValueError("Demi-trace : SHG-FROG sur tous les retards uniquement")
+        N = len(E_t)
+        rows = (np.arange(N // 2 + 1) + N // 2) % N
+    elif method == "SHG-FROG" and symmetric:
+        N = len(E_t)
+        rows = np.arange(N) if rows is None else np.asarray(rows)
+        # I(ω, τ) = I(ω, -τ) : une colonne calculée par paire (τ, -τ)
+        shifts, inverse = np.unique(np.abs(rows - N // 2), return_inverse=True)
+        trace = compute_trace(E_t, method, reference, chunk, workers, (shifts + N // 2) % N, precision, symmetric=False)
+        return trace.T[inverse].T
+    real, cplx = dtypes(precision)
+    E_t = np.asarray(E_t, dtype=cplx)
+    N = E_t.size
+    if reference is not None:
+        reference = np.asarray(reference, dtype=cplx)
+    gate = _gate(E_t, method, reference)
+    rows = np.arange(N) if rows is None else np.asarray(rows)
+
+    E_alt = E_t * _shift_modulation(N).astype(cplx)
+
+    trace = np.empty((len(rows), N), dtype=real)
+    for start in range(0, len(rows), chunk):
+        stop = min(start + chunk, len(rows))
+        signal = gate_matrix(gate, rows[start:stop])
+        signal = signal * E_alt
+        spectrum = fft(signal, axis=1, overwrite_x=True, workers=workers)
+        np.abs(spectrum, out=trace[start:stop])
+    trace **= 2
+    return trace.T
+
+
+def delay_trace(E, t, delays, signal="SHG", chunk=DELAY_CHUNK, workers=None, ramp=None,
+                omega_window=None, n_omega=None, symmetric=True, half=False):
+    """
+    Trace FROG sur une grille de retards quelconque (scripts Frog1–Frog6).
+
+    Retourne un tableau (retard, fréquence) de forme (len(delays), len(ω)), où ω est
+    omega_axis(t, omega_window, n_omega) : spectre complet centré par défaut, ou
+    seulement la fenêtre demandée. Les retards sont traités par blocs de `chunk`,
+    si bien que seule la partie recadrée de la trace est conservée en mémoire.
+
+    En SHG sur une grille symétrique autour de 0, avec `symmetric`, seuls les retards
+    delays[len // 2:] sont calculés puis recopiés en miroir ; `half` renvoie
+    seulement ces lignes (voir unfold_trace).
+    """
+    delays = np.atleast_1d(np.asarray(delays, dtype=float))
+    mirrored = signal == "SHG" and (symmetric or half) and symmetric_delays(delays)
+    if half and not mirrored:
+        raise ValueError("Demi-trace : signal SHG et retards symétriques autour de 0 requis")
+    if mirrored:
+        m = len(delays) // 2
+        trace = delay_trace(E, t, delays[m:], signal, chunk, workers, None if ramp is None else ramp[m:],
+                            omega_window, n_omega, symmetric=False)
+        return trace if half else unfold_trace(trace, len(delays))
+
+    omega, evaluate = spectral_evaluator(t, omega_window, n_omega)
+    if chunk is None:
+        chunk = len(delays)
+
+    # Trace float32 pour un champ complex64, float64 sinon
+    trace = np.empty((len(delays), len(omega)), dtype=real_dtype(np.asarray(E).dtype))
+    for start in range(0, len(delays), chunk):
+        stop = min(start + chunk, len(delays))
+        block_ramp = None if ramp is None else ramp[start:stop]
+        E_delayed = delay_fields(E, t, delays[start:stop], workers=workers, ramp=block_ramp)
+        spectrum = evaluate(frog_signal(E, E_delayed, signal), workers)
+        trace[start:stop] = np.abs(spectrum)**2
+    return trace
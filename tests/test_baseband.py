@@ -0,0 +1,22 @@
+import os
+from dataclasses import replace
+
+import pytest
+
+from frog.grid import plan_scenario
+from frog.scenario import baseband_error, load_scenarios
+
+REFERENCE = os.path.join(os.path.dirname(__file__), os.pardir, "scenarios", "reference.json")
+
+
+@pytest.mark.parametrize("scenario", load_scenarios(REFERENCE), ids=lambda s: s.name)
+def test_planned_baseband_grid_matches_carrier_reference(scenario):
+    planned, plan = plan_scenario(replace(scenario, baseband=True))
+    assert plan.Nt < 512
+    assert baseband_error(planned, reference_Nt=4096) < 1e-4
+
+
+def test_coarse_carrier_reference_rejected():
+    planned, _ = plan_scenario(replace(load_scenarios(REFERENCE)[1], baseband=True))
+    with pytest.raises(ValueError, match="reference_Nt"):
+        baseband_error(planned)
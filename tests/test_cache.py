@@ -0,0 +1,61 @@
+import os
+
+import numpy as np
+
+from frog.cache import TraceCache, cache_key
+
+
+def compute(value):
+    return lambda: {"trace": np.full((4, 8), value), "omega": np.linspace(0, 1, 8)}
+
+
+def test_hit_after_put(tmp_path):
+    cache = TraceCache(str(tmp_path))
+    first = cache.get_or_compute({"phi2": 200, "signal": "SHG"}, compute(1.0))
+    second = cache.get_or_compute({"signal": "SHG", "phi2": 200}, compute(2.0))
+    np.testing.assert_array_equal(second["trace"], first["trace"])
+    assert isinstance(second["trace"], np.memmap)
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_numeric_params_normalised():
+    assert cache_key({"phi2": 50, "delays": (-75, 75, 500)}) == cache_key({"phi2": 50.0, "delays": [-75.0, 75.0, 500.0]})
+    assert cache_key({"phi2": np.float64(50)}) == cache_key({"phi2": 50})
+    assert cache_key({"baseband": True}) != cache_key({"baseband": 1})
+
+
+def test_miss_after_parameter_change(tmp_path):
+    cache = TraceCache(str(tmp_path))
+    cache.get_or_compute({"phi2": 200}, compute(1.0))
+    changed = cache.get_or_compute({"phi2": 201}, compute(2.0))
+    assert changed["trace"][0, 0] == 2.0
+    assert cache.stats()["misses"] == 2
+
+
+def test_lru_eviction_by_mtime(tmp_path):
+    cache = TraceCache(str(tmp_path), max_bytes=10**9)
+    for value in range(3):
+        cache.put({"n": value}, **compute(float(value))())
+    entry_size = cache.size_bytes() // 3
+    # Entrée 0 la plus ancienne, puis 2, puis 1 (relue récemment)
+    for value, age in ((0, 300), (1, 100), (2, 200)):
+        path = cache._path(cache_key({"n": value}))
+        stamp = os.stat(path).st_mtime - age
+        os.utime(path, (stamp, stamp))
+    cache.max_bytes = 2 * entry_size + entry_size // 2
+    cache.put({"n": 3}, **compute(3.0)())
+    assert cache.stats()["evictions"] == 2
+    assert cache.get({"n": 0}) is None and cache.get({"n": 2}) is None
+    assert cache.get({"n": 1}) is not None and cache.get({"n": 3}) is not None
+
+
+def test_corrupt_entry_recomputed(tmp_path):
+    cache = TraceCache(str(tmp_path))
+    params = {"phi2": 200}
+    cache.put(params, **compute(1.0)())
+    with open(os.path.join(cache._path(cache_key(params)), "trace.npy"), "r+b") as f:
+        f.truncate(20)
+    assert cache.get(params) is None
+    arrays = cache.get_or_compute(params, compute(2.0))
+    assert arrays["trace"][0, 0] == 2.0
+    assert cache.get(params)["trace"][0, 0] == 2.0
@@ -0,0 +1,40 @@
+import os
+
+import numpy as np
+
+from frog.cli import main
+from frog.scenario import compute_scenario, load_scenarios
+
+REFERENCE = os.path.join(os.path.dirname(__file__), os.pardir, "scenarios", "reference.json")
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def run(tmp_path, capsys):
+    main([REFERENCE, "-o", str(tmp_path / "traces"), "--data", "--dpi", "40", "--cache", str(tmp_path / "cache")])
+    return capsys.readouterr().out.splitlines()[-1]
+
+
+def read_outputs(directory, scenarios):
+    outputs = {}
+    for scenario in scenarios:
+        with open(directory / f"{scenario.name}.png", "rb") as f:
+            outputs[scenario.name] = f.read()
+    return outputs
+
+
+def test_reference_run_and_cache_hits(tmp_path, capsys):
+    scenarios = load_scenarios(REFERENCE)
+    # Premier passage : trace et figure calculées pour chaque scénario
+    assert run(tmp_path, capsys) == f"cache : 0 hits, {2 * len(scenarios)} misses, 0 évictions"
+    first = read_outputs(tmp_path / "traces", scenarios)
+    assert all(png.startswith(PNG_SIGNATURE) for png in first.values())
+    for scenario in scenarios:
+        delays, omega, trace = compute_scenario(scenario)
+        with np.load(tmp_path / "traces" / f"{scenario.name}.npz") as data:
+            np.testing.assert_array_equal(data["delays"], delays)
+            np.testing.assert_array_equal(data["omega"], omega)
+            np.testing.assert_allclose(data["trace"], trace, rtol=1e-12, atol=0)
+
+    # Second passage : tout est relu depuis le cache, sorties identiques
+    assert run(tmp_path, capsys) == f"cache : {2 * len(scenarios)} hits, 0 misses, 0 évictions"
+    assert read_outputs(tmp_path / "traces", scenarios) == first
@@ -0,0 +1,101 @@
+import json
+
+import numpy as np
+
+from zscan.components import Crystal, Layout, Lens, Photodiode, load_layout
+from zscan.engine import Simulation, run
+from zscan.optics import Bench
+from zscan.tracing import EXIT
+
+from .test_tracing import TaggedTracer
+
+
+def test_colocated_planes_are_crossed_once():
+    bench = Bench()
+    layout = Layout([
+        Lens("lens", 800, 300),
+        Crystal("crystal", 800, 300),
+        Photodiode("photodiode", 1000, 300, radius=40),
+    ])
+    sim = Simulation(bench, layout=layout)
+    for _ in range(300):  # avant correction : step() ne rendait jamais la main
+        sim.advance()
+    assert sim.detectors.totals[0] > 0
+    assert sim.detectors.totals[1] > 0
+
+
+def test_colocated_planes_match_nearby_planes():
+    def totals(crystal_x):
+        layout = Layout([Lens("lens", 800, 300), Crystal("crystal", crystal_x, 300),
+                         Photodiode("photodiode", 1000, 300, radius=40)])
+        sim = Simulation(Bench(), layout=layout)
+        for _ in range(300):
+            sim.advance()
+        return sim.detectors.totals
+
+    np.testing.assert_array_equal(totals(800), totals(800 + 1e-9))
+
+
+def brute_force_event(layout, x, y, vx, vy, angle, flags):
+    """Premier composant rencontré, en testant tous les composants (sans index)."""
+    times = np.stack([c.times(x, y, vx, vy, angle, flags) for c in layout])
+    return times.min(axis=0), np.where(np.isfinite(times.min(axis=0)), times.argmin(axis=0), -1)
+
+
+def test_x_index_matches_brute_force():
+    layout = Layout.from_bench(Bench())
+    assert np.all(np.diff(layout.x_min[layout._ascending]) >= 0)
+    assert np.all(np.diff(layout.x_max[layout._descending]) <= 0)
+    rng = np.random.default_rng(5)
+    n = 2000
+    x, y = rng.uniform(0, 1200, n), rng.uniform(0, 600, n)
+    angle = rng.uniform(-np.pi, np.pi, n)
+    vx, vy = np.cos(angle), np.sin(angle)
+    flags = np.zeros(n, np.int32)
+    tau, which = layout.next_event(x, y, vx, vy, angle, flags, np.full(n, -1, np.int16))
+    expected_tau, expected_which = brute_force_event(layout, x, y, vx, vy, angle, flags)
+    np.testing.assert_array_equal(tau, expected_tau)
+    np.testing.assert_array_equal(which, expected_which)
+    assert np.isfinite(tau).any() and np.isinf(tau).any()
+
+
+def test_from_bench_round_trip(tmp_path):
+    bench = Bench()
+    layout = Layout.from_bench(bench)
+    path = tmp_path / "bench.json"
+    path.write_text(json.dumps(layout.to_dict()))
+    loaded = load_layout(str(path))
+    assert loaded.to_dict() == layout.to_dict()
+    assert [type(c) for c in loaded] == [type(c) for c in layout]
+    np.testing.assert_array_equal(loaded.x_min, layout.x_min)
+    np.testing.assert_array_equal(loaded._ascending, layout._ascending)
+    # Le banc relu se comporte comme les éléments de Bench
+    np.testing.assert_array_equal(run(frames=300, layout=str(path)), run(frames=300))
+
+
+def event_sequence(layout, dy):
+    """Noms des éléments rencontrés par un rayon émis à dy px de l'axe, copies réfléchies comprises."""
+    bench = Bench()
+    tracer = TaggedTracer(bench, layout=layout)
+    tracer.add(bench.laser_origin[0], bench.laser_origin[1] + dy, 0.0)
+    while len(tracer):
+        tracer.step()
+    sequences = {}
+    for uid, event in tracer.visits:
+        sequences.setdefault(uid, []).append("exit" if event == EXIT else layout.components[event].name)
+    return sequences
+
+
+def test_custom_layout_changes_event_sequence():
+    bench = Bench()
+    on_axis = ["beamsplitter", "lens", "crystal", "beamsplitter2"]
+    # Rayon à 40 px : hors des lames, il croise le foyer et passe sous la photodiode basse
+    assert event_sequence(Layout.from_bench(bench), 40) == {0: on_axis + ["diaphragm", "exit"]}
+    # Diaphragme en place : absorbé à 40 px de l'axe, pas à 20 px
+    closed = Layout.from_bench(bench)
+    closed.configure(diaphragm_enabled=True)
+    assert event_sequence(closed, 40) == {0: on_axis + ["diaphragm"]}
+    assert event_sequence(closed, 20) == {0: on_axis + ["diaphragm", "photodiode_bottom", "exit"]}
+    # Lentille de relais ajoutée derrière le diaphragme : le rayon est ramené sur la photodiode basse
+    relay = Layout([*Layout.from_bench(bench), Lens("relay", bench.diaphragm_x + 10, bench.lens_y, focal_length=20)])
+    assert event_sequence(relay, 40) == {0: on_axis + ["diaphragm", "relay", "photodiode_bottom", "exit"]}
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from scipy.fft import fft, ifft
+
+import frog.crystal
+from frog.crystal import Crystal, ShgPropagator
+
+
+def _pulse(N, t_max=500, width=40):
+    t = np.linspace(-t_max, t_max, N)
+    return t, np.exp(-t**2 / (2 * width**2)).astype(np.complex128)
+
+
+def _relative(a, b):
+    return np.linalg.norm(a - b) / np.linalg.norm(b)
+
+
+def test_energy_conserved_at_phase_matching():
+    t, E = _pulse(1024)
+    propagator = ShgPropagator(t, Crystal.from_table("BBO", 2.0), peak_intensity=200.0)
+    result = propagator.propagate(E)
+    n1, n2 = propagator.n
+    energy_in = n1 * np.sum(np.abs(E)**2)
+    energy_out = n1 * np.sum(np.abs(result.fundamental)**2) + n2 * np.sum(np.abs(result.second_harmonic)**2)
+    assert result.model == "split-step"
+    assert result.efficiency > 1e-2
+    assert abs(energy_out / energy_in - 1) < 1e-6
+
+
+def test_weak_conversion_matches_undepleted_solution():
+    # Pompe non dépeuplée, dispersion du fondamental négligeable sur 50 µm :
+    # A₂(L) = iκ₂ FFT(A₁²) (exp(i D₂ L) - 1)/(i D₂), désaccord de vitesse de groupe compris
+    t, E = _pulse(1024, width=60)
+    crystal = Crystal.from_table("BBO", 0.05)
+    propagator = ShgPropagator(t, crystal, peak_intensity=1e-3)
+    result = propagator.propagate(E)
+    D2 = propagator.linear[1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        transfer = np.where(np.abs(D2) > 1e-12, np.expm1(1j * D2 * crystal.length) / (1j * D2), crystal.length)
+    expected = ifft(1j * propagator.kappa[1] * fft(E**2) * transfer)
+    assert _relative(result.second_harmonic, expected) < 1e-3
+    dispersed = ifft(np.exp(1j * propagator.linear[0] * crystal.length) * fft(E))
+    assert _relative(result.fundamental, dispersed) < 1e-6
+
+
+@pytest.mark.parametrize("name", ["KTP", "LiNbO3"])
+def test_cascade_matches_split_step(name, monkeypatch):
+    t, E = _pulse(512, t_max=250)
+    crystal = Crystal.from_table(name, 1.0)
+    cascade = ShgPropagator(t, crystal).propagate(E)
+    monkeypatch.setattr(frog.crystal, "CASCADE_LENGTHS", np.inf)
+    reference = ShgPropagator(t, crystal, tol=1e-8).propagate(E)
+    assert cascade.model == "cascade" and reference.model == "split-step"
+    assert len(cascade.steps) < len(reference.steps) / 4
+    assert _relative(cascade.fundamental, reference.fundamental) < 1e-3
+    assert _relative(cascade.second_harmonic, reference.second_harmonic) < 1e-2
+    assert cascade.efficiency == pytest.approx(reference.efficiency, rel=1e-2)
+
+
+def test_cascade_step_count_independent_of_mismatch():
+    t, E = _pulse(2048)
+    result = ShgPropagator(t, Crystal.from_table("LiNbO3", 5.0)).propagate(E)
+    assert result.model == "cascade"
+    # Pas fixé par la phase non linéaire (≈ 6 rad), non par Δk·L ≈ 11 000 rad
+    assert len(result.steps) < 500
+    assert sum(result.steps) == pytest.approx(5.0)
+
+
+def test_phase_matched_crystal_not_cascaded():
+    t, _ = _pulse(512, t_max=250)
+    assert not ShgPropagator(t, Crystal.from_table("BBO", 5.0)).cascaded
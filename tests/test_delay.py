@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from scipy.fft import fftfreq
+
+from frog.delay import delay_fields, phase_ramp
+from frog.pulse import time_grid
+
+
+def gaussian(t, center=0.0, width=8.0):
+    # Enveloppe chirpée : le retard doit aussi transporter la phase
+    s = t - center
+    return np.exp(-s**2 / (2 * width**2) + 0.01j * s**2)
+
+
+@pytest.mark.parametrize("samples", [0, 3, -17, 0.37, -5.5, 12.25])
+def test_delay_matches_shifted_gaussian(samples):
+    t = time_grid(512, 100.0)
+    dt = t[1] - t[0]
+    tau = samples * dt
+    delayed = delay_fields(gaussian(t), t, [tau])[0]
+    np.testing.assert_allclose(delayed, gaussian(t, tau), rtol=0, atol=1e-12)
+
+
+def test_delay_is_circular():
+    t = time_grid(256, 50.0)
+    dt = t[1] - t[0]
+    E = gaussian(t, center=40.0, width=2.0)
+    # Retard entier de k pas : exactement np.roll, l'impulsion ressort à gauche de la fenêtre
+    k = 40
+    delayed = delay_fields(E, t, [k * dt])[0]
+    np.testing.assert_allclose(delayed, np.roll(E, k), rtol=0, atol=1e-12)
+    assert np.argmax(np.abs(delayed)) < len(t) // 4
+    # Une période N·dt entière ramène le champ
+    np.testing.assert_allclose(delay_fields(E, t, [len(t) * dt])[0], E, rtol=0, atol=1e-12)
+
+
+def test_chunks_and_shared_ramp_match():
+    t = time_grid(300, 80.0)
+    E = gaussian(t)
+    delays = np.linspace(-30, 30, 25)
+    reference = delay_fields(E, t, delays)
+    np.testing.assert_allclose(delay_fields(E, t, delays, chunk=7), reference, rtol=0, atol=1e-14)
+    ramp = phase_ramp(2 * np.pi * fftfreq(len(t), d=t[1] - t[0]), delays)
+    np.testing.assert_array_equal(delay_fields(E, t, delays, ramp=ramp), reference)
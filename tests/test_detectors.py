@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from benchmarks.legacy_zscan import emit_pulses, step_pulses
+from zscan.detectors import Detectors, RingBuffer, WindowedSum
+from zscan.engine import Simulation
+from zscan.optics import Bench
+from zscan.pulses import DETECTED_BOTTOM, PulseStore
+
+
+def test_ring_buffer_wraps_around():
+    buffer = RingBuffer(4, (2,))
+    evicted = [buffer.append([i, -i]) for i in range(10)]
+    assert len(buffer) == buffer.capacity == 4
+    np.testing.assert_array_equal(buffer.values(), [[i, -i] for i in range(6, 10)])
+    # Zéros tant que le tampon se remplit, puis la ligne la plus ancienne
+    np.testing.assert_array_equal(evicted, [[0, 0]] * 4 + [[i, -i] for i in range(6)])
+    buffer.clear()
+    assert len(buffer) == 0 and buffer.values().shape == (0, 2)
+
+
+@pytest.mark.parametrize("frames", [1, 7, 30])
+def test_windowed_sum_matches_direct_sum(frames):
+    counts = np.random.default_rng(0).integers(0, 6, (100, 4))
+    window = WindowedSum(frames, (4,))
+    for i, row in enumerate(counts):
+        window.push(row)
+        np.testing.assert_array_equal(window.total, counts[max(0, i + 1 - frames):i + 1].sum(axis=0))
+
+
+def test_detectors_window_transmission():
+    detectors = Detectors(fps=4, window=3, history=10)
+    for emitted, hits in [(5, 1), (0, 0), (5, 3), (5, 5)]:
+        detectors.emit(emitted)
+        detectors.hit(DETECTED_BOTTOM, hits)
+        detectors.end_frame()
+    # Fenêtre des 3 dernières images : 8 détections bas pour 10 émissions
+    np.testing.assert_allclose(detectors.transmission("window"), [0.8, 0.0, 0.0])
+    np.testing.assert_allclose(detectors.transmission("total"), [0.6, 0.0, 0.0])
+    np.testing.assert_allclose(detectors.history.values()[:, 0], [0.2, 0.2, 0.4, 0.8])
+
+
+def test_alive_normalization_matches_historical_script():
+    bench = Bench()
+    sim = Simulation(bench, method="steps", history=400, normalization="alive")
+    pulses = []
+    expected = []
+    for frame in range(1, 401):
+        sim.advance()
+        emit_pulses(bench, pulses, frame)
+        step_pulses(pulses)
+        total = len(pulses)
+        detected = [sum(getattr(p, f"detected_by_photodiode_{name}") for p in pulses) for name in ("bottom", "top", "top2")]
+        expected.append([d / total if total else 0.0 for d in detected])
+    np.testing.assert_allclose(sim.detectors.history.values(), expected)
+
+
+def test_alive_normalization_needs_fractions():
+    detectors = Detectors(normalization="alive")
+    with pytest.raises(ValueError, match="alive"):
+        detectors.end_frame()
+    with pytest.raises(ValueError, match="Normalisation"):
+        Detectors(normalization="present")
+
+
+def test_compaction_keeps_survivor_fields():
+    store = PulseStore(Bench(), capacity=4)
+    n = 12
+    store.add(np.arange(n, dtype=float), 300 + np.arange(n), np.linspace(-1, 1, n), np.arange(n) % 2)
+    store.flags[:] = np.arange(n)
+    rows = {name: store._columns[name][:n].copy() for name in store.COLUMNS}
+    keep = np.zeros(n, bool)
+    keep[[0, 3, 4, 9, 11]] = True
+    store._compact(keep)
+    assert len(store) == keep.sum()
+    # Ordre non conservé : chaque survivant (repéré par x) garde toutes ses colonnes
+    survivors = store.x.astype(int)
+    assert sorted(survivors) == [0, 3, 4, 9, 11]
+    for name in store.COLUMNS:
+        np.testing.assert_array_equal(getattr(store, name), rows[name][survivors])
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from frog.dispersion import Dispersion, apply_dispersion, spectral_phase
+from frog.materials import material_phase
+from frog.pulse import fwhm_to_sigma, gaussian_pulse, omega0, time_grid
+
+
+def second_derivative(phase, h=1e-3):
+    """d²φ/dω² à ω₀ (fs²) par différence centrée."""
+    p = phase(np.array([omega0 - h, omega0, omega0 + h]))
+    return (p[0] - 2 * p[1] + p[2]) / h**2
+
+
+@pytest.mark.parametrize("baseband", [True, False])
+@pytest.mark.parametrize("phi2", [-200.0, 50.0, 200.0])
+def test_taylor_kernel_matches_chirped_gaussian(phi2, baseband):
+    t = time_grid(1024, 400.0)
+    sigma = fwhm_to_sigma(10)
+    E = gaussian_pulse(t, 10, omega_c=0.0 if baseband else omega0)
+    out = apply_dispersion(E, t, Dispersion(phi2=phi2), baseband=baseband)
+    # exp(-σ²Δω²/2 - iφ″Δω²/2) → gaussienne complexe de paramètre σ² + iφ″
+    a = sigma**2 + 1j * phi2
+    expected = np.sqrt(sigma**2 / a) * np.exp(-t**2 / (2 * a))
+    if not baseband:
+        expected = expected * np.exp(1j * omega0 * t)
+    np.testing.assert_allclose(out, expected, rtol=0, atol=1e-11)
+    # Élargissement σ' = σ √(1 + (φ″/σ²)²), à énergie constante
+    intensity = np.abs(out)**2
+    width = np.sqrt(np.sum(t**2 * intensity) / np.sum(intensity))
+    assert width * np.sqrt(2) == pytest.approx(sigma * np.hypot(1, phi2 / sigma**2), rel=1e-9)
+    assert np.sum(intensity) == pytest.approx(np.sum(np.abs(E)**2), rel=1e-12)
+
+
+def test_fused_silica_gdd_at_800nm():
+    # Malitson : GVD de la silice 36,16 fs²/mm à 800 nm
+    assert second_derivative(lambda w: material_phase("SiO2", 1.0, w)) == pytest.approx(36.16, abs=0.01)
+    # spectral_phase retire phase et retard de groupe à ω_c mais garde la GDD, proportionnelle à L
+    dispersion = Dispersion(materials=(("SiO2", 2.5),))
+    assert second_derivative(lambda w: spectral_phase(w, dispersion)) == pytest.approx(2.5 * 36.16, abs=0.03)
+    assert spectral_phase([omega0], dispersion)[0] == 0
@@ -0,0 +1,58 @@
+import json
+
+import numpy as np
+import pytest
+
+from frog.export import EXPORT_FORMATS, export_trace
+
+
+def sample_trace():
+    delays = np.linspace(-50, 50, 21)
+    axis = np.linspace(0.3, 0.9, 600)
+    trace = np.exp(-delays[:, None]**2 / 400 - (axis[None, :] - 0.6)**2 / 0.01)
+    return trace, delays, axis
+
+
+def test_npz_round_trip():
+    trace, delays, axis = sample_trace()
+    archive = np.load(export_trace("npz", trace, delays, axis, {"method": "SHG-FROG"}, "freq", "1/fs"))
+    np.testing.assert_array_equal(archive["trace"], trace)
+    np.testing.assert_array_equal(archive["delays"], delays)
+    np.testing.assert_array_equal(archive["freq"], axis)
+    assert "omega" not in archive
+    assert json.loads(str(archive["units"])) == {"delays": "fs", "freq": "1/fs"}
+    assert json.loads(str(archive["attrs"])) == {"method": "SHG-FROG"}
+
+
+def test_hdf5_round_trip():
+    h5py = pytest.importorskip("h5py")
+    trace, delays, axis = sample_trace()
+    with h5py.File(export_trace("hdf5", trace, delays, 2 * np.pi * axis, {"N": 600}), "r") as h5:
+        np.testing.assert_array_equal(h5["trace"][()], trace)
+        np.testing.assert_array_equal(h5["delays"][()], delays)
+        np.testing.assert_array_equal(h5["omega"][()], 2 * np.pi * axis)
+        assert h5["omega"].attrs["units"] == "rad/fs"
+        assert h5["delays"].attrs["units"] == "fs"
+        assert h5["trace"].dims[1][0].name == "/omega"
+        assert h5.attrs["N"] == 600
+
+
+def test_frg_round_trip():
+    trace, delays, axis = sample_trace()
+    buffer = export_trace("frg", trace, delays, axis, axis_name="freq", axis_unit="1/fs")
+    header = buffer.readline().split()
+    n_delays, n_axis = int(header[0]), int(header[1])
+    d_delay, d_axis, center = map(float, header[2:])
+    assert (n_delays, n_axis) == trace.shape
+    assert d_delay == pytest.approx(delays[1] - delays[0])
+    assert d_axis == pytest.approx(axis[1] - axis[0])
+    assert center == pytest.approx(axis[n_axis // 2])
+    # Texte à 6 chiffres significatifs
+    np.testing.assert_allclose(np.loadtxt(buffer).reshape(trace.shape), trace, rtol=1e-5, atol=1e-300)
+
+
+def test_unknown_format():
+    trace, delays, axis = sample_trace()
+    assert set(EXPORT_FORMATS) == {"npz", "hdf5", "frg"}
+    with pytest.raises(ValueError, match="Format"):
+        export_trace("csv", trace, delays, axis)
@@ -0,0 +1,37 @@
+import os
+from dataclasses import replace
+
+import pytest
+from scipy.fft import next_fast_len
+
+from frog.grid import plan_grid, plan_scenario
+from frog.precision import max_relative_error
+from frog.scenario import compute_scenario, load_scenarios
+
+REFERENCE = os.path.join(os.path.dirname(__file__), os.pardir, "scenarios", "reference.json")
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"FWHM_t": 10},
+    {"FWHM_t": 20, "phi2": 200, "max_delay": 75},
+    {"FWHM_t": 10, "separation": 60, "max_delay": 75, "signal": "PG"},
+    {"FWHM_t": 10, "max_delay": 75, "baseband": True, "omega_window": (3, 6)},
+])
+def test_planned_nt_is_fast_length(kwargs):
+    plan = plan_grid(**kwargs)
+    assert plan.Nt == next_fast_len(plan.Nt_min)
+    assert plan.Nt >= plan.Nt_min
+
+
+@pytest.mark.parametrize("scenario", load_scenarios(REFERENCE), ids=lambda s: s.name)
+def test_planned_trace_matches_reference(scenario):
+    scenario = replace(scenario, n_omega=256)
+    planned, plan = plan_scenario(scenario, energy_tol=1e-7, alias_tol=1e-7)
+    assert plan.Nt < scenario.Nt
+    # Référence fine, sur une fenêtre au moins aussi large que celle du plan :
+    # celle de Frog2 (±90 fs) est trop étroite pour l'impulsion chirpée retardée de ±75 fs
+    reference = replace(scenario, Nt=4096, t_max=max(scenario.t_max, plan.t_max))
+    _, omega, trace = compute_scenario(planned)
+    _, omega_ref, trace_ref = compute_scenario(reference)
+    assert omega == pytest.approx(omega_ref)
+    assert max_relative_error(trace / trace.max(), trace_ref / trace_ref.max()) < 1e-5
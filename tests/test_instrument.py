@@ -0,0 +1,35 @@
+import tracemalloc
+
+import pytest
+
+from frog.instrument import Instrumentation
+
+
+def test_tracemalloc_stays_on_until_last_instrumentation_closes():
+    assert not tracemalloc.is_tracing()
+    first, second = Instrumentation(memory=True), Instrumentation(memory=True)
+    first.close()
+    assert tracemalloc.is_tracing()
+    with second.stage("étape"):
+        data = bytearray(2**20)
+    assert second.records[0].peak >= len(data)
+    second.close()
+    assert not tracemalloc.is_tracing()
+
+
+def test_closed_instrumentation_records_nothing():
+    perf = Instrumentation(memory=True)
+    perf.close()
+    with perf.stage("après close"):
+        pass
+    assert perf.records == []
+    assert not tracemalloc.is_tracing()
+
+
+def test_exception_in_stage_still_stops_tracemalloc():
+    with pytest.raises(RuntimeError):
+        with Instrumentation(memory=True) as perf:
+            with perf.stage("échec"):
+                raise RuntimeError("étape interrompue")
+    assert perf.records[0].peak is not None
+    assert not tracemalloc.is_tracing()
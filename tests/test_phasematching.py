@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from frog.crystal import TABLE_OMEGAS, phase_matching_angle, phase_matching_table, sh_index
+from frog.materials import omega_to_wavelength, refractive_index
+from frog.pulse import c, omega0
+
+
+def omega_at(wavelength_nm):
+    return 2 * np.pi * c / wavelength_nm
+
+
+def test_bbo_type_one_angle_at_800nm():
+    exact = phase_matching_angle("BBO", omega0)
+    assert exact == pytest.approx(29.18, abs=0.01)
+    assert phase_matching_table("BBO").angle(omega0) == pytest.approx(exact, abs=1e-3)
+    # Δk interpolé quasi nul à l'angle exact (< 0,1 rad/mm, précision annoncée de la table)
+    assert abs(phase_matching_table("BBO").mismatch(omega0, exact)) < 0.1
+
+
+@pytest.mark.parametrize("material", ["BBO", "KDP"])
+@pytest.mark.parametrize("wavelength", [650, 800, 1030, 1550, 2000])
+def test_table_angle_matches_brentq(material, wavelength):
+    exact = phase_matching_angle(material, omega_at(wavelength))
+    angle = phase_matching_table(material).angle(omega_at(wavelength))
+    # KDP : pas d'accord de type I au-delà de ≈ 1,6 µm
+    assert np.isnan(angle) if exact is None else angle == pytest.approx(exact, abs=1e-3)
+
+
+@pytest.mark.parametrize("theta", [0.0, 17.3, 29.18, 62.55, 90.0])
+def test_table_mismatch_matches_sellmeier(theta):
+    omega = np.linspace(omega_at(2500), omega_at(700), 57)
+    wavelength = omega_to_wavelength(omega)
+    exact = (sh_index("BBO", wavelength / 2, np.radians(theta)) - refractive_index("BBO", wavelength, "o")) \
+        * 2 * omega * 1e6 / c
+    np.testing.assert_allclose(phase_matching_table("BBO").mismatch(omega, theta), exact, rtol=0, atol=0.1)
+
+
+def test_out_of_table():
+    table = phase_matching_table("BBO")
+    low, high = TABLE_OMEGAS[:2]
+    # Pas d'accord de phase hors table ni sans solution (LiNbO3 en type I à 800 nm)
+    assert np.isnan(table.angle([0.5 * low, 1.5 * high, omega_at(500)])).all()
+    assert phase_matching_angle("LiNbO3") is None and np.isnan(phase_matching_table("LiNbO3").angle(omega0))
+    # Δn borné au bord de la table comme les indices à WAVELENGTH_RANGE, angles bornés à [0°, 90°]
+    assert table.mismatch(1.2 * high, 30.0) == pytest.approx(1.2 * table.mismatch(high, 30.0), rel=1e-12)
+    assert table.mismatch(omega0, -10.0) == table.mismatch(omega0, 0.0)
+    assert table.mismatch(omega0, 100.0) == table.mismatch(omega0, 90.0)
+    assert np.isfinite(table.efficiency(np.linspace(0, 3 * high, 101), 29.18, 1.0)).all()
@@ -0,0 +1,31 @@
+import os
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from frog.precision import SINGLE_RTOL, max_relative_error
+from frog.scenario import compute_scenario, load_scenarios
+from frog.trace import METHODS, compute_trace
+
+REFERENCE = os.path.join(os.path.dirname(__file__), os.pardir, "scenarios", "reference.json")
+
+
+@pytest.mark.parametrize("scenario", load_scenarios(REFERENCE), ids=lambda s: s.name)
+def test_single_precision_scenario_within_tolerance(scenario):
+    _, omega, double = compute_scenario(replace(scenario, precision="double"))
+    _, omega_single, single = compute_scenario(replace(scenario, precision="single"))
+    assert single.dtype == np.float32
+    np.testing.assert_allclose(omega_single, omega)
+    assert max_relative_error(single / single.max(), double / double.max()) <= SINGLE_RTOL
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_single_precision_circular_trace_within_tolerance(method):
+    t = np.linspace(-90, 90, 1024)
+    E = np.exp(-t**2 / (2 * 20**2)) * np.exp(1j * 0.05 * t**2)
+    reference = np.exp(-t**2 / (2 * 10**2))
+    double = compute_trace(E, method, reference)
+    single = compute_trace(E, method, reference, precision="single")
+    assert single.dtype == np.float32
+    assert max_relative_error(single / single.max(), double / double.max()) <= SINGLE_RTOL
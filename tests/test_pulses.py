@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from benchmarks.legacy_zscan import emit_pulses, step_pulses
+from zscan.optics import BLUE, Bench
+from zscan.pulses import (BLUE_INDEX, DETECTED_BOTTOM, DETECTED_TOP, DETECTED_TOP2, PASSED_BEAMSPLITTER,
+                          PASSED_BEAMSPLITTER2, PASSED_CRYSTAL, PASSED_LENS, PulseStore)
+
+LEGACY_FLAGS = {"passed_lens": PASSED_LENS, "passed_crystal": PASSED_CRYSTAL,
+                "passed_beamsplitter": PASSED_BEAMSPLITTER, "passed_beamsplitter2": PASSED_BEAMSPLITTER2,
+                "detected_by_photodiode_bottom": DETECTED_BOTTOM, "detected_by_photodiode_top": DETECTED_TOP,
+                "detected_by_photodiode_top2": DETECTED_TOP2}
+
+
+def legacy_rows(pulses):
+    rows = [(p.x, p.y, p.angle, BLUE_INDEX if p.color == BLUE else 0,
+             sum(flag for name, flag in LEGACY_FLAGS.items() if getattr(p, name))) for p in pulses]
+    return np.array(rows).reshape(-1, 5)
+
+
+def store_rows(store):
+    mask = sum(LEGACY_FLAGS.values())
+    return np.column_stack((store.x, store.y, store.angle, store.color, store.flags & mask))
+
+
+def sorted_rows(rows):
+    # Les deux modèles retirent les impulsions par échange : comparaison à l'ordre près
+    return rows[np.lexsort(np.round(rows[:, ::-1], 6).T)]
+
+
+@pytest.mark.parametrize("settings", [{}, {"diaphragm_enabled": True, "non_linear_strength": 7.5},
+                                      {"shg_threshold": 1.0, "focal_length": 100}])
+def test_pulse_store_matches_light_pulse(settings):
+    bench = Bench()
+    for name, value in settings.items():
+        setattr(bench, name, value)
+    store = PulseStore(bench)
+    pulses = []
+    reflected = 0  # copies réfléchies (vers le haut) vues sur le banc
+    for frame in range(1, 301):
+        emit_pulses(bench, pulses, frame)
+        store.emit(frame)
+        step_pulses(pulses)
+        store.step()
+        assert len(store) == len(pulses)
+        expected, actual = sorted_rows(legacy_rows(pulses)), sorted_rows(store_rows(store))
+        np.testing.assert_allclose(actual[:, :3], expected[:, :3], rtol=0, atol=1e-9)
+        np.testing.assert_array_equal(actual[:, 3:], expected[:, 3:])
+        reflected = max(reflected, int(np.count_nonzero(np.isclose(actual[:, 2], -np.pi / 2))))
+    assert reflected > 0
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from frog.render import TraceView, pool, pooling_factors
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+
+@pytest.fixture
+def view():
+    rng = np.random.default_rng(3)
+    delays = np.linspace(-500, 500, 3000)
+    omega = np.linspace(-2, 2, 2000)
+    trace = rng.random((len(delays), len(omega)))
+    # Pic isolé d'un seul échantillon : une réduction par moyenne le ferait disparaître
+    trace[1234, 567] = 50.0
+    fig, ax = plt.subplots(figsize=(4, 3), dpi=100)
+    yield TraceView(ax, delays, omega, trace), trace
+    plt.close(fig)
+
+
+def test_pooled_image_keeps_block_maximum(view):
+    view, trace = view
+    width, height = view.pixel_budget()
+    image = view.image.get_array().T
+    factors = pooling_factors(trace.shape, (width, height))
+    assert image.shape[0] <= width and image.shape[1] <= height
+    assert factors[0] > 1 and factors[1] > 1
+    np.testing.assert_array_equal(image, pool(trace, factors, "max"))
+    assert image.max() == 50.0
+    assert image[1234 // factors[0], 567 // factors[1]] == 50.0
+
+
+def test_zoom_reads_native_resolution(view):
+    view, trace = view
+    # Zone de 60 retards × 40 fréquences, plus petite que l'axe en pixels
+    view.ax.set_xlim(view.delays[1200], view.delays[1259])
+    view.ax.set_ylim(view.omega[550], view.omega[589])
+    image = np.asarray(view.image.get_array()).T
+    np.testing.assert_array_equal(image, trace[1200:1260, 550:590])
+    left, right, bottom, top = view.image.get_extent()
+    assert left < view.delays[1200] and right > view.delays[1259]
+    assert bottom < view.omega[550] and top > view.omega[589]
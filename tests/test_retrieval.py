@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from frog.retrieval import frog_error, retrieve
+from frog.trace import compute_trace
+
+N = 64
+
+
+def chirped_pulse():
+    t = np.linspace(-60, 60, N)
+    return np.exp(-t**2 / (2 * 10**2) + 1j * 0.01 * t**2)
+
+
+@pytest.mark.parametrize("method", ["SHG-FROG", "PG-FROG"])
+def test_pcgpa_retrieves_chirped_pulse(method):
+    E = chirped_pulse()
+    measured = compute_trace(E, method)
+    result = retrieve(measured, method, n_starts=2, processes=1)
+    assert result.error < 1e-3
+    assert frog_error(measured, result.trace) < 1e-3
+    # Spectre en intensité : insensible aux ambiguïtés triviales (phase globale, translation, renversement SHG)
+    expected = np.abs(np.fft.fft(E))**2
+    spectrum = np.abs(np.fft.fft(result.field))**2
+    np.testing.assert_allclose(spectrum / spectrum.max(), expected / expected.max(), rtol=0, atol=1e-3)
+
+
+def test_half_trace_input_matches_full_trace():
+    E = chirped_pulse()
+    full = retrieve(compute_trace(E, "SHG-FROG"), n_starts=1, processes=1)
+    half = retrieve(compute_trace(E, "SHG-FROG", half=True), n_starts=1, processes=1)
+    np.testing.assert_allclose(half.field, full.field, rtol=0, atol=1e-10)
+
+
+@pytest.mark.parametrize("method", ["SHG-FROG", "PG-FROG"])
+def test_process_pool_matches_serial(method):
+    measured = compute_trace(chirped_pulse(), method)
+    serial = retrieve(measured, method, n_starts=2, processes=1)
+    pooled = retrieve(measured, method, n_starts=2, processes=2)
+    assert pooled.seed == serial.seed
+    np.testing.assert_array_equal(pooled.field, serial.field)
+    np.testing.assert_array_equal(pooled.errors, serial.errors)
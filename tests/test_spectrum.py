@@ -0,0 +1,41 @@
+import numpy as np
+
+from frog.pulse import build_pulse, time_grid
+from frog.spectrum import omega_axis, spectral_evaluator
+from frog.trace import delay_trace
+
+T = time_grid(1024, 200.0)
+E = build_pulse(T, 10.0)
+DELAYS = np.linspace(-60, 60, 50)
+
+
+def full_then_mask(window):
+    """Spectre complet puis masque, comme mask_omega dans les anciens Frog1–Frog6."""
+    omega = omega_axis(T)
+    mask = (omega >= window[0]) & (omega <= window[1])
+    return omega[mask], delay_trace(E, T, DELAYS, "SHG")[:, mask]
+
+
+def test_cropped_trace_matches_full_fft_then_mask():
+    omega_ref, trace_ref = full_then_mask((3.0, 6.0))
+    np.testing.assert_array_equal(omega_axis(T, (3.0, 6.0)), omega_ref)
+    np.testing.assert_array_equal(delay_trace(E, T, DELAYS, "SHG", omega_window=(3.0, 6.0)), trace_ref)
+
+
+def test_zoom_fft_matches_full_fft_on_native_bins():
+    omega_ref, trace_ref = full_then_mask((3.0, 6.0))
+    # Fenêtre et résolution qui retombent sur les bins natifs : mêmes fréquences, autre algorithme
+    window = (omega_ref[0], omega_ref[-1])
+    omega = omega_axis(T, window, len(omega_ref))
+    np.testing.assert_allclose(omega, omega_ref, rtol=1e-12)
+    trace = delay_trace(E, T, DELAYS, "SHG", omega_window=window, n_omega=len(omega_ref))
+    np.testing.assert_allclose(trace, trace_ref, rtol=0, atol=1e-10 * trace_ref.max())
+
+
+def test_zoom_fft_off_grid_matches_direct_dft():
+    signal = np.random.default_rng(0).standard_normal((3, len(T))) + 0j
+    omega, evaluate = spectral_evaluator(T, (3.1, 5.7), 37)
+    # DFT directe, même convention de phase que la FFT (origine au premier échantillon)
+    n = np.arange(len(T))
+    direct = signal @ np.exp(-1j * np.outer(n * (T[1] - T[0]), omega))
+    np.testing.assert_allclose(evaluate(signal, None), direct, rtol=0, atol=1e-9 * np.abs(direct).max())
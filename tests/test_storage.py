@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from frog.pulse import time_grid
+from frog.storage import read_decimated, write_circular_trace, write_delay_trace
+from frog.trace import compute_trace, delay_trace, unfold_trace
+
+def pulse(N=256):
+    t = time_grid(N, 120.0)
+    return t, np.exp(-t**2 / 400 + 1j * 0.003 * t**2) + 0.3 * np.exp(-(t - 30)**2 / 100)
+
+
+@pytest.fixture(params=["trace.npy", "trace.h5"])
+def path(request, tmp_path):
+    if request.param.endswith(".h5"):
+        pytest.importorskip("h5py")
+    return str(tmp_path / request.param)
+
+
+def test_delay_trace_round_trip(path):
+    t, E = pulse()
+    delays = np.linspace(-60, 60, 101)
+    write_delay_trace(path, E, t, delays, "PG", block=16, omega_window=(-1.0, 1.0))
+    stored_delays, omega, trace = read_decimated(path, max_delays=len(delays), max_omega=10**6)
+    np.testing.assert_array_equal(stored_delays, delays)
+    np.testing.assert_array_equal(trace, delay_trace(E, t, delays, "PG", omega_window=(-1.0, 1.0)))
+    assert len(omega) == trace.shape[1]
+
+
+def test_decimated_read_takes_every_kth_row(path):
+    t, E = pulse()
+    delays = np.linspace(-60, 60, 101)
+    write_delay_trace(path, E, t, delays, block=16)
+    full_delays, full_omega, full = read_decimated(path, max_delays=10**6, max_omega=10**6)
+    delays_k, omega_k, decimated = read_decimated(path, max_delays=25, max_omega=64)
+    # ceil(101 / 25) = 5 et ceil(256 / 64) = 4
+    np.testing.assert_array_equal(delays_k, full_delays[::5])
+    np.testing.assert_array_equal(omega_k, full_omega[::4])
+    np.testing.assert_array_equal(decimated, full[::5, ::4])
+
+
+def test_half_delay_trace_unfolds(path):
+    t, E = pulse()
+    delays = np.linspace(-60, 60, 101)
+    write_delay_trace(path, E, t, delays, block=16, half=True)
+    stored_delays, _, half = read_decimated(path, max_delays=10**6, max_omega=10**6)
+    np.testing.assert_array_equal(stored_delays, delays[len(delays) // 2:])
+    np.testing.assert_array_equal(unfold_trace(half, len(delays)), delay_trace(E, t, delays, "SHG"))
+
+
+@pytest.mark.parametrize("N", [128, 129])
+def test_half_circular_trace_unfolds(path, N):
+    t, E = pulse(N)
+    write_circular_trace(path, E, t, block=32, half=True)
+    _, _, half = read_decimated(path, max_delays=10**6, max_omega=10**6)
+    assert half.shape == (N // 2 + 1, N)
+    np.testing.assert_array_equal(unfold_trace(half, N, axis=0, circular=True), compute_trace(E, "SHG-FROG").T)
+
+
+def test_half_trace_requires_symmetric_shg(tmp_path):
+    t, E = pulse()
+    with pytest.raises(ValueError, match="Demi-trace"):
+        write_delay_trace(str(tmp_path / "pg.npy"), E, t, np.linspace(-60, 60, 101), "PG", half=True)
+    with pytest.raises(ValueError, match="Demi-trace"):
+        write_circular_trace(str(tmp_path / "pg.npy"), E, t, "PG-FROG", half=True)
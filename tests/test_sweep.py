@@ -0,0 +1,40 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from frog.scenario import Scenario, compute_scenario
+from frog.sweep import expand_grid, find_point, load_atlas, run_sweep
+
+BASEBAND = Scenario(name="bb", FWHM_t=20.0, Nt=256, t_max=200.0, delays=(-60.0, 60.0, 32),
+                    omega_window=(4.2, 5.2), baseband=True)
+
+
+def test_baseband_sweep_matches_compute_scenario(tmp_path):
+    path = str(tmp_path / "atlas.npy")
+    grid = {"phi2": [0.0, 200.0]}
+    run_sweep(path, BASEBAND, grid, processes=1, progress=lambda *args: None)
+    traces, index = load_atlas(path)
+
+    for scenario in expand_grid(BASEBAND, grid):
+        delays, omega, trace = compute_scenario(scenario)
+        np.testing.assert_allclose(index["omega"], omega)
+        np.testing.assert_allclose(index["delays"], delays)
+        np.testing.assert_array_equal(traces[find_point(index, phi2=scenario.phi2)], trace)
+
+
+def test_baseband_signal_sweep_needs_common_axis(tmp_path):
+    # Fenêtre commune aux deux porteuses (2ω₀ pour SHG, ω₀ pour PG)
+    base = replace(BASEBAND, omega_window=(2.8, 4.2))
+    grid = {"signal": ["SHG", "PG"]}
+    with pytest.raises(ValueError, match="n_omega"):
+        run_sweep(str(tmp_path / "native.npy"), base, grid, processes=1, progress=lambda *args: None)
+
+    base = replace(base, n_omega=64)
+    path = str(tmp_path / "zoom.npy")
+    run_sweep(path, base, grid, processes=1, progress=lambda *args: None)
+    traces, index = load_atlas(path)
+    for scenario in expand_grid(base, grid):
+        _, omega, trace = compute_scenario(scenario)
+        np.testing.assert_allclose(index["omega"], omega)
+        np.testing.assert_array_equal(traces[find_point(index, signal=scenario.signal)], trace)
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from frog.pulse import time_grid
+from frog.trace import METHODS, compute_trace, delay_trace, unfold_trace
+
+
+def chirped_pulse(N):
+    # Impulsion asymétrique (chirp + satellite) : trace non triviale
+    t = time_grid(N, 200.0)
+    E = np.exp(-t**2 / 800 + 1j * 0.002 * t**2) + 0.4 * np.exp(-(t - 40)**2 / 200)
+    return t, E.astype(np.complex128)
+
+
+@pytest.mark.parametrize("N", [64, 65])
+def test_unfolded_half_trace_matches_full_trace(N):
+    _, E = chirped_pulse(N)
+    half = compute_trace(E, "SHG-FROG", half=True)
+    assert half.shape == (N, N // 2 + 1)
+    np.testing.assert_array_equal(unfold_trace(half, N, axis=1, circular=True), compute_trace(E, "SHG-FROG"))
+
+    # Sans symétrie : colonnes τ ≥ 0 identiques au bit près, colonnes τ < 0 égales aux arrondis près
+    direct = compute_trace(E, "SHG-FROG", symmetric=False)
+    np.testing.assert_array_equal(direct[:, N // 2:], half[:, :N - N // 2])
+    np.testing.assert_allclose(unfold_trace(half, N, axis=1, circular=True), direct, rtol=0,
+                               atol=1e-12 * direct.max())
+
+
+def test_unfolded_half_delay_trace_matches_full_trace():
+    t, E = chirped_pulse(128)
+    delays = np.linspace(-60, 60, 41)
+    half = delay_trace(E, t, delays, "SHG", half=True)
+    np.testing.assert_array_equal(unfold_trace(half, len(delays)), delay_trace(E, t, delays, "SHG"))
+
+    direct = delay_trace(E, t, delays, "SHG", symmetric=False)
+    np.testing.assert_array_equal(direct[len(delays) // 2:], half)
+    np.testing.assert_allclose(unfold_trace(half, len(delays)), direct, rtol=0, atol=1e-12 * direct.max())
+
+
+def loop_trace(E, method, reference):
+    # Boucle historique de FROG.py : un np.roll et une FFT par retard
+    N = len(E)
+    gate = {"SHG-FROG": E, "PG-FROG": np.abs(E)**2, "XFROG": reference}[method]
+    trace = np.zeros((N, N))
+    for i in range(N):
+        trace[:, i] = np.abs(np.fft.fftshift(np.fft.fft(E * np.roll(gate, i - N // 2))))**2
+    return trace
+
+
+@pytest.mark.parametrize("N", [256, 257, 512])
+@pytest.mark.parametrize("method", METHODS)
+def test_vectorized_trace_matches_loop(N, method):
+    t = np.linspace(-90, 90, N)
+    E = np.exp(-t**2 / (2 * 20**2)) * np.exp(1j * 0.05 * t**2)
+    reference = np.exp(-t**2 / (2 * 10**2))
+    expected = loop_trace(E, method, reference)
+    np.testing.assert_allclose(compute_trace(E, method, reference), expected, rtol=0, atol=1e-13 * expected.max())
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from zscan.components import Crystal, Layout
+from zscan.engine import run
+from zscan.optics import Bench
+from zscan.pulses import BLUE_INDEX, PASSED_CRYSTAL
+from zscan.tracing import EXIT, RayTracer
+
+
+class TaggedTracer(RayTracer):
+    """RayTracer qui numérote ses rayons (copies comprises) et note chaque événement traité."""
+
+    COLUMNS = {**RayTracer.COLUMNS, "uid": np.int64}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.next_uid = 0
+        self.visits = []
+
+    def _tag(self, index):
+        self.uid[index] = np.arange(self.next_uid, self.next_uid + len(index))
+        self.next_uid += len(index)
+        return index
+
+    def add(self, *args, **kwargs):
+        return self._tag(super().add(*args, **kwargs))
+
+    def spawn(self, parent, angle):
+        return self._tag(super().spawn(parent, angle))
+
+    def _handle(self, due):
+        self.visits.extend(zip(self.uid[due].tolist(), self.event[due].tolist()))
+        return super()._handle(due)
+
+
+@pytest.mark.parametrize("settings, expected", [
+    ({}, [0.2, 0.2, 0.8]),
+    ({"diaphragm_enabled": True}, [0.2, 0.2, 0.8]),
+    ({"non_linear_strength": 7.5}, [0.0, 0.2, 0.8]),
+    ({"diaphragm_enabled": True, "non_linear_strength": 7.5}, [0.0, 0.2, 0.8]),
+])
+def test_event_model_transmission_on_reference_bench(settings, expected):
+    # Régime établi (photodiodes bas, haut 1, haut 2) : 5 rayons émis par salve ; la lame 2
+    # renvoie vers haut 2 le rayon central transmis et sa copie réfléchie, deux rayons par salve
+    series = run(frames=1200, method="events", **settings)
+    np.testing.assert_allclose(series[600:].mean(axis=0), expected, atol=1e-12)
+
+
+def test_each_element_visited_at_most_once():
+    bench = Bench()
+    tracer = TaggedTracer(bench)
+    y = bench.laser_origin[1] + np.linspace(-40, 40, 41)
+    tracer.add(bench.laser_origin[0], y, 0.0)
+    for _ in range(1000):
+        tracer.step()
+    assert len(tracer) == 0
+    visits = np.array(tracer.visits)
+    assert len(np.unique(visits, axis=0)) == len(visits)
+    # Chaque rayon finit par sortir du banc ou être absorbé, et ses copies réfléchies aussi
+    exits = visits[visits[:, 1] == EXIT, 0]
+    assert len(exits) == len(np.unique(exits))
+    assert tracer.next_uid > len(y)
+
+
+def test_thin_crystal_hit_at_steep_angle():
+    # Face d'entrée de 1 px à 80° : le modèle par pas (5 px par image) la survolerait
+    crystal = Crystal("crystal", 800, 300, width=1, height=100, strength=3.0, threshold=0.5)
+    tracer = RayTracer(Bench(), layout=Layout([crystal]))
+    angle = np.radians(80)
+    x0, y0 = 790.0, 300 - 10 * np.tan(angle) - 10
+    tracer.add(x0, y0, angle)
+    tracer.step()
+    while not tracer.flags[0] & PASSED_CRYSTAL:
+        tracer.step()
+    intensity = tracer.intensity[0]
+    assert tracer.angle[0] == pytest.approx(angle + np.radians(crystal.strength * intensity))
+    assert tracer.color[0] == BLUE_INDEX
+    # Déviation appliquée au point exact de la face d'entrée
+    assert tracer.x[0] == pytest.approx(800.0)
+    assert tracer.y[0] == pytest.approx(y0 + 10 * np.tan(angle))
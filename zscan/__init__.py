@@ -0,0 +1,23 @@
+"""Modèles Z-scan partagés par Z_scan.py et Z_scan_pedagogique.py, sans dépendance graphique."""
+
+from .components import Layout, load_layout
+from .detectors import Detectors, RingBuffer
+from .engine import Simulation, scan
+from .optics import Bench
+from .pulses import PulseStore
+from .tracing import RayTracer
+from .transmission import compute_transmission, gaussian_beam_profile
+
+__all__ = [
+    "Bench",
+    "Detectors",
+    "Layout",
+    "PulseStore",
+    "RayTracer",
+    "RingBuffer",
+    "Simulation",
+    "compute_transmission",
+    "gaussian_beam_profile",
+    "load_layout",
+    "scan",
+]
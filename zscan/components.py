@@ -0,0 +1,314 @@
+"""
+Éléments optiques du banc décrits par des données : chaque composant porte sa
+géométrie, l'instant où un rayon le rencontre (times) et son effet sur les
+rayons qui l'atteignent (interact). Un banc est une liste de composants, lue
+depuis un fichier JSON :
+
+    {"components": [{"type": "lens", "name": "lens", "x": 600, "y": 300, "focal_length": 150}, ...]}
+
+Layout range les composants par x : pour trouver l'événement suivant d'un
+rayon, seuls les composants situés devant lui sont testés, dans l'ordre où il
+peut les atteindre, et la recherche s'arrête dès que le composant suivant est
+plus loin que le meilleur événement trouvé. Les plans (lame, lentille, cristal,
+diaphragme) sont traversés de gauche à droite ; les photodiodes sont des disques.
+"""
+import json
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+from .detectors import DETECTORS
+from .pulses import (BEAMSPLITTER_TOLERANCE, BLUE_INDEX, PASSED_BEAMSPLITTER, PASSED_BEAMSPLITTER2, PASSED_CRYSTAL,
+                     PASSED_LENS, VERTICAL_TOLERANCE)
+
+PASSED_DIAPHRAGM = 1 << 8
+ABSORBED = 1 << 9
+# Historique hérité par les copies réfléchies
+PASSED = PASSED_LENS | PASSED_CRYSTAL | PASSED_BEAMSPLITTER | PASSED_BEAMSPLITTER2 | PASSED_DIAPHRAGM
+
+
+def _plane_times(x, vx, plane_x):
+    """Instant (en images depuis l'origine) de traversée du plan x = plane_x vers la droite."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tau = (plane_x - x) / vx
+    return np.where((vx > 0) & (tau >= 0), tau, np.inf)
+
+
+def _disc_times(x, y, vx, vy, cx, cy, r):
+    """Instant d'entrée dans le disque (cx, cy, r) ; 0 si l'origine y est déjà."""
+    px, py = x - cx, y - cy
+    a = vx**2 + vy**2
+    b = px * vx + py * vy
+    c = px**2 + py**2 - r**2
+    delta = b**2 - a * c
+    with np.errstate(invalid="ignore"):
+        tau = (-b - np.sqrt(delta)) / a
+    tau = np.where(c <= 0, 0.0, tau)
+    return np.where((delta >= 0) & (tau >= 0), tau, np.inf)
+
+
+class _Plane:
+    """Composant mince en x = self.x."""
+
+    def bounds(self):
+        return self.x, self.x
+
+    def times(self, x, y, vx, vy, angle, flags):
+        return _plane_times(x, vx, self.x)
+
+
+@dataclass
+class BeamSplitter(_Plane):
+    """Lame séparatrice : copie réfléchie à `reflect_angle`, partie transmise tournée à `turn` (None : inchangée)."""
+
+    name: str
+    x: float
+    y: float
+    tolerance: float = BEAMSPLITTER_TOLERANCE  # px, demi-hauteur utile
+    reflect_angle: float = -np.pi / 2
+    turn: float = None
+    flag = PASSED_BEAMSPLITTER
+
+    def interact(self, tracer, index):
+        hit = index[np.abs(tracer.y[index] - self.y) < self.tolerance]
+        spawned = tracer.spawn(hit, self.reflect_angle)
+        if self.turn is not None:
+            tracer._turn(hit, self.turn)
+        return spawned
+
+
+@dataclass
+class Lens(_Plane):
+    """Lentille mince : tout rayon de sa hauteur est dirigé vers le foyer (x + focal_length, y)."""
+
+    name: str
+    x: float
+    y: float
+    height: float = 200
+    focal_length: float = 150
+    flag = PASSED_LENS
+
+    def interact(self, tracer, index):
+        hit = index[np.abs(tracer.y[index] - self.y) <= self.height / 2]
+        tracer._turn(hit, np.arctan2(self.y - tracer.y[hit], self.focal_length))
+
+
+@dataclass
+class Crystal(_Plane):
+    """Cristal non linéaire (face d'entrée en x) : déviation ∝ intensité, SHG au-dessus de `threshold`."""
+
+    name: str
+    x: float
+    y: float
+    width: float = 20  # affichage
+    height: float = 100
+    strength: float = 3.0  # degrés par unité d'intensité
+    threshold: float = 2.0
+    flag = PASSED_CRYSTAL
+
+    def interact(self, tracer, index):
+        hit = index[np.abs(tracer.y[index] - self.y) <= self.height / 2]
+        intensity = tracer.intensity[hit]
+        tracer._turn(hit, tracer.angle[hit] + np.radians(self.strength * intensity))
+        tracer.color[hit[intensity > self.threshold]] = BLUE_INDEX
+
+
+@dataclass
+class Diaphragm(_Plane):
+    """Diaphragme : absorbe, s'il est en place, les rayons à plus de aperture/2 de y."""
+
+    name: str
+    x: float
+    y: float
+    aperture: float = 60
+    enabled: bool = False
+    flag = PASSED_DIAPHRAGM
+
+    def interact(self, tracer, index):
+        if self.enabled:
+            tracer.flags[index[np.abs(tracer.y[index] - self.y) > self.aperture // 2]] |= ABSORBED
+
+
+@dataclass
+class Photodiode:
+    """
+    Photodiode (disque) reliée à la voie `channel` des Detectors ; avec
+    `acceptance`, seuls les rayons à moins de `acceptance` rad de `direction` comptent.
+    """
+
+    name: str
+    x: float
+    y: float
+    radius: float = 15
+    channel: int = 0
+    acceptance: float = None
+    direction: float = -np.pi / 2
+
+    @property
+    def flag(self):
+        return DETECTORS[self.channel]
+
+    def bounds(self):
+        return self.x - self.radius, self.x + self.radius
+
+    def times(self, x, y, vx, vy, angle, flags):
+        tau = _disc_times(x, y, vx, vy, self.x, self.y, self.radius)
+        blocked = (flags & self.flag) != 0
+        if self.acceptance is not None:
+            blocked |= np.abs(angle - self.direction) > self.acceptance
+        return np.where(blocked, np.inf, tau)
+
+    def interact(self, tracer, index):
+        if len(index) and tracer.detectors is not None:
+            tracer.detectors.hit(self.flag, len(index))
+
+
+REGISTRY = {"beamsplitter": BeamSplitter, "lens": Lens, "crystal": Crystal, "diaphragm": Diaphragm,
+            "photodiode": Photodiode}
+
+# Réglages de l'interface et des balayages → (type de composant, attribut)
+SETTINGS = {
+    "non_linear_strength": (Crystal, "strength"),
+    "shg_threshold": (Crystal, "threshold"),
+    "crystal_height": (Crystal, "height"),
+    "diaphragm_enabled": (Diaphragm, "enabled"),
+    "diaphragm_aperture": (Diaphragm, "aperture"),
+}
+
+
+class Layout:
+    """Composants d'un banc et leur index spatial (bornes en x triées)."""
+
+    def __init__(self, components):
+        self.components = list(components)
+        names = [c.name for c in self.components]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Noms de composants en double : {sorted(n for n in set(names) if names.count(n) > 1)}")
+        self.reindex()
+
+    def __iter__(self):
+        return iter(self.components)
+
+    def __len__(self):
+        return len(self.components)
+
+    def __getitem__(self, name):
+        for component in self.components:
+            if component.name == name:
+                return component
+        raise KeyError(name)
+
+    def reindex(self):
+        """Recalcule l'index après un déplacement de composant."""
+        bounds = np.array([c.bounds() for c in self.components], dtype=float).reshape(-1, 2)
+        self.x_min, self.x_max = bounds[:, 0], bounds[:, 1]
+        # Rayons vers la droite : composants par bord gauche croissant ; vers la gauche : bord droit décroissant
+        self._ascending = np.argsort(self.x_min, kind="stable")
+        self._descending = np.argsort(-self.x_max, kind="stable")
+        # Plans confondus (même x) : traversés une fois chacun, dans l'ordre de _ascending
+        self._rank = np.empty(len(self.components), np.int16)
+        self._rank[self._ascending] = np.arange(len(self.components))
+        self._thin = self.x_min == self.x_max
+        # Plus grande étendue en x : au-delà, un composant est entièrement derrière le rayon
+        self._extent = float((self.x_max - self.x_min).max(initial=0.0))
+
+    def configure(self, **settings):
+        """Applique les réglages de SETTINGS à tous les composants du type concerné."""
+        unknown = set(settings) - set(SETTINGS)
+        if unknown:
+            raise ValueError(f"Réglages inconnus : {sorted(unknown)} (possibles : {', '.join(SETTINGS)})")
+        for name, value in settings.items():
+            kind, attribute = SETTINGS[name]
+            for component in self.components:
+                if isinstance(component, kind):
+                    setattr(component, attribute, value)
+
+    def next_event(self, x, y, vx, vy, angle, flags, last):
+        """
+        Instant (depuis l'origine du segment) et indice du premier composant
+        rencontré par chaque rayon ; (inf, -1) s'il n'y en a pas. `last` : dernier
+        composant traversé, exclu (le rayon est sur lui), ainsi que les plans
+        confondus avec lui qui le précèdent dans l'ordre de traversée.
+        """
+        best = np.full(len(x), np.inf)
+        which = np.full(len(x), -1, dtype=np.int16)
+        for forward in (True, False):
+            rays = np.flatnonzero(vx >= 0) if forward else np.flatnonzero(vx < 0)
+            order = self._ascending if forward else self._descending
+            # Chaque rayon entre dans le parcours au premier composant qui n'est pas entièrement derrière lui
+            if forward:
+                start = np.searchsorted(self.x_min[order], x[rays] - self._extent)
+            else:
+                start = np.searchsorted(-self.x_max[order], -(x[rays] + self._extent))
+            by_start = np.argsort(start, kind="stable")
+            rays, start = rays[by_start], start[by_start]
+            entering = np.searchsorted(start, np.arange(len(order) + 1))
+            active = rays[:0]
+            for j, k in enumerate(order):
+                active = np.concatenate((active, rays[entering[j]:entering[j + 1]]))
+                if not len(active):
+                    if entering[j + 1] == len(rays):
+                        break
+                    continue
+                near, far = (self.x_min[k], self.x_max[k]) if forward else (self.x_max[k], self.x_min[k])
+                distance = (near - x[active]) if forward else (x[active] - near)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    reach = np.where(distance <= 0, 0.0, distance / np.abs(vx[active]))
+                # Composants triés : un rayon qui ne peut atteindre k avant son meilleur événement n'atteindra pas les suivants
+                active = active[reach < best[active]]
+                behind = (x[active] > far) if forward else (x[active] < far)
+                c = active[~behind & (last[active] != k)]
+                if not len(c):
+                    continue
+                tau = self.components[k].times(x[c], y[c], vx[c], vy[c], angle[c], flags[c])
+                if self._thin[k]:
+                    # Sans cela, deux plans au même x se renverraient le rayon indéfiniment (tau = 0)
+                    crossed = (last[c] >= 0) & (self._rank[last[c]] >= self._rank[k])
+                    tau = np.where((tau == 0) & crossed, np.inf, tau)
+                better = tau < best[c]
+                best[c[better]] = tau[better]
+                which[c[better]] = k
+        return best, which
+
+    @classmethod
+    def from_bench(cls, bench):
+        """Composants du banc par défaut (géométrie et réglages de `bench`)."""
+        b = bench
+        return cls([
+            BeamSplitter("beamsplitter", b.beamsplitter_x, b.beamsplitter_y),
+            BeamSplitter("beamsplitter2", b.beamsplitter2_x, b.beamsplitter2_y, turn=-np.pi / 2),
+            Lens("lens", b.lens_x, b.lens_y, b.lens_height, b.focal_length),
+            Crystal("crystal", b.crystal_x, b.crystal_y, b.crystal_width, b.crystal_height,
+                    b.non_linear_strength, b.shg_threshold),
+            Diaphragm("diaphragm", b.diaphragm_x, b.lens_y, b.diaphragm_aperture, b.diaphragm_enabled),
+            Photodiode("photodiode_bottom", b.photodiode_bottom_x, b.photodiode_bottom_y, b.photodiode_radius, 0),
+            Photodiode("photodiode_top", b.photodiode_top_x, b.photodiode_top_y, b.photodiode_radius, 1,
+                       VERTICAL_TOLERANCE),
+            Photodiode("photodiode_top2", b.photodiode_top2_x, b.photodiode_top2_y, b.photodiode_radius, 2,
+                       VERTICAL_TOLERANCE),
+        ])
+
+    def to_dict(self):
+        kinds = {kind: name for name, kind in REGISTRY.items()}
+        return {"components": [{"type": kinds[type(c)], **{f.name: getattr(c, f.name) for f in fields(c)}}
+                               for c in self.components]}
+
+
+def component_from_dict(params):
+    """Composant décrit par {"type": ..., "name": ..., paramètres}."""
+    params = dict(params)
+    kind = params.pop("type", None)
+    if kind not in REGISTRY:
+        raise ValueError(f"Type de composant inconnu : {kind!r} (possibles : {', '.join(REGISTRY)})")
+    cls = REGISTRY[kind]
+    unknown = set(params) - {f.name for f in fields(cls)}
+    if unknown:
+        raise ValueError(f"Paramètres inconnus pour {kind} : {sorted(unknown)}")
+    return cls(**params)
+
+
+def load_layout(path):
+    """Lit un banc JSON {"components": [...]}."""
+    with open(path, encoding="utf-8") as f:
+        config = json.load(f)
+    return Layout(component_from_dict(params) for params in config["components"])
@@ -0,0 +1,138 @@
+"""
+Photodiodes du banc comptées par événements : PulseStore signale chaque émission
+et chaque détection au moment où elle a lieu, les totaux sont tenus à jour en
+O(1) par image (cumul, fenêtre de N images, fenêtre d'une seconde) et les
+historiques sont des tampons circulaires de taille fixe.
+
+Transmission d'une photodiode sur une fenêtre = détections / impulsions émises
+par le laser sur la même fenêtre. Le script historique divisait, à chaque image,
+le nombre d'impulsions présentes déjà détectées par le nombre d'impulsions
+présentes : normalization="alive" garde cette définition pour l'historique.
+"""
+import numpy as np
+
+from .pulses import DETECTED_BOTTOM, DETECTED_TOP, DETECTED_TOP2
+
+# Photodiodes dans l'ordre des colonnes des compteurs
+DETECTORS = (DETECTED_BOTTOM, DETECTED_TOP, DETECTED_TOP2)
+DETECTOR_NAMES = ("bas", "haut 1", "haut 2")
+# Normalisation de l'historique : par impulsion émise (fenêtre glissante) ou par impulsion présente (instantanée)
+NORMALIZATIONS = ("emitted", "alive")
+
+
+class RingBuffer:
+    """Les `capacity` dernières lignes ajoutées (tableau de forme (capacity, *shape))."""
+
+    def __init__(self, capacity, shape=(), dtype=np.float64):
+        self._data = np.zeros((capacity, *shape), dtype)
+        self._head = 0  # prochaine case écrite
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def capacity(self):
+        return len(self._data)
+
+    def append(self, value):
+        """Ajoute `value` ; retourne la ligne évincée (zéros tant que le tampon n'est pas plein)."""
+        evicted = self._data[self._head].copy() if self._size == self.capacity else np.zeros_like(self._data[0])
+        self._data[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        return evicted
+
+    def values(self):
+        """Copie des lignes, de la plus ancienne à la plus récente."""
+        if self._size < self.capacity:
+            return self._data[:self._size].copy()
+        return np.concatenate((self._data[self._head:], self._data[:self._head]))
+
+    def clear(self):
+        self._head = self._size = 0
+
+
+class WindowedSum:
+    """Somme glissante des `frames` derniers comptages, mise à jour sans re-sommer."""
+
+    def __init__(self, frames, shape=()):
+        self._counts = RingBuffer(frames, shape, np.int64)
+        self.total = np.zeros(shape, np.int64)
+
+    def push(self, counts):
+        self.total += counts - self._counts.append(counts)
+
+    def clear(self):
+        self._counts.clear()
+        self.total[...] = 0
+
+
+def _ratio(hits, emitted):
+    return hits / emitted if emitted else np.zeros(len(hits))
+
+
+class Detectors:
+    """
+    Compteurs des trois photodiodes. Une image : emit()/hit() pendant
+    PulseStore.emit/step, puis end_frame() qui clôt l'image et alimente fenêtres
+    et historique.
+
+    `window` : fenêtre en images de la transmission tracée, `fps` : images par
+    seconde (fenêtre « par seconde »), `history` : points gardés pour le graphe,
+    `normalization` : grandeur historisée (NORMALIZATIONS).
+    """
+
+    def __init__(self, fps=60, window=30, history=100, normalization="emitted"):
+        if normalization not in NORMALIZATIONS:
+            raise ValueError(f"Normalisation inconnue : {normalization!r} (possibles : {', '.join(NORMALIZATIONS)})")
+        self.fps = fps
+        self.window = window
+        self.normalization = normalization
+        self._channels = {flag: i for i, flag in enumerate(DETECTORS)}
+        # Colonne 0 : impulsions émises, puis une colonne par photodiode
+        self._frame = np.zeros(1 + len(DETECTORS), np.int64)
+        self.totals = np.zeros_like(self._frame)
+        self._per_second = WindowedSum(fps, self._frame.shape)
+        self._per_window = WindowedSum(window, self._frame.shape)
+        self.history = RingBuffer(history, (len(DETECTORS),))
+        self.frames = 0
+
+    def emit(self, n):
+        """`n` impulsions émises par le laser dans l'image courante."""
+        self._frame[0] += n
+
+    def hit(self, flag, n=1):
+        """`n` détections de la photodiode `flag` dans l'image courante."""
+        self._frame[1 + self._channels[flag]] += n
+
+    def end_frame(self, alive=None):
+        """
+        Clôt l'image : cumul, fenêtres glissantes et historique de transmission.
+        `alive` : part des impulsions présentes détectées par chaque photodiode
+        (PulseStore.detected_fraction), historisée si normalization="alive".
+        """
+        self.totals += self._frame
+        self._per_second.push(self._frame)
+        self._per_window.push(self._frame)
+        self._frame[...] = 0
+        self.frames += 1
+        if self.normalization == "alive":
+            if alive is None:
+                raise ValueError("normalization='alive' : end_frame attend la part des impulsions présentes détectées")
+            self.history.append(alive)
+        else:
+            self.history.append(self.transmission("window"))
+
+    def transmission(self, span="window"):
+        """Transmission des photodiodes sur `span` : "window" (N images), "second" ou "total"."""
+        counts = {"window": self._per_window.total, "second": self._per_second.total, "total": self.totals}[span]
+        return _ratio(counts[1:], counts[0])
+
+    def reset(self):
+        self._frame[...] = 0
+        self.totals[...] = 0
+        self._per_second.clear()
+        self._per_window.clear()
+        self.history.clear()
+        self.frames = 0
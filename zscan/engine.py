@@ -0,0 +1,169 @@
+"""
+Banc de Z_scan_pedagogique.py sans affichage : pas de temps fixe (une image =
+un pas de PulseStore), autant d'images par seconde que le processeur le permet.
+
+    python -m zscan.engine --frames 3000 -g non_linear_strength=1,3,5 -g diaphragm_aperture=40,60 -o scan.npz
+    python -m zscan.engine --layout scenarios/zscan_bench.json -g shg_threshold=1,2
+
+Chaque point du balayage (produit cartésien des valeurs -g) est simulé dans un
+processus séparé et donne la série de transmission des trois photodiodes,
+(image, photodiode). `seed` fixe le bruit de pointé du laser (`jitter`, px) :
+deux exécutions de mêmes réglages donnent la même série.
+"""
+import argparse
+import itertools
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from .components import SETTINGS, load_layout
+from .detectors import DETECTOR_NAMES, NORMALIZATIONS, Detectors
+from .optics import Bench
+from .pulses import PulseStore
+from .tracing import RayTracer
+
+FPS = 60
+
+# Cœurs de simulation : "events" saute d'élément en élément (tracing), "steps" avance de SPEED px par image.
+# "steps" reproduit LightPulse, y compris ses artefacts : les copies réfléchies par la lame 2 repartent
+# sans historique, repassent la lentille et atteignent la photodiode basse (bas ≈ 80 % quels que soient
+# cristal et diaphragme, contre 20 % et 0 % à non_linear_strength = 7,5 pour "events")
+METHODS = {"events": RayTracer, "steps": PulseStore}
+
+# Réglages du banc accessibles au balayage (attributs de Bench, composants via SETTINGS)
+SCANNABLE = tuple(SETTINGS)
+
+
+def make_bench(**settings):
+    """Bench par défaut modifié par `settings` (noms de SCANNABLE)."""
+    unknown = set(settings) - set(SCANNABLE)
+    if unknown:
+        raise ValueError(f"Réglages inconnus : {sorted(unknown)} (possibles : {', '.join(SCANNABLE)})")
+    bench = Bench()
+    for name, value in settings.items():
+        setattr(bench, name, value)
+    return bench
+
+
+class Simulation:
+    """
+    Impulsions, photodiodes et émission laser d'un banc ; advance() joue une
+    image. `layout` (zscan.components.Layout) remplace les éléments de `bench`
+    (méthode "events" seulement). `normalization` : voir zscan.detectors.
+    """
+
+    def __init__(self, bench=None, seed=0, jitter=0.0, fps=FPS, window=30, history=100, method="events",
+                 layout=None, normalization="emitted"):
+        self.bench = bench if bench is not None else Bench()
+        self.jitter = jitter
+        self.rng = np.random.default_rng(seed)
+        self.detectors = Detectors(fps, window, history, normalization)
+        if layout is None:
+            self.pulses = METHODS[method](self.bench, detectors=self.detectors)
+        elif method == "events":
+            self.pulses = RayTracer(self.bench, detectors=self.detectors, layout=layout)
+        else:
+            raise ValueError("Le modèle par pas ne connaît que les éléments de Bench ; layout demande method='events'")
+        self.frame_counter = 0
+
+    def advance(self):
+        self.frame_counter += 1
+        self.pulses.emit(self.frame_counter, self.jitter, self.rng)
+        self.pulses.step()
+        alive = self.pulses.detected_fraction() if self.detectors.normalization == "alive" else None
+        self.detectors.end_frame(alive)
+
+    def reset(self):
+        """Vide le banc et les compteurs (réglages et compteur d'images conservés)."""
+        self.pulses.clear()
+        self.detectors.reset()
+
+
+def run(frames=3000, seed=0, jitter=0.0, window=30, method="events", layout=None, normalization="emitted",
+        **settings):
+    """
+    Série (frames, photodiode) de la transmission glissante sur `window` images
+    (normalization="alive" : part instantanée des impulsions présentes détectées).
+    `layout` : Layout ou fichier JSON de composants, auquel `settings` s'appliquent.
+    """
+    if isinstance(layout, str):
+        layout = load_layout(layout)
+    if layout is not None:
+        layout.configure(**settings)
+    sim = Simulation(make_bench(**settings), seed, jitter, window=window, history=frames, method=method,
+                     layout=layout, normalization=normalization)
+    for _ in range(frames):
+        sim.advance()
+    return sim.detectors.history.values()
+
+
+def expand_grid(grid):
+    """Réglages de chaque point du produit cartésien de `grid` {nom: [valeurs]}."""
+    names = sorted(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[k] for k in names))]
+
+
+def _run_point(settings, **kwargs):
+    return run(**kwargs, **settings)
+
+
+def scan(grid, frames=3000, seed=0, jitter=0.0, window=30, method="events", layout=None, processes=None,
+         normalization="emitted"):
+    """
+    Simule chaque point de `grid` dans un pool de processus. Retourne (réglages
+    des points, séries (point, image, photodiode)). Tous les points partagent
+    `seed` : mêmes tirages de pointé, seuls les réglages diffèrent. `layout` :
+    comme pour run() (de préférence un chemin, relu par chaque processus).
+    """
+    points = expand_grid(grid)
+    for settings in points:
+        make_bench(**settings)  # réglages vérifiés avant de lancer les processus
+    worker = partial(_run_point, frames=frames, seed=seed, jitter=jitter, window=window, method=method,
+                     layout=layout, normalization=normalization)
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        series = list(pool.map(worker, points))
+    return points, np.stack(series)
+
+
+def _parse_values(text):
+    """"nom=v1,v2,…" → (nom, [valeurs JSON])."""
+    name, _, values = text.partition("=")
+    if not values:
+        raise argparse.ArgumentTypeError(f"attendu nom=v1,v2,… : {text!r}")
+    return name, [json.loads(v) for v in values.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m zscan.engine", description="Z-scan pédagogique sans affichage")
+    parser.add_argument("--frames", type=int, default=3000, help="images simulées par point")
+    parser.add_argument("-g", "--grid", type=_parse_values, action="append", default=[],
+                        help=f"réglage balayé, nom=v1,v2,… ({', '.join(SCANNABLE)})")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jitter", type=float, default=0.0, help="bruit de pointé du laser (px, écart-type)")
+    parser.add_argument("--window", type=int, default=30, help="fenêtre de la transmission glissante (images)")
+    parser.add_argument("--method", choices=sorted(METHODS), default="events",
+                        help="events : intersections analytiques, steps : pas de SPEED px par image")
+    parser.add_argument("--normalization", choices=NORMALIZATIONS, default="emitted",
+                        help="emitted : détections / impulsions émises sur la fenêtre, "
+                             "alive : part des impulsions présentes détectées (script historique)")
+    parser.add_argument("--layout", help="banc JSON de composants (zscan.components), défaut : Bench")
+    parser.add_argument("--processes", type=int, default=None, help="processus de calcul (défaut : nombre de cœurs)")
+    parser.add_argument("-o", "--output", help="fichier .npz (séries, réglages des points)")
+    args = parser.parse_args(argv)
+
+    points, series = scan(dict(args.grid), args.frames, args.seed, args.jitter, args.window, args.method,
+                          args.layout, args.processes, args.normalization)
+    # Moyenne sur la seconde moitié : régime établi
+    steady = series[:, args.frames // 2:].mean(axis=1)
+    for settings, transmission in zip(points, steady):
+        cells = "  ".join(f"{name} {100 * t:5.1f} %" for name, t in zip(DETECTOR_NAMES, transmission))
+        print(f"{json.dumps(settings)}  {cells}", file=sys.stderr)
+    if args.output:
+        np.savez(args.output, series=series, points=json.dumps(points), detectors=np.array(DETECTOR_NAMES))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Banc optique de Z_scan_pedagogique.py sans pygame : géométrie et réglages. Les
+impulsions sont dans zscan.pulses (PulseStore) et zscan.tracing (RayTracer),
+l'affichage et l'interface restent dans le script.
+"""
+
+WIDTH, HEIGHT = 1200, 600
+RED = (255, 0, 0)
+BLUE = (100, 100, 255)
+
+
+class Bench:
+    """Géométrie du banc et réglages modifiables par l'interface (coordonnées écran)."""
+
+    def __init__(self, width=WIDTH, height=HEIGHT):
+        self.width = width
+        self.height = height
+
+        self.non_linear_strength = 3.0
+        self.shg_threshold = 2.0
+
+        # Optique setup
+        self.lens_x, self.lens_y = width // 2, height // 2
+        self.lens_height = 200
+        self.focal_length = 150
+
+        self.crystal_x = self.lens_x + 200
+        self.crystal_width = 20
+        self.crystal_y = self.lens_y
+        self.crystal_height = 100
+
+        self.laser_origin = (100, height // 2)
+        self.diaphragm_enabled = False
+        self.diaphragm_aperture = 60
+        self.diaphragm_x = self.crystal_x + 100
+
+        self.photodiode_bottom_x = self.diaphragm_x + 30
+        self.photodiode_bottom_y = self.lens_y
+
+        # Photodiode haute sur trajectoire réfléchie par la lame séparatrice principale
+        self.beamsplitter_x = self.lens_x - 100
+        self.beamsplitter_y = self.lens_y
+
+        self.photodiode_top_x = self.beamsplitter_x + 0
+        self.photodiode_top_y = self.beamsplitter_y - 100
+
+        self.photodiode_radius = 15
+
+        # Deuxième lame séparatrice
+        self.beamsplitter2_x = self.crystal_x + 50
+        self.beamsplitter2_y = self.lens_y
+
+        # Photodiode haute 2 sur trajectoire réfléchie par la deuxième lame séparatrice
+        self.photodiode_top2_x = self.beamsplitter2_x + 0
+        self.photodiode_top2_y = self.beamsplitter2_y - 100
@@ -0,0 +1,208 @@
+"""
+Impulsions du banc stockées en colonnes (struct of arrays) : une image avance
+toutes les impulsions en quelques opérations NumPy, chaque élément optique
+s'applique comme un masque. Même modèle que LightPulse.update (modèle historique,
+benchmarks/legacy_zscan.py), sans objet par rayon.
+"""
+import numpy as np
+
+from .optics import BLUE, RED
+
+# Couleurs : indices dans PALETTE
+PALETTE = (RED, BLUE)
+RED_INDEX, BLUE_INDEX = 0, 1
+
+# Indicateurs (bits du tableau `flags`)
+PASSED_LENS = 1 << 0
+PASSED_CRYSTAL = 1 << 1
+PASSED_BEAMSPLITTER = 1 << 2
+PASSED_BEAMSPLITTER2 = 1 << 3
+TRANSMITTED = 1 << 4
+DETECTED_BOTTOM = 1 << 5
+DETECTED_TOP = 1 << 6
+DETECTED_TOP2 = 1 << 7
+
+SPEED = 5
+LENGTH = 10
+# Tolérance de LightPulse sur la position des lames et l'angle vertical des photodiodes hautes
+BEAMSPLITTER_TOLERANCE = 5
+VERTICAL_TOLERANCE = 0.1
+
+# dx, dy : pas par image (_velocity de l'angle), tenus à jour par _turn
+_COLUMNS = {"x": np.float64, "y": np.float64, "angle": np.float64, "dx": np.float64, "dy": np.float64,
+            "intensity": np.float64, "color": np.uint8, "flags": np.uint16}
+
+
+def _velocity(angle):
+    """
+    Pas par image (SPEED · cos, sin de `angle`). Composantes nulles aux arrondis
+    près (cos(-π/2) ≈ 6e-17) ramenées à 0 : un rayon vertical ne traverse aucun plan x.
+    """
+    dx, dy = np.cos(angle) * SPEED, np.sin(angle) * SPEED
+    return np.where(np.abs(dx) < 1e-9, 0.0, dx), np.where(np.abs(dy) < 1e-9, 0.0, dy)
+
+
+class PulseStore:
+    """
+    Toutes les impulsions du banc : une colonne par attribut, `len(store)`
+    impulsions actives. Émissions et détections sont signalées à `detectors`
+    (zscan.detectors.Detectors) quand il est fourni.
+    """
+
+    # Colonnes et types ; les sous-classes en ajoutent
+    COLUMNS = _COLUMNS
+
+    def __init__(self, bench, capacity=1024, detectors=None):
+        self.bench = bench
+        self.detectors = detectors
+        self.size = 0
+        self._columns = {name: np.zeros(capacity, dtype) for name, dtype in self.COLUMNS.items()}
+
+    def __len__(self):
+        return self.size
+
+    def __getattr__(self, name):
+        # Vues sur les impulsions actives : store.x, store.flags, …
+        columns = self.__dict__.get("_columns")
+        if columns is None or name not in columns:
+            raise AttributeError(name)
+        return columns[name][:self.size]
+
+    def _reserve(self, n):
+        capacity = len(self._columns["x"])
+        if n <= capacity:
+            return
+        capacity = max(n, 2 * capacity)
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, column.dtype)
+            grown[:self.size] = column[:self.size]
+            self._columns[name] = grown
+
+    def add(self, x, y, angle, color=RED_INDEX):
+        """Ajoute des impulsions (scalaires ou tableaux diffusés), indicateurs à zéro."""
+        x, y, angle, color = np.broadcast_arrays(*(np.atleast_1d(v) for v in (x, y, angle, color)))
+        start, stop = self.size, self.size + len(x)
+        self._reserve(stop)
+        c = self._columns
+        c["x"][start:stop] = x
+        c["y"][start:stop] = y
+        c["angle"][start:stop] = angle
+        c["dx"][start:stop], c["dy"][start:stop] = _velocity(angle)
+        c["color"][start:stop] = color
+        c["intensity"][start:stop] = np.maximum(1.0, 1.0 + np.abs(y - self.bench.lens_y) / 50)
+        c["flags"][start:stop] = 0
+        self.size = stop
+
+    def clear(self):
+        self.size = 0
+
+    def emit(self, frame_counter, jitter=0.0, rng=None):
+        """
+        Émission laser : 5 impulsions toutes les 10 images (emit_pulses).
+        `jitter` : bruit de pointé gaussien en px, tiré par `rng`.
+        """
+        if frame_counter % 10 == 0:
+            x0, y0 = self.bench.laser_origin
+            y = y0 + 10 * np.arange(-2, 3)
+            if jitter:
+                y = y + rng.normal(0.0, jitter, len(y))
+            self.add(x0, y, 0.0)
+            if self.detectors is not None:
+                self.detectors.emit(5)
+
+    def count(self, flag):
+        """Nombre d'impulsions actives portant l'indicateur `flag`."""
+        return int(np.count_nonzero(self.flags & flag))
+
+    def detected_fraction(self):
+        """
+        Part des impulsions présentes déjà détectées par chaque photodiode (bas,
+        haut 1, haut 2) : transmission du script historique, 0 sur un banc vide.
+        """
+        flags = (DETECTED_BOTTOM, DETECTED_TOP, DETECTED_TOP2)
+        return np.array([self.count(flag) / self.size if self.size else 0.0 for flag in flags])
+
+    def _turn(self, index, angle):
+        """Nouvel angle pour les impulsions `index` ; leur pas par image suit."""
+        self.angle[index] = angle
+        self.dx[index], self.dy[index] = _velocity(self.angle[index])
+
+    def step(self):
+        """Avance toutes les impulsions d'une image (step_pulses) et retire celles sorties du banc."""
+        b = self.bench
+        x, y, flags = self.x, self.y, self.flags
+        # Pas par image en cache : seuls les rayons déviés recalculent cos/sin
+        x += self.dx
+        y += self.dy
+
+        # Chaque élément ne touche qu'une poignée de rayons : tests par comparaisons sur
+        # tout le banc, calcul exact sur les seuls indices candidats
+        reflected = []
+        for flag, split_x, split_y, turn in ((PASSED_BEAMSPLITTER, b.beamsplitter_x, b.beamsplitter_y, False),
+                                            (PASSED_BEAMSPLITTER2, b.beamsplitter2_x, b.beamsplitter2_y, True)):
+            crossing = np.flatnonzero(((flags & flag) == 0) & (x >= split_x))
+            flags[crossing] |= flag
+            hit = crossing[np.abs(y[crossing] - split_y) < BEAMSPLITTER_TOLERANCE]
+            # Copie réfléchie vers le haut, ajoutée après l'image
+            reflected.append((x[hit], y[hit], self.color[hit]))
+            if turn:
+                # Lame secondaire : la partie transmise part aussi vers le haut
+                self._turn(hit, -np.pi / 2)
+
+        # Lentille : rayon dirigé vers le foyer
+        crossing = np.flatnonzero(((flags & PASSED_LENS) == 0) & (x >= b.lens_x))
+        self._turn(crossing, np.arctan2(b.lens_y - y[crossing], b.focal_length))
+        flags[crossing] |= PASSED_LENS
+
+        # Cristal : déviation proportionnelle à l'intensité, SHG au-dessus du seuil
+        crossing = np.flatnonzero(((flags & PASSED_CRYSTAL) == 0) & (x >= b.crystal_x) & (x <= b.crystal_x + b.crystal_width))
+        intensity = self.intensity[crossing]
+        self._turn(crossing, self.angle[crossing] + np.radians(b.non_linear_strength * intensity))
+        self.color[crossing[intensity > b.shg_threshold]] = BLUE_INDEX
+        flags[crossing] |= PASSED_CRYSTAL
+
+        keep = (x <= b.width) & (y >= 0) & (y <= b.height)
+        flags[~keep] |= TRANSMITTED
+        if b.diaphragm_enabled:
+            half = b.diaphragm_aperture // 2
+            keep &= ~((x >= b.diaphragm_x) & ((y > b.lens_y + half) | (y < b.lens_y - half)))
+
+        # Photodiodes : basse sur le faisceau transmis, hautes sur les faisceaux montants
+        r = b.photodiode_radius
+        for flag, diode_x, diode_y, vertical in ((DETECTED_BOTTOM, b.photodiode_bottom_x, b.photodiode_bottom_y, False),
+                                                 (DETECTED_TOP, b.photodiode_top_x, b.photodiode_top_y, True),
+                                                 (DETECTED_TOP2, b.photodiode_top2_x, b.photodiode_top2_y, True)):
+            left = diode_x if flag == DETECTED_BOTTOM else diode_x - r
+            near = np.flatnonzero(((flags & flag) == 0) & (x >= left) & (x <= diode_x + r)
+                                  & (y >= diode_y - r) & (y <= diode_y + r))
+            inside = (x[near] - diode_x)**2 + (y[near] - diode_y)**2 <= r**2
+            if vertical:
+                inside &= np.abs(self.angle[near] + np.pi / 2) <= VERTICAL_TOLERANCE
+            flags[near[inside]] |= flag
+            hits = int(np.count_nonzero(inside))
+            if hits and self.detectors is not None:
+                self.detectors.hit(flag, hits)
+
+        self._compact(keep)
+        for rx, ry, rcolor in reflected:
+            self.add(rx, ry, -np.pi / 2, rcolor)
+
+    def _compact(self, keep):
+        """
+        Ne garde que les impulsions `keep` : chaque trou avant la nouvelle fin est
+        comblé par une impulsion vivante de la queue. Coût proportionnel au
+        nombre de rayons retirés ; l'ordre des impulsions n'est pas conservé.
+        """
+        dead = np.flatnonzero(~keep)
+        if not len(dead):
+            return
+        kept = self.size - len(dead)
+        holes = dead[dead < kept]
+        movers = kept + np.flatnonzero(keep[kept:])
+        for column in self._columns.values():
+            column[holes] = column[movers]
+        self.size = kept
+
+    def segments(self):
+        """Extrémités (x0, y0, x1, y1) des traits affichés pour chaque impulsion."""
+        return self.x, self.y, self.x + np.cos(self.angle) * LENGTH, self.y + np.sin(self.angle) * LENGTH
@@ -0,0 +1,127 @@
+"""
+Tracé de rayons par événements : au lieu d'avancer chaque impulsion de SPEED px
+par image et de comparer sa position à chaque élément, on calcule analytiquement
+l'instant où sa trajectoire rectiligne rencontre le prochain élément (plan de la
+lame, de la lentille, face d'entrée du cristal, plan du diaphragme, disque d'une
+photodiode, bord du banc) et on saute directement à cet événement. Un rayon ne
+coûte rien entre deux éléments ; sa position affichée est interpolée sur son
+segment courant. Un parcours complet coûte O(éléments) par rayon. Les éléments
+et leurs instants de rencontre viennent d'un Layout (zscan.components).
+
+Différences avec le modèle par pas (PulseStore) : les éléments minces ne sont
+plus manqués, la lentille et le cristal n'agissent que sur leur hauteur, le
+diaphragme est un plan (pas un demi-espace), la photodiode basse est un disque,
+et les copies réfléchies gardent l'historique de leur rayon parent.
+"""
+import numpy as np
+
+from .components import ABSORBED, PASSED, Layout
+from .pulses import _COLUMNS, LENGTH, RED_INDEX, TRANSMITTED, PulseStore
+
+# Événement « sortie du banc » (sinon : indice du composant dans le Layout)
+EXIT = -1
+
+# t : début du segment courant (image), (x, y) : son origine ; t_next, event : prochain événement ;
+# last : dernier composant traversé (le rayon est dessus, il est exclu de la recherche suivante)
+_TRACER_COLUMNS = {**_COLUMNS, "t": np.float64, "t_next": np.float64, "event": np.int16, "last": np.int16}
+
+
+def _exit_times(x, y, vx, vy, width, height):
+    """Instant de sortie du banc [0, width] × [0, height]."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tx = np.where(vx > 0, (width - x) / vx, np.where(vx < 0, -x / vx, np.inf))
+        ty = np.where(vy > 0, (height - y) / vy, np.where(vy < 0, -y / vy, np.inf))
+    return np.maximum(np.minimum(tx, ty), 0.0)
+
+
+class RayTracer(PulseStore):
+    """
+    Même interface que PulseStore (emit, step, count, segments) ; `now` est
+    l'instant courant en images. (x, y) est l'origine du segment courant : la
+    position à l'instant T vaut (x, y) + (dx, dy)·(T - t). Les éléments sont
+    ceux de `layout` (zscan.components), par défaut ceux de `bench`.
+    """
+
+    COLUMNS = _TRACER_COLUMNS
+
+    def __init__(self, bench, capacity=1024, detectors=None, layout=None):
+        super().__init__(bench, capacity, detectors)
+        self.layout = layout if layout is not None else Layout.from_bench(bench)
+        self.now = 0.0
+
+    def add(self, x, y, angle, color=RED_INDEX, t=None):
+        """Comme PulseStore.add, segments partant à l'instant `t` (défaut : maintenant) ; retourne leurs indices."""
+        start = self.size
+        super().add(x, y, angle, color)
+        index = np.arange(start, self.size)
+        self.t[index] = self.now if t is None else t
+        self.last[index] = -1
+        self._schedule(index)
+        return index
+
+    def spawn(self, parent, angle):
+        """Copies des impulsions `parent` partant de leur position actuelle à `angle` ; retourne leurs indices."""
+        start = self.size
+        PulseStore.add(self, self.x[parent], self.y[parent], angle, self.color[parent])
+        index = np.arange(start, self.size)
+        self.t[index] = self.t[parent]
+        self.flags[index] = self.flags[parent] & PASSED
+        self.last[index] = self.last[parent]
+        self._schedule(index)
+        return index
+
+    def positions(self):
+        """Positions (x, y) des impulsions à l'instant courant, pour l'affichage."""
+        elapsed = self.now - self.t
+        return self.x + self.dx * elapsed, self.y + self.dy * elapsed
+
+    def segments(self):
+        x, y = self.positions()
+        return x, y, x + np.cos(self.angle) * LENGTH, y + np.sin(self.angle) * LENGTH
+
+    def _schedule(self, index):
+        """Prochain événement (instant, composant ou EXIT) des impulsions `index`."""
+        x, y, vx, vy = self.x[index], self.y[index], self.dx[index], self.dy[index]
+        tau, event = self.layout.next_event(x, y, vx, vy, self.angle[index], self.flags[index], self.last[index])
+        # À égalité, le composant passe avant la sortie
+        leave = _exit_times(x, y, vx, vy, self.bench.width, self.bench.height)
+        event[leave < tau] = EXIT
+        self.event[index] = event
+        self.t_next[index] = self.t[index] + np.minimum(tau, leave)
+
+    def step(self):
+        """Avance d'une image : traite, dans l'ordre, tous les événements échus."""
+        self.now += 1
+        due = np.flatnonzero(self.t_next <= self.now)
+        while len(due):
+            spawned = self._handle(due)
+            due = np.concatenate((due, spawned))
+            due = due[self.t_next[due] <= self.now]
+        self._compact((self.flags & (ABSORBED | TRANSMITTED)) == 0)
+
+    def _handle(self, due):
+        """Applique l'événement courant des impulsions `due` ; retourne les copies réfléchies créées."""
+        # Chaque rayon est amené au point de son événement, début d'un nouveau segment
+        elapsed = self.t_next[due] - self.t[due]
+        self.x[due] += self.dx[due] * elapsed
+        self.y[due] += self.dy[due] * elapsed
+        self.t[due] = self.t_next[due]
+        event = self.event[due]
+
+        spawned = [np.zeros(0, np.intp)]
+        for k in np.unique(event):
+            hit = due[event == k]
+            if k == EXIT:
+                self.flags[hit] |= TRANSMITTED
+                continue
+            component = self.layout.components[k]
+            self.flags[hit] |= component.flag
+            self.last[hit] = k
+            new = component.interact(self, hit)
+            if new is not None:
+                spawned.append(new)
+
+        ended = (self.flags[due] & (ABSORBED | TRANSMITTED)) != 0
+        self.t_next[due[ended]] = np.inf
+        self._schedule(due[~ended])
+        return np.concatenate(spawned)